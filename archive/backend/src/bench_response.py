@@ -0,0 +1,63 @@
+import timeit
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from src.common.utils.response import Response, StandardResponse
+
+ITEMS = 10_000
+NUMBER = 10
+REPEAT = 5
+
+
+def build_payloads() -> dict[str, dict]:
+    now = datetime.utcnow()
+    agents = [
+        {
+            "agent_id": f"{i:024x}",
+            "username": f"user{i}",
+            "name": f"Name {i}",
+            "bio": "Senior engineer with a passion for distributed systems " * 2,
+            "type": "candidate",
+            "created_at": now.isoformat(),
+        }
+        for i in range(ITEMS)
+    ]
+    conversations = [
+        {
+            "conversation_id": f"{i:024x}",
+            "recruiter_name": "Recruiter",
+            "candidate_name": f"Candidate {i}",
+            "match_score": 7,
+            "decision": "GOOD FIT",
+            "status": "completed",
+            "created_at": now.isoformat(),
+        }
+        for i in range(ITEMS)
+    ]
+    return {
+        "agents": {"items": agents, "next_cursor": None},
+        "conversations": {"items": conversations, "next_cursor": None},
+    }
+
+
+def stdlib_response(data: dict) -> JSONResponse:
+    # The envelope as it was built before responses were rendered with orjson
+    envelope = StandardResponse(success=True, message="Success", data=data)
+    return JSONResponse(content=envelope.model_dump())
+
+
+def best_ms(render) -> float:
+    return min(timeit.repeat(render, number=NUMBER, repeat=REPEAT)) / NUMBER * 1000
+
+
+def main():
+    for label, data in build_payloads().items():
+        if stdlib_response(data).body != Response.success(data=data).body:
+            raise SystemExit(f"{label}: response bodies differ")
+        before = best_ms(lambda: stdlib_response(data))
+        after = best_ms(lambda: Response.success(data=data))
+        print(f"{label}: {before:.1f} ms -> {after:.1f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
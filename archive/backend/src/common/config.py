@@ -1,8 +1,13 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AppSettings(BaseSettings):
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_QUEUE: bool = True
+    LOG_RATE_LIMITS: dict[str, int] = {"world_service": 20}
     PYTHON_ENV: str = "PROD"
     GEMINI_API_KEY: str
     TAVILY_API_KEY: str
@@ -10,8 +15,47 @@ class AppSettings(BaseSettings):
     FAL_KEY: str
     ASSEMBLYAI_API_KEY: str
     MONGODB_URI: str
+    MONGODB_ENSURE_INDEXES: bool = True
+    MONGODB_EXPLAIN_QUERIES: bool = False
+    AGENT_CACHE_SIZE: int = 1024
+    AGENT_CACHE_TTL_SECONDS: float = 60.0
+    AGENT_CACHE_WATCH_CHANGES: bool = False
+    PROMPT_PROFILE_ENCODING: Literal["json", "compact"] = "json"
+    AGENT_IMPORT_CHUNK_SIZE: int = 1000
+    AGENT_IMPORT_WORKERS: int | None = None
+    AGENT_IMPORT_MAX_ERRORS: int = 1000
+    DELETE_BATCH_SIZE: int = 1000
+    WORLD_SUBSCRIBER_QUEUE_SIZE: int = 100
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTERS: list[Literal["memory", "file", "otlp"]] = ["memory"]
+    TRACING_FILE_PATH: str = "traces.ndjson"
+    TRACING_MAX_TRACES: int = 200
+    TRACING_MAX_SPANS_PER_TRACE: int = 5000
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_SLOW_THRESHOLD_SECONDS: float = 0.25
+    PROFILER_ENABLED: bool = False
+    PROFILER_MAX_SECONDS: float = 60.0
+    PROFILER_SAMPLE_INTERVAL_SECONDS: float = 0.005
     GCP_BUCKET_NAME: str
     GCP_SERVICE_ACCOUNT_KEY: str
+    CONVERSATION_RESUME_ON_STARTUP: bool = True
+    CONVERSATION_STALE_SECONDS: int = 120
+    CONVERSATION_RESUME_INTERVAL_SECONDS: int = 60
+    CONVERSATION_HEARTBEAT_SECONDS: int = 30
+    CONVERSATION_MAX_RESUMES: int = 3
+    CONVERSATION_BROKER_SOCKET: str | None = None
+    CONVERSATION_SUBSCRIBER_QUEUE_SIZE: int = 100
+    LLM_MODEL: str = "gemini-2.0-flash"
+    LLM_FALLBACK_MODEL: str | None = "gemini-2.0-flash-lite"
+    LLM_TIMEOUT_SECONDS: float = 20.0
+    LLM_FALLBACK_TIMEOUT_SECONDS: float = 10.0
+    LLM_HEDGE_PERCENTILE: float = 0.95
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 0.5
+    LLM_HEDGE_INITIAL_DELAY_SECONDS: float = 5.0
+    LLM_CONTEXT_CACHE: Literal["off", "local", "provider"] = "off"
+    LLM_CONTEXT_CACHE_TTL_SECONDS: int = 3600
+    LLM_CONTEXT_CACHE_MIN_TOKENS: int = 1024
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
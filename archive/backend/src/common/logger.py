@@ -1,7 +1,10 @@
+import atexit
 import logging
 import logging.config
 import time
+from datetime import datetime, timezone
 
+import orjson
 from colorama import Fore, Style
 from colorama import init as colorama_init
 
@@ -37,25 +40,96 @@ class UvicornLikeFormatter(logging.Formatter):
         return formatted_message
 
 
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "location": f"{record.module}:{record.funcName}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class RateLimitFilter(logging.Filter):
+    # Limits are keyed by logger name or module, warnings and errors always pass
+    def __init__(self, limits: dict[str, int], interval: float = 1.0):
+        super().__init__()
+        self.limits = limits
+        self.interval = interval
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not self.limits:
+            return True
+
+        key = record.name if record.name in self.limits else record.module
+        limit = self.limits.get(key)
+        if limit is None:
+            return True
+
+        start, count = self._windows.get(key, (record.created, 0))
+        if record.created - start >= self.interval:
+            start, count = record.created, 0
+        if count >= limit:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._windows[key] = (start, count + 1)
+
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{record.getMessage()} (+{suppressed} suppressed)"
+            record.args = None
+        return True
+
+
 def setup_logging():
     date_fmt = "%Y-%m-%d %H:%M:%S"
-    formatter = {
-        "format": "%(asctime)s | %(levelname)s | %(module)s:%(funcName)s:%(lineno)d - %(message)s",
-        "datefmt": date_fmt,
-        "()": UvicornLikeFormatter,
+    formatters = {
+        "text": {
+            "format": "%(asctime)s | %(levelname)s | %(module)s:%(funcName)s:%(lineno)d - %(message)s",
+            "datefmt": date_fmt,
+            "()": UvicornLikeFormatter,
+        },
+        "json": {"()": JsonFormatter},
+    }
+    console_handler = {
+        "level": settings.LOG_LEVEL,
+        "class": "logging.StreamHandler",
+        "formatter": settings.LOG_FORMAT,
     }
+    # Records are only enqueued on the calling thread, a listener thread formats
+    # and writes them
+    default_handler = (
+        {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["console"],
+            "respect_handler_level": True,
+        }
+        if settings.LOG_QUEUE
+        else dict(console_handler)
+    )
+    default_handler["filters"] = ["rate_limit"]
+
     logging_config = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "default": formatter,
+        "formatters": formatters,
+        "filters": {
+            "rate_limit": {
+                "()": RateLimitFilter,
+                "limits": settings.LOG_RATE_LIMITS,
+            },
         },
         "handlers": {
-            "default": {
-                "level": settings.LOG_LEVEL,
-                "class": "logging.StreamHandler",
-                "formatter": "default",
-            },
+            "console": console_handler,
+            "default": default_handler,
         },
         "loggers": {
             "": {
@@ -92,6 +166,11 @@ def setup_logging():
     }
     logging.config.dictConfig(logging_config)
 
+    listener = getattr(logging.getHandlerByName("default"), "listener", None)
+    if listener is not None:
+        listener.start()
+        atexit.register(listener.stop)
+
 
 def get_logger():
     return logging.getLogger()
@@ -0,0 +1,79 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DESCENDING
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Newest first, _id breaks ties between documents created in the same millisecond
+KEYSET_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+
+def encode_cursor(doc: dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"created_at": doc["created_at"].isoformat(), "id": str(doc["_id"])}
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["created_at"]), ObjectId(payload["id"])
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def keyset_query(query: dict[str, Any], cursor: str | None) -> dict[str, Any]:
+    if cursor is None:
+        return query
+
+    created_at, object_id = decode_cursor(cursor)
+    after_cursor = {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": object_id}},
+        ]
+    }
+    return {"$and": [query, after_cursor]} if query else after_cursor
+
+
+async def paginate(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    projection: dict[str, Any],
+    serialize: Callable[[dict[str, Any]], dict[str, Any]],
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    docs = (
+        await collection.find(keyset_query(query, cursor), projection)
+        .sort(KEYSET_SORT)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    return {
+        "items": [serialize(doc) for doc in docs],
+        "next_cursor": encode_cursor(docs[-1]) if has_more else None,
+    }
+
+
+async def iterate(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    projection: dict[str, Any],
+    serialize: Callable[[dict[str, Any]], dict[str, Any]],
+    batch_size: int = MAX_PAGE_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    cursor = collection.find(query, projection).sort(KEYSET_SORT).batch_size(batch_size)
+    async for doc in cursor:
+        yield serialize(doc)
@@ -1,10 +1,37 @@
-from typing import Any, Optional
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional
 
+import orjson
+from bson import ObjectId
 from fastapi import Response as FastAPIResponse
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    # orjson handles datetimes and dataclasses natively, ObjectIds go through _default
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
 
 class StandardResponse(BaseModel):
     success: bool = Field(
@@ -19,14 +46,18 @@ class StandardResponse(BaseModel):
 
 
 class Response:
+    # StandardResponse documents the envelope, building it per response would
+    # walk large payloads once more before serialization
     @staticmethod
     def success(
         message: str = "Success",
         data: Optional[Any] = None,
         status_code: int = status.HTTP_200_OK,
     ) -> JSONResponse:
-        response = StandardResponse(success=True, message=message, data=data)
-        return JSONResponse(status_code=status_code, content=response.model_dump())
+        return FastJSONResponse(
+            status_code=status_code,
+            content={"success": True, "message": message, "data": data},
+        )
 
     @staticmethod
     def error(
@@ -34,8 +65,33 @@ class Response:
         data: Optional[Any] = None,
         status_code: int = status.HTTP_400_BAD_REQUEST,
     ) -> JSONResponse:
-        response = StandardResponse(success=False, message=message, data=data)
-        return JSONResponse(status_code=status_code, content=response.model_dump())
+        return FastJSONResponse(
+            status_code=status_code,
+            content={"success": False, "message": message, "data": data},
+        )
+
+    @staticmethod
+    def ndjson(
+        items: AsyncIterator[dict[str, Any]], filename: str | None = None
+    ) -> StreamingResponse:
+        async def lines():
+            async for item in items:
+                yield dumps(item) + b"\n"
+
+        headers = {}
+        if filename:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return StreamingResponse(
+            lines(), media_type="application/x-ndjson", headers=headers
+        )
+
+    @staticmethod
+    def file(content: bytes, media_type: str, filename: str) -> FastAPIResponse:
+        return FastAPIResponse(
+            content=content,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
     @staticmethod
     def no_content(status_code: int = status.HTTP_204_NO_CONTENT) -> FastAPIResponse:
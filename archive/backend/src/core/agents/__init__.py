@@ -1,5 +1,6 @@
 from src.core.agents.candidate_agent import CandidateAgent
 from src.core.agents.orchestrator import ConversationOrchestrator
+from src.core.agents.prompts import compile_prompt, load_system_prompt
 from src.core.agents.recruiter_agent import RecruiterAgent, RecruiterResponse
 
 __all__ = [
@@ -7,4 +8,6 @@ __all__ = [
     "RecruiterAgent",
     "RecruiterResponse",
     "ConversationOrchestrator",
+    "compile_prompt",
+    "load_system_prompt",
 ]
@@ -26,10 +26,25 @@ class ConversationResult:
 
 
 class ConversationOrchestrator:
-    def __init__(self, recruiter: RecruiterAgent, candidate: CandidateAgent):
+    def __init__(
+        self,
+        recruiter: RecruiterAgent,
+        candidate: CandidateAgent,
+        conversation_history: list[dict[str, str]] | None = None,
+        turn_count: int = 0,
+    ):
         self.recruiter = recruiter
         self.candidate = candidate
-        self.conversation_history: list[dict[str, str]] = []
+        self.conversation_history: list[dict[str, str]] = list(
+            conversation_history or []
+        )
+        self.turn_count = turn_count
+
+    def checkpoint(self) -> dict:
+        return {
+            "conversation_history": list(self.conversation_history),
+            "turn_count": self.turn_count,
+        }
 
     def _parse_evaluation(self, evaluation: str) -> tuple[int | None, str | None]:
         score = None
@@ -49,88 +64,74 @@ class ConversationOrchestrator:
 
         return score, decision
 
-    async def run_conversation_stream(
-        self, max_turns: int = 12
-    ) -> AsyncGenerator[ConversationTurn, None]:
-        turn_count = 0
-
-        recruiter_response = await self.recruiter.respond(self.conversation_history)
-
-        if recruiter_response.is_final_response:
-            self.conversation_history.append(
-                {"role": "recruiter", "content": recruiter_response.response}
-            )
-            yield ConversationTurn(
-                role="recruiter",
-                speaker_name=self.recruiter.name,
-                content=recruiter_response.response,
-                timestamp=datetime.utcnow().isoformat(),
-                is_final=True,
-                final_evaluation=recruiter_response.final_evaluation,
-            )
-            return
-
-        self.conversation_history.append(
-            {"role": "recruiter", "content": recruiter_response.response}
-        )
-        yield ConversationTurn(
+    def _recruiter_turn(
+        self, content: str, is_final: bool = False, final_evaluation: str | None = None
+    ) -> ConversationTurn:
+        self.conversation_history.append({"role": "recruiter", "content": content})
+        return ConversationTurn(
             role="recruiter",
             speaker_name=self.recruiter.name,
-            content=recruiter_response.response,
+            content=content,
             timestamp=datetime.utcnow().isoformat(),
+            is_final=is_final,
+            final_evaluation=final_evaluation,
         )
 
-        while turn_count < max_turns:
-            candidate_response = await self.candidate.respond(self.conversation_history)
-            self.conversation_history.append(
-                {"role": "candidate", "content": candidate_response}
-            )
-            yield ConversationTurn(
-                role="candidate",
-                speaker_name=self.candidate.name,
-                content=candidate_response,
-                timestamp=datetime.utcnow().isoformat(),
-            )
-            turn_count += 1
-
+    async def run_conversation_stream(
+        self, max_turns: int = 12
+    ) -> AsyncGenerator[ConversationTurn, None]:
+        # Resumes from conversation_history/turn_count when restored from a checkpoint
+        if not self.conversation_history:
             recruiter_response = await self.recruiter.respond(self.conversation_history)
 
             if recruiter_response.is_final_response:
+                yield self._recruiter_turn(
+                    recruiter_response.response,
+                    is_final=True,
+                    final_evaluation=recruiter_response.final_evaluation,
+                )
+                return
+
+            yield self._recruiter_turn(recruiter_response.response)
+
+        while self.turn_count < max_turns:
+            if self.conversation_history[-1]["role"] != "candidate":
+                candidate_response = await self.candidate.respond(
+                    self.conversation_history
+                )
                 self.conversation_history.append(
-                    {"role": "recruiter", "content": recruiter_response.response}
+                    {"role": "candidate", "content": candidate_response}
                 )
+                self.turn_count += 1
                 yield ConversationTurn(
-                    role="recruiter",
-                    speaker_name=self.recruiter.name,
-                    content=recruiter_response.response,
+                    role="candidate",
+                    speaker_name=self.candidate.name,
+                    content=candidate_response,
                     timestamp=datetime.utcnow().isoformat(),
+                )
+
+            recruiter_response = await self.recruiter.respond(self.conversation_history)
+
+            if recruiter_response.is_final_response:
+                yield self._recruiter_turn(
+                    recruiter_response.response,
                     is_final=True,
                     final_evaluation=recruiter_response.final_evaluation,
                 )
                 return
 
+            yield self._recruiter_turn(recruiter_response.response)
+
+        if self.conversation_history[-1]["role"] != "system":
             self.conversation_history.append(
-                {"role": "recruiter", "content": recruiter_response.response}
+                {
+                    "role": "system",
+                    "content": "Please provide your final evaluation now.",
+                }
             )
-            yield ConversationTurn(
-                role="recruiter",
-                speaker_name=self.recruiter.name,
-                content=recruiter_response.response,
-                timestamp=datetime.utcnow().isoformat(),
-            )
-
-        self.conversation_history.append(
-            {"role": "system", "content": "Please provide your final evaluation now."}
-        )
         final_response = await self.recruiter.respond(self.conversation_history)
-        self.conversation_history.append(
-            {"role": "recruiter", "content": final_response.response}
-        )
-        yield ConversationTurn(
-            role="recruiter",
-            speaker_name=self.recruiter.name,
-            content=final_response.response,
-            timestamp=datetime.utcnow().isoformat(),
+        yield self._recruiter_turn(
+            final_response.response,
             is_final=True,
             final_evaluation=final_response.final_evaluation,
         )
@@ -0,0 +1,167 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+ProfileEncoding = Literal["json", "compact"]
+
+RECRUITER_PROMPT_TEMPLATE = """You are {name}, {bio}
+
+You're at a networking event having a casual conversation with a candidate. Keep it brief, natural, and conversational - like a quick chat at a career fair.
+
+Job Description: {role_description}
+
+Selection Criteria (mentally check off as you learn):
+{criteria_list}
+
+Guidelines:
+- Keep responses SHORT (2-4 sentences max for questions, 1-2 sentences for follow-ups)
+- Ask one question at a time
+- Be friendly but direct - no long explanations
+- After 6-10 exchanges, set is_final_response to true and provide evaluation
+- Final evaluation format:
+  ✓/✗ for each criterion with brief evidence
+  Rating: X/10
+  Decision: GOOD FIT or NOT A FIT with 2-3 sentence reasoning
+
+Keep it natural and brief - this is a quick networking chat, not a formal interview."""
+
+CANDIDATE_PROMPT_TEMPLATE = """You are {full_name} at a networking event.
+
+Your profile:
+{profile_text}
+
+Guidelines:
+- Keep responses SHORT (2-3 sentences max)
+- Be natural and conversational - like talking to someone at a career fair
+- Answer questions directly, reference your actual experience when relevant
+- If you don't have experience with something, briefly say so and mention related skills
+- Don't over-explain or be verbose
+- Stay authentic to your profile above
+
+This is a quick networking chat, not a formal interview. Keep it brief and natural."""
+
+
+def prompt_version(
+    agent_type: str, profile: dict[str, Any], encoding: ProfileEncoding
+) -> str:
+    # Any template, encoding or profile change yields a new version and stale
+    # prompts recompile
+    source = "\0".join(
+        [
+            RECRUITER_PROMPT_TEMPLATE,
+            CANDIDATE_PROMPT_TEMPLATE,
+            encoding,
+            agent_type,
+            json.dumps(profile, sort_keys=True, default=str),
+        ]
+    )
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+def _encode_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return str(value)
+
+
+def _encode_lines(value: Any, indent: int) -> list[str]:
+    pad = "  " * indent
+    if isinstance(value, dict):
+        lines = []
+        for key, item in value.items():
+            if _is_empty(item):
+                continue
+            if _is_scalar(item):
+                lines.append(f"{pad}{key}: {_encode_scalar(item)}")
+            elif isinstance(item, list) and all(
+                _is_scalar(i) and "," not in str(i) for i in item
+            ):
+                joined = ", ".join(_encode_scalar(i) for i in item)
+                lines.append(f"{pad}{key}: {joined}")
+            else:
+                lines.append(f"{pad}{key}:")
+                lines.extend(_encode_lines(item, indent + 1))
+        return lines
+
+    if isinstance(value, list):
+        lines = []
+        for item in value:
+            if _is_empty(item):
+                continue
+            if _is_scalar(item):
+                lines.append(f"{pad}- {_encode_scalar(item)}")
+                continue
+            item_lines = _encode_lines(item, indent + 1)
+            if item_lines:
+                item_lines[0] = f"{pad}- {item_lines[0].lstrip()}"
+                lines.extend(item_lines)
+        return lines
+
+    return [f"{pad}{_encode_scalar(value)}"]
+
+
+def encode_profile(profile: dict[str, Any], encoding: ProfileEncoding) -> str:
+    if encoding == "json":
+        return json.dumps(profile, indent=2)
+    # Indented key/value lines without JSON punctuation, empty fields dropped
+    return "\n".join(_encode_lines(profile, 0))
+
+
+def build_recruiter_system_prompt(profile: dict[str, Any]) -> str:
+    criteria_list = "\n".join(
+        f"{i + 1}. {criterion}"
+        for i, criterion in enumerate(profile["candidate_selection_criteria"])
+    )
+    return RECRUITER_PROMPT_TEMPLATE.format(
+        name=profile["name"],
+        bio=profile["bio"],
+        role_description=profile["role_description"],
+        criteria_list=criteria_list,
+    )
+
+
+def build_candidate_system_prompt(
+    profile: dict[str, Any], encoding: ProfileEncoding = "json"
+) -> str:
+    return CANDIDATE_PROMPT_TEMPLATE.format(
+        full_name=profile["personal_info"]["full_name"],
+        profile_text=encode_profile(profile, encoding),
+    )
+
+
+def compile_prompt(
+    agent_type: str, profile: dict[str, Any], encoding: ProfileEncoding = "json"
+) -> dict[str, Any]:
+    if agent_type == "recruiter":
+        system_prompt = build_recruiter_system_prompt(profile)
+    else:
+        system_prompt = build_candidate_system_prompt(profile, encoding)
+
+    return {
+        "version": prompt_version(agent_type, profile, encoding),
+        "encoding": encoding,
+        "system_prompt": system_prompt,
+        "compiled_at": datetime.now(timezone.utc),
+    }
+
+
+def load_system_prompt(
+    agent_doc: dict[str, Any], encoding: ProfileEncoding = "json"
+) -> tuple[str, bool]:
+    prompt = agent_doc.get("prompt") or {}
+    version = prompt_version(agent_doc["type"], agent_doc["profile"], encoding)
+    if prompt.get("version") == version:
+        return prompt["system_prompt"], False
+
+    compiled = compile_prompt(agent_doc["type"], agent_doc["profile"], encoding)
+    agent_doc["prompt"] = compiled
+    return compiled["system_prompt"], True
@@ -3,6 +3,10 @@ from typing import Any
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import BaseModel, Field
+from src.core.agents.prompts import build_recruiter_system_prompt
+from src.core.llm.hedged_llm import HedgedLLM
+from src.core.tracing.callbacks import langchain_config
+from src.core.tracing.tracer import tracer
 
 
 class RecruiterResponse(BaseModel):
@@ -17,39 +21,18 @@ class RecruiterResponse(BaseModel):
 
 
 class RecruiterAgent:
-    def __init__(self, profile: dict, llm: ChatGoogleGenerativeAI):
+    def __init__(
+        self,
+        profile: dict,
+        llm: ChatGoogleGenerativeAI | HedgedLLM,
+        system_prompt: str | None = None,
+    ):
         self.profile = profile
         self.llm = llm
         self.name = profile["name"]
         self.criteria = profile["candidate_selection_criteria"]
         self.structured_llm = self.llm.with_structured_output(RecruiterResponse)
-        self._build_system_prompt()
-
-    def _build_system_prompt(self):
-        criteria_list = "\n".join(
-            [f"{i + 1}. {criterion}" for i, criterion in enumerate(self.criteria)]
-        )
-
-        self.system_prompt = f"""You are {self.profile["name"]}, {self.profile["bio"]}
-
-You're at a networking event having a casual conversation with a candidate. Keep it brief, natural, and conversational - like a quick chat at a career fair.
-
-Job Description: {self.profile["role_description"]}
-
-Selection Criteria (mentally check off as you learn):
-{criteria_list}
-
-Guidelines:
-- Keep responses SHORT (2-4 sentences max for questions, 1-2 sentences for follow-ups)
-- Ask one question at a time
-- Be friendly but direct - no long explanations
-- After 6-10 exchanges, set is_final_response to true and provide evaluation
-- Final evaluation format:
-  ✓/✗ for each criterion with brief evidence
-  Rating: X/10
-  Decision: GOOD FIT or NOT A FIT with 2-3 sentence reasoning
-
-Keep it natural and brief - this is a quick networking chat, not a formal interview."""
+        self.system_prompt = system_prompt or build_recruiter_system_prompt(profile)
 
     def _build_conversation_context(
         self, conversation_history: list[dict[str, str]]
@@ -66,11 +49,14 @@ Keep it natural and brief - this is a quick networking chat, not a formal interv
     async def respond(
         self, conversation_history: list[dict[str, str]]
     ) -> RecruiterResponse:
-        messages = [SystemMessage(content=self.system_prompt)]
-        context = self._build_conversation_context(conversation_history)
-        messages.append(HumanMessage(content=context + "\n\nYour response:"))
-        response: RecruiterResponse = await self.structured_llm.ainvoke(messages)
-        return response
+        with tracer.span("recruiter.respond", agent=self.name):
+            messages = [SystemMessage(content=self.system_prompt)]
+            context = self._build_conversation_context(conversation_history)
+            messages.append(HumanMessage(content=context + "\n\nYour response:"))
+            response: RecruiterResponse = await self.structured_llm.ainvoke(
+                messages, config=langchain_config()
+            )
+            return response
 
     def _extract_text(self, content: Any) -> str:
         if isinstance(content, list):
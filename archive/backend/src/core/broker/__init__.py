@@ -0,0 +1,13 @@
+from src.core.broker.conversation_broker import (
+    BrokerBackend,
+    ConversationBroker,
+    conversation_broker,
+)
+from src.core.broker.local_socket_backend import LocalSocketBackend
+
+__all__ = [
+    "BrokerBackend",
+    "ConversationBroker",
+    "LocalSocketBackend",
+    "conversation_broker",
+]
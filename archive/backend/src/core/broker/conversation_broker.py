@@ -0,0 +1,145 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Protocol
+
+from src.common.config import settings
+from src.core.broker.local_socket_backend import LocalSocketBackend
+from src.core.metrics.registry import metrics
+
+TERMINAL_EVENT_TYPES = {"complete", "error"}
+
+WEBSOCKET_DROPPED_FRAMES = metrics.counter(
+    "websocket_dropped_frames_total",
+    "Frames dropped because a subscriber fell behind",
+    ("channel",),
+)
+
+
+class BrokerBackend(Protocol):
+    async def start(self, broker: "ConversationBroker") -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def forward(self, conversation_id: str, event: dict[str, Any]) -> None: ...
+
+
+@dataclass
+class _Topic:
+    history: list[dict[str, Any]] = field(default_factory=list)
+    subscribers: set[asyncio.Queue] = field(default_factory=set)
+    closed: bool = False
+
+
+class ConversationBroker:
+    def __init__(
+        self,
+        backend: BrokerBackend | None = None,
+        max_closed_topics: int = 256,
+        subscriber_queue_size: int = 100,
+    ):
+        self.backend = backend
+        self.max_closed_topics = max_closed_topics
+        self.subscriber_queue_size = subscriber_queue_size
+        self._topics: OrderedDict[str, _Topic] = OrderedDict()
+
+    async def start(self):
+        if self.backend:
+            await self.backend.start(self)
+
+    async def stop(self):
+        if self.backend:
+            await self.backend.stop()
+
+    def open(self, conversation_id: str):
+        if conversation_id not in self._topics:
+            self._topics[conversation_id] = _Topic()
+
+    def has_topic(self, conversation_id: str) -> bool:
+        return conversation_id in self._topics
+
+    def is_closed(self, conversation_id: str) -> bool:
+        topic = self._topics.get(conversation_id)
+        return topic is not None and topic.closed
+
+    def subscriber_count(self, conversation_id: str | None = None) -> int:
+        if conversation_id is not None:
+            topic = self._topics.get(conversation_id)
+            return len(topic.subscribers) if topic else 0
+        return sum(len(topic.subscribers) for topic in self._topics.values())
+
+    def queue_depth(self) -> int:
+        return sum(
+            queue.qsize()
+            for topic in self._topics.values()
+            for queue in topic.subscribers
+        )
+
+    async def publish(self, conversation_id: str, event: dict[str, Any]):
+        self.deliver(conversation_id, event)
+        if self.backend:
+            await self.backend.forward(conversation_id, event)
+
+    def deliver(self, conversation_id: str, event: dict[str, Any]):
+        self.open(conversation_id)
+        topic = self._topics[conversation_id]
+        if topic.closed:
+            return
+
+        topic.history.append(event)
+        for queue in topic.subscribers:
+            # A slow client loses its oldest frames, terminal events are never dropped
+            if queue.full():
+                queue.get_nowait()
+                WEBSOCKET_DROPPED_FRAMES.inc(channel="conversation")
+            queue.put_nowait(event)
+
+        if event.get("type") in TERMINAL_EVENT_TYPES:
+            topic.closed = True
+            self._topics.move_to_end(conversation_id)
+            self._evict_closed_topics()
+
+    async def subscribe(
+        self, conversation_id: str, replay: bool = True
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        self.open(conversation_id)
+        topic = self._topics[conversation_id]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+
+        if not replay and topic.closed:
+            return
+
+        # Replayed from a snapshot so history does not count against the queue bound
+        history = list(topic.history) if replay else []
+        topic.subscribers.add(queue)
+        try:
+            for event in history:
+                yield event
+                if event.get("type") in TERMINAL_EVENT_TYPES:
+                    return
+            while True:
+                event = await queue.get()
+                yield event
+                if event.get("type") in TERMINAL_EVENT_TYPES:
+                    return
+        finally:
+            topic.subscribers.discard(queue)
+
+    def _evict_closed_topics(self):
+        closed = [
+            conversation_id
+            for conversation_id, topic in self._topics.items()
+            if topic.closed and not topic.subscribers
+        ]
+        for conversation_id in closed[: max(0, len(closed) - self.max_closed_topics)]:
+            del self._topics[conversation_id]
+
+
+conversation_broker = ConversationBroker(
+    backend=(
+        LocalSocketBackend(settings.CONVERSATION_BROKER_SOCKET)
+        if settings.CONVERSATION_BROKER_SOCKET
+        else None
+    ),
+    subscriber_queue_size=settings.CONVERSATION_SUBSCRIBER_QUEUE_SIZE,
+)
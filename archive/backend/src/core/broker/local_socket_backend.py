@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+from src.common.logger import logger
+
+if TYPE_CHECKING:
+    from src.core.broker.conversation_broker import ConversationBroker
+
+
+class LocalSocketBackend:
+    def __init__(self, path: str):
+        self.path = path
+        self._broker: "ConversationBroker | None" = None
+        self._server: asyncio.AbstractServer | None = None
+        self._peers: set[asyncio.StreamWriter] = set()
+        self._upstream: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+
+    async def start(self, broker: "ConversationBroker") -> None:
+        self._broker = broker
+
+        # The first process to start becomes the hub, later ones connect to it
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = await asyncio.start_unix_server(self._handle_peer, self.path)
+            logger.info(f"Conversation broker hub listening on {self.path}")
+            return
+
+        self._upstream = writer
+        self._reader_task = asyncio.create_task(self._read_events(reader))
+        logger.info(f"Conversation broker connected to hub at {self.path}")
+
+    async def stop(self) -> None:
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        writers = list(self._peers)
+        if self._upstream:
+            writers.append(self._upstream)
+        for writer in writers:
+            writer.close()
+        self._peers.clear()
+        self._upstream = None
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def forward(self, conversation_id: str, event: dict[str, Any]) -> None:
+        line = self._encode(conversation_id, event)
+        if self._upstream:
+            await self._write(self._upstream, line)
+        else:
+            await self._broadcast(line)
+
+    async def _handle_peer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self._peers.add(writer)
+        try:
+            while line := await reader.readline():
+                self._deliver(line)
+                await self._broadcast(line, exclude=writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    async def _read_events(self, reader: asyncio.StreamReader):
+        try:
+            while line := await reader.readline():
+                self._deliver(line)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        logger.warning(f"Conversation broker lost connection to hub at {self.path}")
+        self._upstream = None
+
+    async def _broadcast(
+        self, line: bytes, exclude: asyncio.StreamWriter | None = None
+    ):
+        for writer in list(self._peers):
+            if writer is not exclude:
+                await self._write(writer, line)
+
+    async def _write(self, writer: asyncio.StreamWriter, line: bytes):
+        try:
+            writer.write(line)
+            await writer.drain()
+        except ConnectionError:
+            self._peers.discard(writer)
+            writer.close()
+
+    def _deliver(self, line: bytes):
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Dropped malformed conversation broker message")
+            return
+        if self._broker:
+            self._broker.deliver(message["conversation_id"], message["event"])
+
+    def _encode(self, conversation_id: str, event: dict[str, Any]) -> bytes:
+        payload = {"conversation_id": conversation_id, "event": event}
+        return (json.dumps(payload) + "\n").encode()
@@ -0,0 +1,9 @@
+from src.core.cache.agent_cache import AgentCache, agent_cache
+from src.core.cache.async_lru_cache import AsyncLRUCache, CacheStats
+
+__all__ = [
+    "AgentCache",
+    "AsyncLRUCache",
+    "CacheStats",
+    "agent_cache",
+]
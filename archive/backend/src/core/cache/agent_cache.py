@@ -0,0 +1,111 @@
+import asyncio
+import copy
+from typing import Any
+
+from bson import ObjectId
+from pymongo.errors import OperationFailure, PyMongoError
+from src.common.config import settings
+from src.common.logger import logger
+from src.core.cache.async_lru_cache import AsyncLRUCache
+from src.core.metrics.registry import metrics
+from src.database.mongodb.mongodb_client import MongoDBClient, mongodb_client
+
+CHANGE_STREAM_PIPELINE = [
+    {"$match": {"operationType": {"$in": ["update", "replace", "delete"]}}}
+]
+# Raised by servers that are not part of a replica set
+CHANGE_STREAM_UNSUPPORTED = 40573
+
+AGENT_CACHE_LOOKUPS = metrics.counter(
+    "agent_cache_lookups_total", "Agent cache lookups by result", ("result",)
+)
+
+
+class AgentCache:
+    def __init__(
+        self,
+        mongodb_client: MongoDBClient,
+        maxsize: int = 1024,
+        ttl: float | None = 60.0,
+        watch_changes: bool = False,
+    ):
+        self.mongodb_client = mongodb_client
+        self.cache: AsyncLRUCache[dict[str, Any]] = AsyncLRUCache(maxsize, ttl)
+        self.watch_changes = watch_changes
+        self._watch_task: asyncio.Task | None = None
+        self._register_metrics()
+
+    def _register_metrics(self):
+        stats = self.cache.stats
+        AGENT_CACHE_LOOKUPS.add_collector(
+            "agent_cache",
+            lambda: {
+                ("hit",): stats.hits,
+                ("miss",): stats.misses,
+                ("coalesced",): stats.coalesced,
+            },
+        )
+
+    async def start(self):
+        if self.watch_changes and self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        self.cache.clear()
+
+    async def get(self, agent_id: str) -> dict[str, Any] | None:
+        object_id = ObjectId(agent_id)
+        agent = await self.cache.get_or_load(
+            agent_id, lambda: self.mongodb_client.agents.find_one({"_id": object_id})
+        )
+        # Callers get their own copy so nobody can mutate the cached document
+        return copy.deepcopy(agent)
+
+    def invalidate(self, agent_id: str):
+        self.cache.invalidate(agent_id)
+
+    def clear(self):
+        self.cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self.cache.get_stats(),
+            "watching_changes": self._watch_task is not None
+            and not self._watch_task.done(),
+        }
+
+    async def _watch(self):
+        agents = self.mongodb_client.agents
+        while True:
+            try:
+                async with agents.watch(CHANGE_STREAM_PIPELINE) as stream:
+                    logger.info("Watching agent changes for cache invalidation")
+                    async for change in stream:
+                        self.invalidate(str(change["documentKey"]["_id"]))
+            except PyMongoError as e:
+                if (
+                    isinstance(e, OperationFailure)
+                    and e.code == CHANGE_STREAM_UNSUPPORTED
+                ):
+                    # Explicit invalidation in AgentService still covers this process
+                    logger.warning(f"Agent change stream unavailable: {e}")
+                    return
+                logger.warning(f"Agent change stream stopped: {e}")
+                # Whatever changed while the stream was down is unknown now
+                self.cache.clear()
+                await asyncio.sleep(5.0)
+
+
+agent_cache = AgentCache(
+    mongodb_client,
+    maxsize=settings.AGENT_CACHE_SIZE,
+    ttl=settings.AGENT_CACHE_TTL_SECONDS,
+    watch_changes=settings.AGENT_CACHE_WATCH_CHANGES,
+)
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    loads: int = 0
+    load_failures: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+
+class AsyncLRUCache(Generic[V]):
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, V | None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: Hashable, value: V):
+        expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[V | None]]
+    ) -> V | None:
+        found, value = self._lookup(key)
+        if found:
+            self.stats.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = asyncio.create_task(self._load(key, loader))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+
+        # A cancelled caller must not cancel the load other callers are waiting on
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: Hashable, loader: Callable[[], Awaitable[V | None]]
+    ) -> V | None:
+        task = asyncio.current_task()
+        self.stats.loads += 1
+        try:
+            value = await loader()
+        except Exception:
+            self.stats.load_failures += 1
+            raise
+        finally:
+            # Invalidation detaches the load, it may already be stale
+            current = self._inflight.get(key) is task
+            if current:
+                del self._inflight[key]
+
+        if value is not None and current:
+            self._store(key, value)
+        return value
+
+    def invalidate(self, key: Hashable):
+        self.stats.invalidations += 1
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._inflight.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **asdict(self.stats),
+            "hit_rate": self.stats.hit_rate,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
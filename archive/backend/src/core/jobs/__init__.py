@@ -0,0 +1,7 @@
+from src.core.jobs.job_registry import Job, JobRegistry, job_registry
+
+__all__ = [
+    "Job",
+    "JobRegistry",
+    "job_registry",
+]
@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from src.common.logger import logger
+
+
+@dataclass
+class Job:
+    job_id: str
+    kind: str
+    params: dict[str, Any]
+    status: str = "pending"
+    progress: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+
+    def advance(self, key: str, count: int):
+        self.progress[key] = self.progress.get(key, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": (self.finished_at.isoformat() if self.finished_at else None),
+        }
+
+
+class JobRegistry:
+    def __init__(self, max_finished: int = 100):
+        self.max_finished = max_finished
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def start(
+        self,
+        kind: str,
+        run: Callable[[Job], Awaitable[None]],
+        params: dict[str, Any] | None = None,
+    ) -> Job:
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, params=params or {})
+        self.jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, run))
+        self._prune()
+        return job
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[None]]):
+        job.status = "running"
+        try:
+            await run(job)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"Job {job.kind} {job.job_id} failed: {e}")
+        finally:
+            job.finished_at = datetime.utcnow()
+            self._tasks.pop(job.job_id, None)
+            logger.info(f"Job {job.kind} {job.job_id} {job.status}: {job.progress}")
+
+    def _prune(self):
+        finished = [job_id for job_id in self.jobs if job_id not in self._tasks]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def list(self) -> list[Job]:
+        return list(reversed(self.jobs.values()))
+
+    async def stop(self):
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+job_registry = JobRegistry()
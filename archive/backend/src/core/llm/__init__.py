@@ -0,0 +1,23 @@
+from src.core.llm.context_cache import (
+    CacheHandle,
+    ContextCache,
+    ContextCachedLLM,
+    GeminiContextCacheBackend,
+    LocalContextCacheBackend,
+    context_cache,
+    current_conversation_id,
+)
+from src.core.llm.hedged_llm import HedgedLLM, HedgeStats, LatencyTracker
+
+__all__ = [
+    "CacheHandle",
+    "ContextCache",
+    "ContextCachedLLM",
+    "GeminiContextCacheBackend",
+    "LocalContextCacheBackend",
+    "context_cache",
+    "current_conversation_id",
+    "HedgedLLM",
+    "HedgeStats",
+    "LatencyTracker",
+]
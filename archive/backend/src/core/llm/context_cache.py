@@ -0,0 +1,279 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
+
+from langchain_core.messages import BaseMessage, SystemMessage
+from src.common.config import settings
+from src.common.logger import logger
+
+# Conversation the current LLM call belongs to, set by the task producing it
+current_conversation_id: ContextVar[str | None] = ContextVar(
+    "current_conversation_id", default=None
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def message_text(message: BaseMessage) -> str:
+    if isinstance(message.content, str):
+        return message.content
+    return " ".join(
+        part["text"] if isinstance(part, dict) else str(part)
+        for part in message.content
+        if not isinstance(part, dict) or "text" in part
+    )
+
+
+@dataclass
+class CacheHandle:
+    name: str
+    model: str
+    token_count: int
+    expires_at: float
+    provider_side: bool
+
+
+@dataclass
+class CacheUsage:
+    calls: int = 0
+    cached_calls: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def cached_token_ratio(self) -> float:
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def record(self, input_tokens: int, cached_tokens: int):
+        self.calls += 1
+        self.cached_calls += 1 if cached_tokens else 0
+        self.input_tokens += input_tokens
+        self.cached_tokens += cached_tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "cached_token_ratio": self.cached_token_ratio}
+
+
+class ContextCacheBackend(Protocol):
+    async def create(self, model: str, system_prompt: str, ttl: int) -> CacheHandle: ...
+
+    async def delete(self, name: str) -> None: ...
+
+
+class LocalContextCacheBackend:
+    # Stand-in that accounts for cached prefixes without calling the provider
+    def __init__(self):
+        self.entries: dict[str, str] = {}
+
+    async def create(self, model: str, system_prompt: str, ttl: int) -> CacheHandle:
+        digest = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
+        name = f"local/{model}/{digest}"
+        self.entries[name] = system_prompt
+        return CacheHandle(
+            name=name,
+            model=model,
+            token_count=estimate_tokens(system_prompt),
+            expires_at=time.monotonic() + ttl,
+            provider_side=False,
+        )
+
+    async def delete(self, name: str) -> None:
+        self.entries.pop(name, None)
+
+
+class GeminiContextCacheBackend:
+    def __init__(self, api_key: str):
+        from google import genai
+
+        self.client = genai.Client(api_key=api_key)
+
+    async def create(self, model: str, system_prompt: str, ttl: int) -> CacheHandle:
+        from google.genai import types
+
+        cached = await self.client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_prompt, ttl=f"{ttl}s"
+            ),
+        )
+        usage = cached.usage_metadata
+        return CacheHandle(
+            name=cached.name,
+            model=model,
+            token_count=(
+                usage.total_token_count
+                if usage and usage.total_token_count
+                else estimate_tokens(system_prompt)
+            ),
+            expires_at=time.monotonic() + ttl,
+            provider_side=True,
+        )
+
+    async def delete(self, name: str) -> None:
+        await self.client.aio.caches.delete(name=name)
+
+
+class ContextCache:
+    def __init__(
+        self,
+        backend: ContextCacheBackend,
+        ttl: int = 3600,
+        min_tokens: int = 1024,
+        refresh_margin: float = 60.0,
+        failure_backoff: float = 300.0,
+        max_tracked_conversations: int = 1024,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.min_tokens = min_tokens
+        self.refresh_margin = refresh_margin
+        self.failure_backoff = failure_backoff
+        self.max_tracked_conversations = max_tracked_conversations
+        self.usage = CacheUsage()
+        self.handles_created = 0
+        self.create_failures = 0
+        self._handles: dict[tuple[str, str], CacheHandle] = {}
+        self._failed_until: dict[tuple[str, str], float] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+        self._conversations: OrderedDict[str, CacheUsage] = OrderedDict()
+
+    async def get_handle(self, model: str, system_prompt: str) -> CacheHandle | None:
+        if estimate_tokens(system_prompt) < self.min_tokens:
+            return None
+
+        key = (model, hashlib.sha256(system_prompt.encode()).hexdigest())
+        handle = self._handles.get(key)
+        if handle and handle.expires_at - time.monotonic() > self.refresh_margin:
+            return handle
+        if self._failed_until.get(key, 0.0) > time.monotonic():
+            return None
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._create(key, model, system_prompt))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _create(
+        self, key: tuple[str, str], model: str, system_prompt: str
+    ) -> CacheHandle | None:
+        try:
+            handle = await self.backend.create(model, system_prompt, self.ttl)
+        except Exception as e:
+            self.create_failures += 1
+            self._failed_until[key] = time.monotonic() + self.failure_backoff
+            logger.warning(f"Context cache creation for {model} failed: {e}")
+            return None
+        finally:
+            self._inflight.pop(key, None)
+
+        self.handles_created += 1
+        self._handles[key] = handle
+        return handle
+
+    def invalidate(self, handle: CacheHandle):
+        for key, cached in list(self._handles.items()):
+            if cached.name == handle.name:
+                del self._handles[key]
+
+    def record(self, input_tokens: int, cached_tokens: int):
+        self.usage.record(input_tokens, cached_tokens)
+
+        conversation_id = current_conversation_id.get()
+        if conversation_id is None:
+            return
+        usage = self._conversations.get(conversation_id)
+        if usage is None:
+            usage = self._conversations[conversation_id] = CacheUsage()
+            while len(self._conversations) > self.max_tracked_conversations:
+                self._conversations.popitem(last=False)
+        usage.record(input_tokens, cached_tokens)
+
+    def conversation_usage(self, conversation_id: str) -> dict[str, Any] | None:
+        usage = self._conversations.get(conversation_id)
+        return usage.to_dict() if usage else None
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "handles": len(self._handles),
+            "handles_created": self.handles_created,
+            "create_failures": self.create_failures,
+            **self.usage.to_dict(),
+        }
+
+
+class ContextCachedLLM:
+    def __init__(self, llm: Any, context_cache: ContextCache, model: str):
+        self.llm = llm
+        self.context_cache = context_cache
+        self.model = model
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "ContextCachedLLM":
+        return ContextCachedLLM(
+            self.llm.with_structured_output(schema, **kwargs),
+            self.context_cache,
+            self.model,
+        )
+
+    async def ainvoke(self, messages: Any, **kwargs: Any) -> Any:
+        if not messages or not isinstance(messages[0], SystemMessage):
+            return await self.llm.ainvoke(messages, **kwargs)
+
+        system_prompt = message_text(messages[0])
+        prefix_tokens = estimate_tokens(system_prompt)
+        suffix_tokens = sum(estimate_tokens(message_text(m)) for m in messages[1:])
+
+        handle = await self.context_cache.get_handle(self.model, system_prompt)
+        if handle is None:
+            result = await self.llm.ainvoke(messages, **kwargs)
+            self.context_cache.record(prefix_tokens + suffix_tokens, 0)
+            return result
+
+        if handle.provider_side:
+            try:
+                # The cached content carries the system instruction
+                result = await self.llm.ainvoke(
+                    messages[1:], cached_content=handle.name, **kwargs
+                )
+            except Exception as e:
+                logger.warning(f"Cached context {handle.name} rejected, resending: {e}")
+                self.context_cache.invalidate(handle)
+                result = await self.llm.ainvoke(messages, **kwargs)
+                self.context_cache.record(prefix_tokens + suffix_tokens, 0)
+                return result
+        else:
+            result = await self.llm.ainvoke(messages, **kwargs)
+
+        self.context_cache.record(
+            handle.token_count + suffix_tokens, handle.token_count
+        )
+        return result
+
+
+def _create_context_cache() -> ContextCache | None:
+    if settings.LLM_CONTEXT_CACHE == "off":
+        return None
+
+    if settings.LLM_CONTEXT_CACHE == "provider":
+        backend: ContextCacheBackend = GeminiContextCacheBackend(
+            settings.GEMINI_API_KEY
+        )
+    else:
+        backend = LocalContextCacheBackend()
+
+    return ContextCache(
+        backend,
+        ttl=settings.LLM_CONTEXT_CACHE_TTL_SECONDS,
+        min_tokens=settings.LLM_CONTEXT_CACHE_MIN_TOKENS,
+    )
+
+
+context_cache = _create_context_cache()
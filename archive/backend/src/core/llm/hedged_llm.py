@@ -0,0 +1,258 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel
+from src.common.logger import logger
+from src.core.llm.context_cache import estimate_tokens, message_text
+from src.core.metrics.registry import metrics
+
+LLM_CALL_DURATION = metrics.histogram(
+    "llm_call_duration_seconds",
+    "End-to-end LLM call latency including hedging and fallback",
+    ("role", "outcome"),
+)
+LLM_TOKENS = metrics.counter(
+    "llm_tokens_total",
+    "LLM tokens by role, from provider usage metadata or estimated from text",
+    ("role", "direction"),
+)
+LLM_HEDGE_EVENTS = metrics.counter(
+    "llm_hedge_events_total",
+    "Hedged requests, hedge wins, timeouts, failures and fallbacks by role",
+    ("role", "event"),
+)
+
+
+def _count_tokens(messages: Any, result: Any) -> tuple[int, int]:
+    usage = getattr(result, "usage_metadata", None)
+    if usage:
+        return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+    if isinstance(messages, str):
+        input_text = messages
+    else:
+        input_text = "".join(
+            message_text(m) if isinstance(m, BaseMessage) else str(m) for m in messages
+        )
+
+    if isinstance(result, BaseModel):
+        output_text = result.model_dump_json()
+    else:
+        output_text = str(getattr(result, "content", result))
+    return estimate_tokens(input_text), estimate_tokens(output_text)
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 500):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def samples(self) -> list[float]:
+        return list(self._samples)
+
+    def percentile(self, p: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(p * len(ordered)) - 1))
+        return ordered[index]
+
+
+@dataclass
+class HedgeStats:
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    fallbacks: int = 0
+    fallback_failures: int = 0
+
+
+class HedgedLLM:
+    def __init__(
+        self,
+        primary: Any,
+        fallback: Any | None = None,
+        *,
+        name: str = "llm",
+        timeout: float = 20.0,
+        fallback_timeout: float = 10.0,
+        hedge_percentile: float = 0.95,
+        hedge_min_delay: float = 0.5,
+        hedge_initial_delay: float = 5.0,
+        min_samples: int = 20,
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = name
+        self.timeout = timeout
+        self.fallback_timeout = fallback_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_initial_delay = hedge_initial_delay
+        self.min_samples = min_samples
+        self.latency = LatencyTracker()
+        self.stats = HedgeStats()
+        self._structured: dict[Any, "HedgedLLM"] = {}
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "HedgedLLM":
+        # Cached so every agent built for this role shares one latency history
+        if schema not in self._structured:
+            self._structured[schema] = HedgedLLM(
+                self.primary.with_structured_output(schema, **kwargs),
+                (
+                    self.fallback.with_structured_output(schema, **kwargs)
+                    if self.fallback is not None
+                    else None
+                ),
+                name=self.name,
+                timeout=self.timeout,
+                fallback_timeout=self.fallback_timeout,
+                hedge_percentile=self.hedge_percentile,
+                hedge_min_delay=self.hedge_min_delay,
+                hedge_initial_delay=self.hedge_initial_delay,
+                min_samples=self.min_samples,
+            )
+        return self._structured[schema]
+
+    def _hedge_delay(self) -> float:
+        if len(self.latency) < self.min_samples:
+            delay = self.hedge_initial_delay
+        else:
+            delay = max(
+                self.hedge_min_delay, self.latency.percentile(self.hedge_percentile)
+            )
+        # Leave the hedge time to finish even when the tail is close to the deadline
+        return min(delay, self.timeout / 2)
+
+    def _record(self, event: str):
+        setattr(self.stats, event, getattr(self.stats, event) + 1)
+        LLM_HEDGE_EVENTS.inc(role=self.name, event=event)
+
+    async def ainvoke(self, messages: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await self._ainvoke(messages, **kwargs)
+            outcome = "ok"
+        finally:
+            LLM_CALL_DURATION.observe(
+                time.perf_counter() - started, role=self.name, outcome=outcome
+            )
+
+        input_tokens, output_tokens = _count_tokens(messages, result)
+        LLM_TOKENS.inc(input_tokens, role=self.name, direction="input")
+        LLM_TOKENS.inc(output_tokens, role=self.name, direction="output")
+        return result
+
+    async def _ainvoke(self, messages: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        self.stats.calls += 1
+        started = loop.time()
+        deadline = started + self.timeout
+        hedge_at = started + self._hedge_delay()
+
+        primary_task = asyncio.create_task(self.primary.ainvoke(messages, **kwargs))
+        hedge_task: asyncio.Task | None = None
+        tasks: set[asyncio.Task] = {primary_task}
+        last_error: BaseException | None = None
+
+        try:
+            while tasks:
+                now = loop.time()
+                if now >= deadline:
+                    break
+
+                wake_at = (
+                    deadline if hedge_task is not None else min(hedge_at, deadline)
+                )
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=max(0.0, wake_at - now),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        self.latency.record(loop.time() - started)
+                        if task is hedge_task:
+                            self._record("hedge_wins")
+                        return task.result()
+                    last_error = task.exception()
+
+                should_hedge = not done and loop.time() >= hedge_at
+                if hedge_task is None and (should_hedge or last_error is not None):
+                    self._record("hedged")
+                    hedge_task = asyncio.create_task(
+                        self.primary.ainvoke(messages, **kwargs)
+                    )
+                    tasks.add(hedge_task)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if tasks or loop.time() >= deadline:
+            # Not a latency sample, it would drag the hedge delay up to the timeout
+            self._record("timeouts")
+            reason = f"timed out after {self.timeout:.1f}s"
+        else:
+            self._record("failures")
+            reason = f"failed: {last_error}"
+
+        if self.fallback is None:
+            if last_error is not None and not tasks:
+                raise last_error
+            raise TimeoutError(f"LLM call for {self.name} {reason}")
+
+        logger.warning(f"LLM call for {self.name} {reason}, using fallback model")
+        self._record("fallbacks")
+        try:
+            return await asyncio.wait_for(
+                self.fallback.ainvoke(messages, **kwargs), self.fallback_timeout
+            )
+        except Exception:
+            self._record("fallback_failures")
+            raise
+
+    def get_stats(self) -> dict[str, Any]:
+        calls = [self, *self._structured.values()]
+        stats = HedgeStats()
+        for llm in calls:
+            for field_name in stats.__dataclass_fields__:
+                setattr(
+                    stats,
+                    field_name,
+                    getattr(stats, field_name) + getattr(llm.stats, field_name),
+                )
+
+        latency = LatencyTracker()
+        for llm in calls:
+            for sample in llm.latency.samples():
+                latency.record(sample)
+
+        return {
+            "name": self.name,
+            "calls": stats.calls,
+            "hedged": stats.hedged,
+            "hedge_rate": stats.hedged / stats.calls if stats.calls else 0.0,
+            "hedge_wins": stats.hedge_wins,
+            "timeouts": stats.timeouts,
+            "failures": stats.failures,
+            "fallbacks": stats.fallbacks,
+            "fallback_failures": stats.fallback_failures,
+            "latency_p50": latency.percentile(0.50),
+            "latency_p95": latency.percentile(0.95),
+            "latency_p99": latency.percentile(0.99),
+        }
@@ -0,0 +1,23 @@
+from src.core.metrics.loop_monitor import LoopMonitor, StallSample, loop_monitor
+from src.core.metrics.profiler import ProfileFormat, Profiler, profiler
+from src.core.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    metrics,
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LoopMonitor",
+    "MetricsRegistry",
+    "ProfileFormat",
+    "Profiler",
+    "StallSample",
+    "loop_monitor",
+    "metrics",
+    "profiler",
+]
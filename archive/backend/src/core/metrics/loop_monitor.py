@@ -0,0 +1,177 @@
+import asyncio
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from types import FrameType
+from typing import Any
+
+from src.common.config import settings
+from src.common.logger import logger
+from src.core.metrics.registry import metrics
+
+EVENT_LOOP_LAG = metrics.histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled loop probe and when it actually ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+EVENT_LOOP_STALLS = metrics.counter(
+    "event_loop_stalls_total",
+    "Loop stalls longer than the slow callback threshold",
+    ("source",),
+)
+
+# Innermost match wins, so a world tick that is sending to a socket counts as the send
+ATTRIBUTED_FUNCTIONS = {
+    "state_callback": "world_websocket",
+    "world_websocket": "world_websocket",
+    "conversation_websocket": "conversation_websocket",
+    "_update_loop": "world_tick",
+    "_produce_conversation": "conversation",
+    "run_conversation_stream": "conversation",
+}
+MAX_STACK_DEPTH = 30
+
+
+@dataclass
+class StallSample:
+    source: str
+    started_at: float
+    blocked_seconds: float
+    function: str
+    stack: list[str] = field(default_factory=list)
+
+
+def _attribute(frame: FrameType | None) -> tuple[str, str]:
+    innermost = frame.f_code.co_name if frame else "unknown"
+    while frame is not None:
+        source = ATTRIBUTED_FUNCTIONS.get(frame.f_code.co_name)
+        if source:
+            return source, innermost
+        frame = frame.f_back
+    return "other", innermost
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        interval: float = 0.1,
+        slow_threshold: float = 0.25,
+        max_samples: int = 50,
+    ):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.lags: deque[float] = deque(maxlen=600)
+        self.max_lag = 0.0
+        self.samples: deque[StallSample] = deque(maxlen=max_samples)
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._pending: StallSample | None = None
+        self._sampled_heartbeat: float | None = None
+        self._probe_task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self):
+        if self._probe_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._probe_task = asyncio.create_task(self._probe())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self):
+        self._stopped.set()
+        if self._probe_task:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _probe(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            previous, self._heartbeat = self._heartbeat, now
+            # Measured from the last wake up, so time before this task ran counts too
+            lag = max(0.0, now - previous - self.interval)
+
+            self.lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            EVENT_LOOP_LAG.observe(lag)
+
+            sample, self._pending = self._pending, None
+            # The watchdog saw this stall while it was happening
+            if sample is not None and self._sampled_heartbeat == previous:
+                sample.blocked_seconds = lag
+                logger.warning(
+                    f"Event loop blocked for {sample.blocked_seconds:.3f}s "
+                    f"in {sample.source} ({sample.function})"
+                )
+
+    def _watch(self):
+        while not self._stopped.wait(self.slow_threshold / 2):
+            heartbeat = self._heartbeat
+            # The probe is due once per interval, anything past that is a stall
+            blocked = time.monotonic() - heartbeat - self.interval
+            if blocked < self.slow_threshold or self._pending is not None:
+                continue
+            if self._sampled_heartbeat == heartbeat:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            source, function = _attribute(frame)
+            sample = StallSample(
+                source=source,
+                started_at=time.time() - blocked,
+                blocked_seconds=blocked,
+                function=function,
+                stack=traceback.format_stack(frame, limit=MAX_STACK_DEPTH)
+                if frame
+                else [],
+            )
+            self.samples.append(sample)
+            self._sampled_heartbeat = heartbeat
+            self._pending = sample
+            EVENT_LOOP_STALLS.inc(source=source)
+
+    def lag_percentile(self, p: float) -> float | None:
+        if not self.lags:
+            return None
+        ordered = sorted(self.lags)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(p * len(ordered)) - 1))]
+
+    def get_stats(self) -> dict[str, Any]:
+        samples = list(self.samples)
+        by_source: dict[str, int] = {}
+        for sample in samples:
+            by_source[sample.source] = by_source.get(sample.source, 0) + 1
+
+        return {
+            "running": self._probe_task is not None,
+            "interval": self.interval,
+            "slow_threshold": self.slow_threshold,
+            "lag_p50": self.lag_percentile(0.50),
+            "lag_p99": self.lag_percentile(0.99),
+            "lag_max": self.max_lag,
+            "stalls_by_source": by_source,
+            "stalls": [asdict(sample) for sample in reversed(samples)],
+        }
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+    slow_threshold=settings.LOOP_MONITOR_SLOW_THRESHOLD_SECONDS,
+)
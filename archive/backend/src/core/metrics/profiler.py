@@ -0,0 +1,105 @@
+import asyncio
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Literal
+
+from src.common.config import settings
+
+ProfileFormat = Literal["collapsed", "pstats"]
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _collapse(frame: FrameType, prefix: str | None = None) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    if prefix:
+        labels.append(prefix)
+    return ";".join(reversed(labels))
+
+
+class Profiler:
+    def __init__(self, interval: float = 0.005, max_seconds: float = 60.0):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def profile(
+        self, seconds: float, format: ProfileFormat, all_threads: bool = False
+    ) -> bytes:
+        if not 0 < seconds <= self.max_seconds:
+            raise ValueError(f"seconds must be between 0 and {self.max_seconds}")
+        if self._running:
+            raise RuntimeError("A profile is already running")
+
+        self._running = True
+        try:
+            if format == "pstats":
+                return await self._profile_calls(seconds)
+            # Sampling from another thread keeps the loop itself untouched
+            return await asyncio.to_thread(
+                self._sample, threading.get_ident(), seconds, all_threads
+            )
+        finally:
+            self._running = False
+
+    async def _profile_calls(self, seconds: float) -> bytes:
+        # cProfile hooks the calling thread only, which is the event loop
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile.disable()
+        profile.create_stats()
+        return marshal.dumps(profile.stats)
+
+    def _sample(self, loop_thread_id: int, seconds: float, all_threads: bool) -> bytes:
+        stacks: Counter[str] = Counter()
+        own_id = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        # Otherwise the loop only hands over the GIL at select() and short
+        # callbacks never show up in the samples
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval / 5))
+        try:
+            while time.monotonic() < deadline:
+                frames = sys._current_frames()
+                if all_threads:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                    for thread_id, frame in frames.items():
+                        if thread_id != own_id:
+                            name = names.get(thread_id, str(thread_id))
+                            stacks[_collapse(frame, name)] += 1
+                elif loop_thread_id in frames:
+                    stacks[_collapse(frames[loop_thread_id])] += 1
+                del frames
+                time.sleep(self.interval)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        return "".join(
+            f"{stack} {count}\n" for stack, count in stacks.most_common()
+        ).encode()
+
+
+profiler = Profiler(
+    interval=settings.PROFILER_SAMPLE_INTERVAL_SECONDS,
+    max_seconds=settings.PROFILER_MAX_SECONDS,
+)
@@ -0,0 +1,20 @@
+from src.core.tracing.callbacks import TracingCallbackHandler, langchain_config
+from src.core.tracing.exporters import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    OpenTelemetrySpanExporter,
+)
+from src.core.tracing.span import Span, SpanExporter
+from src.core.tracing.tracer import Tracer, tracer
+
+__all__ = [
+    "FileSpanExporter",
+    "InMemorySpanExporter",
+    "OpenTelemetrySpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "TracingCallbackHandler",
+    "langchain_config",
+    "tracer",
+]
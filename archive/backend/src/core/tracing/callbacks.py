@@ -0,0 +1,65 @@
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from src.core.tracing.span import Span
+from src.core.tracing.tracer import Tracer, tracer
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    # Splits a structured LLM call into the model request and the output parser
+    run_inline = True
+
+    def __init__(self, parent: Span, tracer: Tracer = tracer):
+        self.parent = parent
+        self.tracer = tracer
+        self._spans: dict[UUID, Span | None] = {}
+
+    def _start(self, run_id: UUID, name: str, **attributes: Any):
+        self._spans[run_id] = self.tracer.start_span(
+            name, parent=self.parent, **attributes
+        )
+
+    def _end(self, run_id: UUID, error: BaseException | None = None):
+        if run_id in self._spans:
+            self.tracer.end_span(self._spans.pop(run_id), error)
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any
+    ):
+        params = kwargs.get("invocation_params") or {}
+        self._start(run_id, "llm.request", model=params.get("model", ""))
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any):
+        span = self._spans.get(run_id)
+        try:
+            usage = response.generations[0][0].message.usage_metadata
+        except (AttributeError, IndexError):
+            usage = None
+        if span is not None and usage:
+            span.set_attribute("input_tokens", usage.get("input_tokens"))
+            span.set_attribute("output_tokens", usage.get("output_tokens"))
+        self._end(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, error)
+
+    def on_chain_start(
+        self, serialized: dict[str, Any], inputs: Any, *, run_id: UUID, **kwargs: Any
+    ):
+        name = kwargs.get("name") or ""
+        if name.endswith("Parser"):
+            self._start(run_id, "llm.parse", parser=name)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, error)
+
+
+def langchain_config() -> dict[str, Any] | None:
+    span = tracer.current_span()
+    if span is None:
+        return None
+    return {"callbacks": [TracingCallbackHandler(span)]}
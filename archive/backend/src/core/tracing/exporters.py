@@ -0,0 +1,138 @@
+import json
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from src.common.logger import logger
+from src.core.tracing.span import Span, SpanExporter
+
+
+class InMemorySpanExporter:
+    def __init__(self, max_traces: int = 200, max_spans_per_trace: int = 5000):
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: OrderedDict[str, list[Span]] = OrderedDict()
+
+    def on_start(self, span: Span):
+        pass
+
+    def on_end(self, span: Span):
+        spans = self._traces.get(span.trace_id)
+        if spans is None:
+            spans = self._traces[span.trace_id] = []
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+        else:
+            self._traces.move_to_end(span.trace_id)
+        if len(spans) < self.max_spans_per_trace:
+            spans.append(span)
+
+    def get_trace(self, trace_id: str) -> list[Span] | None:
+        spans = self._traces.get(trace_id)
+        return list(spans) if spans is not None else None
+
+    def trace_ids(self) -> list[str]:
+        return list(reversed(self._traces))
+
+    def shutdown(self):
+        self._traces.clear()
+
+
+class FileSpanExporter:
+    # One JSON object per finished span, written by a background thread
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write, name="span-file-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def on_start(self, span: Span):
+        pass
+
+    def on_end(self, span: Span):
+        self._queue.put(span.to_dict())
+
+    def _write(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                f.write(json.dumps(record, default=str) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+    def shutdown(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+
+class OpenTelemetrySpanExporter:
+    def __init__(self, service_name: str):
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        self._trace = trace
+        self.provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name})
+        )
+        self.provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        self.tracer = self.provider.get_tracer("doppel-backend")
+        self._open: dict[str, Any] = {}
+
+    def on_start(self, span: Span):
+        parent = self._open.get(span.parent_id) if span.parent_id else None
+        context = self._trace.set_span_in_context(parent) if parent else None
+        self._open[span.span_id] = self.tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start * 1e9),
+            attributes={"conversation.id": span.trace_id},
+        )
+
+    def on_end(self, span: Span):
+        otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                otel_span.set_attribute(key, value)
+        if span.error:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+            otel_span.set_attribute("error.message", span.error)
+        otel_span.end(end_time=int(span.end * 1e9))
+
+    def shutdown(self):
+        self.provider.shutdown()
+
+
+def create_exporters(
+    names: list[str],
+    file_path: str,
+    max_traces: int,
+    max_spans_per_trace: int,
+    service_name: str,
+) -> list[SpanExporter]:
+    exporters: list[SpanExporter] = []
+    for name in names:
+        if name == "memory":
+            exporters.append(InMemorySpanExporter(max_traces, max_spans_per_trace))
+        elif name == "file":
+            exporters.append(FileSpanExporter(file_path))
+        elif name == "otlp":
+            try:
+                exporters.append(OpenTelemetrySpanExporter(service_name))
+            except ImportError:
+                logger.warning(
+                    "OTLP tracing needs opentelemetry-sdk and "
+                    "opentelemetry-exporter-otlp-proto-http, skipping the exporter"
+                )
+    return exporters
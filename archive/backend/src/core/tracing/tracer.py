@@ -0,0 +1,110 @@
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from src.common.config import settings
+from src.core.tracing.exporters import InMemorySpanExporter, create_exporters
+from src.core.tracing.span import Span, SpanExporter
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    def __init__(self, exporters: list[SpanExporter], enabled: bool = True):
+        self.exporters = exporters
+        self.enabled = enabled and bool(exporters)
+
+    def current_span(self) -> Span | None:
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        trace_id: str | None = None,
+        parent: Span | None = None,
+        **attributes: Any,
+    ) -> Span | None:
+        if not self.enabled:
+            return None
+
+        parent = parent or _current_span.get()
+        if trace_id is None and parent is not None:
+            trace_id = parent.trace_id
+        # Spans only exist inside a trace, a conversation id opens one
+        if trace_id is None:
+            return None
+
+        span = Span(
+            trace_id=trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=(
+                parent.span_id if parent and parent.trace_id == trace_id else None
+            ),
+            name=name,
+            start=time.time(),
+            attributes=attributes,
+        )
+        for exporter in self.exporters:
+            exporter.on_start(span)
+        return span
+
+    def end_span(self, span: Span | None, error: BaseException | None = None):
+        if span is None:
+            return
+        span.end = time.time()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        for exporter in self.exporters:
+            exporter.on_end(span)
+
+    @contextmanager
+    def span(
+        self, name: str, trace_id: str | None = None, **attributes: Any
+    ) -> Iterator[Span | None]:
+        span = self.start_span(name, trace_id, **attributes)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_span.reset(token)
+
+    def shutdown(self):
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def _memory_exporter(self) -> InMemorySpanExporter | None:
+        for exporter in self.exporters:
+            if isinstance(exporter, InMemorySpanExporter):
+                return exporter
+        return None
+
+    def get_trace(self, trace_id: str) -> list[Span] | None:
+        exporter = self._memory_exporter()
+        return exporter.get_trace(trace_id) if exporter else None
+
+    def trace_ids(self) -> list[str]:
+        exporter = self._memory_exporter()
+        return exporter.trace_ids() if exporter else []
+
+
+tracer = Tracer(
+    create_exporters(
+        settings.TRACING_EXPORTERS,
+        file_path=settings.TRACING_FILE_PATH,
+        max_traces=settings.TRACING_MAX_TRACES,
+        max_spans_per_trace=settings.TRACING_MAX_SPANS_PER_TRACE,
+        service_name="doppel-backend",
+    ),
+    enabled=settings.TRACING_ENABLED,
+)
@@ -0,0 +1,60 @@
+import threading
+
+from pymongo import monitoring
+from src.core.metrics.registry import metrics
+
+MONGO_OPERATION_DURATION = metrics.histogram(
+    "mongo_operation_duration_seconds",
+    "MongoDB command latency",
+    ("collection", "command"),
+)
+MONGO_OPERATION_FAILURES = metrics.counter(
+    "mongo_operation_failures_total",
+    "MongoDB commands that returned an error",
+    ("collection", "command"),
+)
+
+# Driver handshakes and session bookkeeping would only add noise
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "saslStart"}
+
+
+def _collection_name(event: monitoring.CommandStartedEvent) -> str | None:
+    if event.command_name == "getMore":
+        return event.command.get("collection")
+    target = event.command.get(event.command_name)
+    return target if isinstance(target, str) else None
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self):
+        self._collections: dict[tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, event) -> tuple[int, int]:
+        return event.request_id, event.operation_id
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        collection = _collection_name(event)
+        if collection is None:
+            return
+        with self._lock:
+            self._collections[self._key(event)] = collection
+
+    def _finish(self, event, failed: bool):
+        with self._lock:
+            collection = self._collections.pop(self._key(event), None)
+        if collection is None:
+            return
+
+        labels = {"collection": collection, "command": event.command_name}
+        MONGO_OPERATION_DURATION.observe(event.duration_micros / 1_000_000, **labels)
+        if failed:
+            MONGO_OPERATION_FAILURES.inc(**labels)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finish(event, failed=True)
@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+from src.common.logger import logger
+from src.common.utils.pagination import KEYSET_SORT
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys: list[tuple[str, int]]
+    unique: bool = False
+    partial_filter: dict[str, Any] | None = None
+
+    @property
+    def name(self) -> str:
+        return "_".join(f"{key}_{direction}" for key, direction in self.keys)
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    label: str
+    collection: str
+    filter: dict[str, Any] = field(default_factory=dict)
+    sort: list[tuple[str, int]] = field(default_factory=list)
+
+
+INDEXES: list[IndexSpec] = [
+    IndexSpec("agents", [("username", ASCENDING)], unique=True),
+    IndexSpec("agents", [("created_at", DESCENDING), ("_id", DESCENDING)]),
+    IndexSpec("conversations", [("created_at", DESCENDING), ("_id", DESCENDING)]),
+    IndexSpec(
+        "conversations",
+        [
+            ("recruiter.agent_id", ASCENDING),
+            ("created_at", DESCENDING),
+            ("_id", DESCENDING),
+        ],
+    ),
+    IndexSpec(
+        "conversations",
+        [
+            ("candidate.agent_id", ASCENDING),
+            ("created_at", DESCENDING),
+            ("_id", DESCENDING),
+        ],
+    ),
+    IndexSpec(
+        "conversations",
+        [("status", ASCENDING), ("owner.heartbeat_at", ASCENDING)],
+        partial_filter={"status": "in_progress"},
+    ),
+    IndexSpec(
+        "matches",
+        [("created_at", DESCENDING), ("_id", DESCENDING), ("score", ASCENDING)],
+    ),
+    IndexSpec(
+        "matches",
+        [
+            ("recruiter_id", ASCENDING),
+            ("score", DESCENDING),
+            ("created_at", DESCENDING),
+        ],
+    ),
+    IndexSpec("matches", [("candidate_id", ASCENDING), ("score", DESCENDING)]),
+]
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Mirrors the reads the services issue, checked with explain() in debug mode
+QUERY_SHAPES: list[QueryShape] = [
+    QueryShape("agent by username", "agents", {"username": "explain"}),
+    QueryShape("list agents", "agents", sort=KEYSET_SORT),
+    QueryShape("list conversations", "conversations", sort=KEYSET_SORT),
+    QueryShape(
+        "conversations for agent",
+        "conversations",
+        {
+            "$or": [
+                {"recruiter.agent_id": "explain"},
+                {"candidate.agent_id": "explain"},
+            ]
+        },
+        KEYSET_SORT,
+    ),
+    QueryShape(
+        "stale conversations",
+        "conversations",
+        # ConversationService.resume_stale_conversations
+        {
+            "status": "in_progress",
+            "$or": [
+                {"owner.heartbeat_at": {"$lt": _EPOCH}},
+                {"owner": {"$exists": False}, "created_at": {"$lt": _EPOCH}},
+            ],
+        },
+    ),
+    QueryShape("list matches", "matches", sort=KEYSET_SORT),
+    QueryShape(
+        "matches above score",
+        "matches",
+        {"score": {"$gte": 7}},
+        KEYSET_SORT,
+    ),
+]
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase, specs: list[IndexSpec] = INDEXES):
+    for spec in specs:
+        options: dict[str, Any] = {"name": spec.name, "unique": spec.unique}
+        if spec.partial_filter:
+            options["partialFilterExpression"] = spec.partial_filter
+
+        try:
+            await db[spec.collection].create_index(spec.keys, **options)
+        except OperationFailure as e:
+            if spec.unique:
+                # Creates and imports detect duplicates through DuplicateKeyError
+                raise RuntimeError(
+                    f"Could not create unique index {spec.name} on "
+                    f"{spec.collection}: {e}"
+                ) from e
+            logger.error(
+                f"Could not create index {spec.name} on {spec.collection}: {e}"
+            )
+
+    logger.info(f"Ensured {len(specs)} MongoDB indexes")
+
+
+def _plan_stages(plan: Any) -> list[str]:
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _plan_stages(item)]
+    if not isinstance(plan, dict):
+        return []
+
+    stages = [plan["stage"]] if "stage" in plan else []
+    for value in plan.values():
+        stages.extend(_plan_stages(value))
+    return stages
+
+
+async def check_query_plans(
+    db: AsyncIOMotorDatabase, shapes: list[QueryShape] = QUERY_SHAPES
+) -> dict[str, list[str]]:
+    plans = {}
+    for shape in shapes:
+        cursor = db[shape.collection].find(shape.filter)
+        if shape.sort:
+            cursor = cursor.sort(shape.sort)
+        explain = await cursor.explain()
+
+        stages = _plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        plans[shape.label] = stages
+        if "COLLSCAN" in stages:
+            logger.warning(
+                f"Query '{shape.label}' on {shape.collection} runs a COLLSCAN: {stages}"
+            )
+        else:
+            logger.debug(f"Query '{shape.label}' plan: {stages}")
+
+    return plans
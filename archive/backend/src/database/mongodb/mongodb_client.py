@@ -1,6 +1,8 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from src.common.config import settings
 from src.common.logger import logger
+from src.database.mongodb.command_metrics import CommandMetricsListener
+from src.database.mongodb.indexes import check_query_plans, ensure_indexes
 
 
 class MongoDBClient:
@@ -10,10 +12,22 @@ class MongoDBClient:
 
     async def connect(self):
         if self.client is None:
-            self.client = AsyncIOMotorClient(settings.MONGODB_URI)
+            self.client = AsyncIOMotorClient(
+                settings.MONGODB_URI, event_listeners=[CommandMetricsListener()]
+            )
             self.db = self.client.get_default_database()
             logger.info("Connected to MongoDB")
 
+    async def ensure_indexes(self):
+        if self.db is None:
+            raise RuntimeError("MongoDB not connected. Call connect() first.")
+        await ensure_indexes(self.db)
+
+    async def check_query_plans(self) -> dict[str, list[str]]:
+        if self.db is None:
+            raise RuntimeError("MongoDB not connected. Call connect() first.")
+        return await check_query_plans(self.db)
+
     async def disconnect(self):
         if self.client:
             self.client.close()
@@ -39,5 +53,11 @@ class MongoDBClient:
             raise RuntimeError("MongoDB not connected. Call connect() first.")
         return self.db.matches
 
+    @property
+    def agent_summaries(self):
+        if self.db is None:
+            raise RuntimeError("MongoDB not connected. Call connect() first.")
+        return self.db.agent_summaries
+
 
 mongodb_client = MongoDBClient()
@@ -5,26 +5,52 @@ from importlib.metadata import version
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from src.common.config import settings
 from src.common.constants import PROJECT_TITLE
 from src.common.logger import logger, setup_logging
 from src.common.utils.exception_handlers import register_exception_handlers
 from src.common.utils.response import Response
+from src.core.broker.conversation_broker import conversation_broker
+from src.core.cache.agent_cache import agent_cache
+from src.core.jobs.job_registry import job_registry
+from src.core.metrics.loop_monitor import loop_monitor
+from src.core.metrics.registry import metrics
+from src.core.tracing.tracer import tracer
 from src.database.mongodb.mongodb_client import mongodb_client
 from src.module.agent.agent_controller import router as agent_router
+from src.module.agent.agent_service import shutdown_import_pool
+from src.module.analytics.analytics_controller import router as analytics_router
 from src.module.conversation.conversation_controller import (
     router as conversation_router,
 )
 from src.module.conversation.conversation_dependency import get_conversation_service
+from src.module.debug.debug_controller import router as debug_router
 from src.module.world.world_controller import router as world_router
 from src.module.world.world_dependency import get_world_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.LOOP_MONITOR_ENABLED:
+        await loop_monitor.start()
     await mongodb_client.connect()
+    if settings.MONGODB_ENSURE_INDEXES:
+        await mongodb_client.ensure_indexes()
+    if settings.MONGODB_EXPLAIN_QUERIES:
+        await mongodb_client.check_query_plans()
+    await conversation_broker.start()
+    await agent_cache.start()
+    await get_conversation_service().start()
     yield
+    await get_conversation_service().stop()
+    await job_registry.stop()
+    shutdown_import_pool()
+    await agent_cache.stop()
+    await conversation_broker.stop()
     await mongodb_client.disconnect()
+    tracer.shutdown()
+    await loop_monitor.stop()
 
 
 def create_app() -> FastAPI:
@@ -58,7 +84,9 @@ def create_app() -> FastAPI:
     )
 
     app.include_router(agent_router)
+    app.include_router(analytics_router)
     app.include_router(conversation_router)
+    app.include_router(debug_router)
     app.include_router(world_router)
 
     register_exception_handlers(app)
@@ -86,6 +114,13 @@ async def health_check() -> JSONResponse:
     )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # ========== WEBSOCKET ENDPOINTS ==========
 @app.websocket("/ws/test")
 async def test_websocket(websocket: WebSocket):
@@ -114,13 +149,8 @@ async def world_websocket(websocket: WebSocket):
             pass
         return
 
-    queue: asyncio.Queue = asyncio.Queue()
-
-    async def state_callback(state: dict):
-        await queue.put(state)
-
     try:
-        world_service.add_state_callback(state_callback)
+        queue = world_service.add_subscriber()
     except Exception as e:
         logger.error(f"Failed to add state callback: {e}", exc_info=True)
         try:
@@ -143,43 +173,6 @@ async def world_websocket(websocket: WebSocket):
         logger.error(f"World WebSocket error: {e}", exc_info=True)
     finally:
         try:
-            world_service.remove_state_callback(state_callback)
+            world_service.remove_subscriber(queue)
         except Exception as e:
             logger.error(f"Failed to remove state callback: {e}", exc_info=True)
-
-
-@app.websocket("/conversation/ws/{conversation_id}")
-async def conversation_websocket(websocket: WebSocket, conversation_id: str):
-    await websocket.accept()
-    logger.info(f"Conversation WebSocket connected for {conversation_id}")
-
-    conversation_service = get_conversation_service()
-
-    try:
-        async for turn in conversation_service.run_conversation_stream(conversation_id):
-            await websocket.send_json(
-                {
-                    "type": "turn",
-                    "data": {
-                        "role": turn.role,
-                        "speaker_name": turn.speaker_name,
-                        "content": turn.content,
-                        "timestamp": turn.timestamp,
-                        "is_final": turn.is_final,
-                        "final_evaluation": turn.final_evaluation,
-                    },
-                }
-            )
-
-        await websocket.send_json({"type": "complete"})
-        logger.info(f"Conversation {conversation_id} completed via WebSocket")
-
-    except WebSocketDisconnect:
-        logger.info(f"Conversation WebSocket disconnected for {conversation_id}")
-    except ValueError as e:
-        await websocket.send_json({"type": "error", "message": str(e)})
-        await websocket.close()
-    except Exception as e:
-        logger.error(f"Conversation WebSocket error for {conversation_id}: {e}")
-        await websocket.send_json({"type": "error", "message": str(e)})
-        await websocket.close()
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from src.common.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.common.utils.response import Response, Status
 from src.module.agent.agent_dependency import get_agent_service
 from src.module.agent.agent_schema import (
-    AgentListItem,
+    AgentImportResult,
+    AgentPage,
     AgentResponse,
     CreateAgentRequest,
     UpdateAgentRequest,
@@ -47,16 +49,41 @@ async def create_agent(
         )
 
 
-@router.get("", response_model=list[AgentListItem])
+@router.post("/import", response_model=AgentImportResult)
+async def import_agents(
+    request: Request,
+    agent_service: AgentService = Depends(get_agent_service),
+):
+    try:
+        result = await agent_service.import_agents(request.stream())
+        return Response.success(
+            message=f"Imported {result['inserted']} agents",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to import agents: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
+@router.get("", response_model=AgentPage)
 async def get_all_agents(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     agent_service: AgentService = Depends(get_agent_service),
 ):
     try:
-        result = await agent_service.get_all_agents()
+        result = await agent_service.get_all_agents(limit=limit, cursor=cursor)
         return Response.success(
             message="Agents retrieved successfully",
             data=result,
         )
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.BAD_REQUEST,
+        )
     except Exception as e:
         return Response.error(
             message=f"Failed to retrieve agents: {str(e)}",
@@ -64,6 +91,40 @@ async def get_all_agents(
         )
 
 
+@router.get("/export")
+async def export_agents(
+    agent_service: AgentService = Depends(get_agent_service),
+):
+    return Response.ndjson(agent_service.export_agents(), filename="agents.ndjson")
+
+
+@router.get("/cache/stats")
+async def get_agent_cache_stats(
+    agent_service: AgentService = Depends(get_agent_service),
+):
+    return Response.success(
+        message="Agent cache stats retrieved successfully",
+        data=agent_service.get_cache_stats(),
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def get_agent_job(
+    job_id: str,
+    agent_service: AgentService = Depends(get_agent_service),
+):
+    try:
+        return Response.success(
+            message="Job retrieved successfully",
+            data=agent_service.get_job(job_id),
+        )
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.NOT_FOUND,
+        )
+
+
 @router.get("/{agent_id}", response_model=AgentResponse)
 async def get_agent(
     agent_id: str,
@@ -129,10 +190,11 @@ async def delete_agent(
     agent_service: AgentService = Depends(get_agent_service),
 ):
     try:
-        await agent_service.delete_agent(agent_id=agent_id)
+        job = await agent_service.delete_agent(agent_id=agent_id)
         return Response.success(
-            message="Agent deleted successfully",
-            status_code=Status.NO_CONTENT,
+            message="Agent deleted, related data is being cleaned up",
+            data=job,
+            status_code=Status.ACCEPTED,
         )
     except ValueError as e:
         return Response.error(
@@ -151,11 +213,11 @@ async def delete_all_agents(
     agent_service: AgentService = Depends(get_agent_service),
 ):
     try:
-        count = await agent_service.delete_all_agents()
+        result = await agent_service.delete_all_agents()
         return Response.success(
-            message=f"Deleted {count} agents successfully",
-            data={"deleted_count": count},
-            status_code=Status.OK,
+            message=f"Deleted {result['deleted_count']} agents successfully",
+            data=result,
+            status_code=Status.ACCEPTED,
         )
     except Exception as e:
         return Response.error(
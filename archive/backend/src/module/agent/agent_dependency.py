@@ -1,10 +1,20 @@
 from fastapi import Depends
+from src.core.cache.agent_cache import agent_cache
+from src.core.jobs.job_registry import job_registry
 from src.database.db_dependency import get_mongodb_client
 from src.database.mongodb.mongodb_client import MongoDBClient
 from src.module.agent.agent_service import AgentService
+from src.module.conversation.conversation_dependency import get_conversation_service
+from src.module.world.world_dependency import get_world_service
 
 
 def get_agent_service(
     mongodb_client: MongoDBClient = Depends(get_mongodb_client),
 ) -> AgentService:
-    return AgentService(mongodb_client=mongodb_client)
+    return AgentService(
+        mongodb_client=mongodb_client,
+        agent_cache=agent_cache,
+        world_service=get_world_service(),
+        jobs=job_registry,
+        conversation_service=get_conversation_service(),
+    )
@@ -235,6 +235,28 @@ class AgentListItem(BaseModel):
     created_at: str = Field(..., description="ISO format timestamp of creation")
 
 
+class AgentPage(BaseModel):
+    items: list[AgentListItem] = Field(..., description="Agents on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+
+
+class AgentImportError(BaseModel):
+    line: int = Field(..., description="Line number in the uploaded NDJSON")
+    username: Optional[str] = Field(None, description="Username on the failed row")
+    error: str = Field(..., description="Why the row was rejected")
+
+
+class AgentImportResult(BaseModel):
+    inserted: int = Field(..., description="Agents inserted")
+    failed: int = Field(..., description="Rows rejected")
+    errors: list[AgentImportError] = Field(..., description="Per-row errors")
+    errors_truncated: bool = Field(
+        ..., description="True when more rows failed than errors returned"
+    )
+
+
 class AgentResponse(BaseModel):
     agent_id: str = Field(..., description="Agent document ID")
     username: str = Field(..., description="Agent username")
@@ -1,30 +1,90 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from src.common.config import settings
 from src.common.logger import logger
+from src.common.utils.pagination import DEFAULT_PAGE_SIZE, iterate, paginate
+from src.core.agents.prompts import compile_prompt
+from src.core.cache.agent_cache import AgentCache
+from src.core.jobs.job_registry import Job, JobRegistry, job_registry
 from src.database.mongodb.mongodb_client import MongoDBClient
-from src.module.agent.agent_schema import (
-    RecruiterProfile,
-    CandidateProfile,
-    UpdateRecruiterProfile,
-    UpdateCandidateProfile,
+from src.module.agent.agent_validation import (
+    build_agent_doc,
+    extract_name_and_bio,
+    validate_import_batch,
+    validate_profile,
+    validate_profile_sections,
 )
+from src.module.conversation.conversation_service import ConversationService
+from src.module.world.world_service import WorldService
+
+LIST_ITEM_PROJECTION = {
+    "username": 1,
+    "name": 1,
+    "bio": 1,
+    "type": 1,
+    "created_at": 1,
+}
+
+DUPLICATE_KEY_ERROR = 11000
+
+UPDATE_ATTEMPTS = 3
+
+_import_pool: ProcessPoolExecutor | None = None
+
+
+def _get_import_pool() -> ProcessPoolExecutor:
+    global _import_pool
+    if _import_pool is None:
+        _import_pool = ProcessPoolExecutor(
+            max_workers=settings.AGENT_IMPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _import_pool
+
+
+def shutdown_import_pool():
+    global _import_pool
+    if _import_pool is not None:
+        _import_pool.shutdown(cancel_futures=True)
+        _import_pool = None
+
+
+async def _read_lines(body: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    buffer = b""
+    line = 0
+    async for chunk in body:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for raw in complete:
+            line += 1
+            if raw.strip():
+                yield line, raw
+    if buffer.strip():
+        yield line + 1, buffer
 
 
 class AgentService:
-    def __init__(self, mongodb_client: MongoDBClient):
+    def __init__(
+        self,
+        mongodb_client: MongoDBClient,
+        agent_cache: AgentCache | None = None,
+        world_service: WorldService | None = None,
+        jobs: JobRegistry | None = None,
+        conversation_service: ConversationService | None = None,
+    ):
         self.mongodb_client = mongodb_client
-
-    def _extract_name_and_bio(self, profile: dict, agent_type: str) -> tuple[str, str]:
-        if agent_type == "recruiter":
-            return profile.get("name", ""), profile.get("bio", "")
-        elif agent_type == "candidate":
-            personal_info = profile.get("personal_info", {})
-            name = personal_info.get("full_name", "")
-            bio = profile.get("professional_summary", "")
-            return name, bio
-        return "", ""
+        self.agent_cache = agent_cache or AgentCache(mongodb_client)
+        self.world_service = world_service
+        self.jobs = jobs or job_registry
+        self.conversation_service = conversation_service
 
     async def create_agent(
         self, username: str, agent_type: str, profile: dict
@@ -38,32 +98,17 @@ class AgentService:
         if existing_agent:
             raise ValueError(f"Agent with username '{username}' already exists")
 
-        if agent_type == "recruiter":
-            try:
-                RecruiterProfile(**profile)
-            except Exception as e:
-                raise ValueError(f"Invalid recruiter profile: {str(e)}")
-        elif agent_type == "candidate":
-            try:
-                CandidateProfile(**profile)
-            except Exception as e:
-                raise ValueError(f"Invalid candidate profile: {str(e)}")
-
-        name, bio = self._extract_name_and_bio(profile, agent_type)
-
-        agent_doc = {
-            "username": username,
-            "name": name,
-            "bio": bio,
-            "type": agent_type,
-            "profile": profile,
-            "created_at": datetime.utcnow(),
-        }
-        result = await self.mongodb_client.agents.insert_one(agent_doc)
+        agent_doc = build_agent_doc(
+            username, agent_type, profile, settings.PROMPT_PROFILE_ENCODING
+        )
+        try:
+            result = await self.mongodb_client.agents.insert_one(agent_doc)
+        except DuplicateKeyError:
+            raise ValueError(f"Agent with username '{username}' already exists")
         agent_doc["_id"] = result.inserted_id
 
         logger.info(
-            f"Created agent: {name} with username: {username} and id: {result.inserted_id}"
+            f"Created agent: {agent_doc['name']} with username: {username} and id: {result.inserted_id}"
         )
 
         return {
@@ -76,30 +121,137 @@ class AgentService:
             "created_at": agent_doc["created_at"].isoformat(),
         }
 
-    async def get_all_agents(self) -> list[dict[str, Any]]:
-        cursor = self.mongodb_client.agents.find().sort("created_at", -1)
-        agents = await cursor.to_list(length=None)
-
-        result = []
-        for agent in agents:
-            result.append(
-                {
-                    "agent_id": str(agent["_id"]),
-                    "username": agent["username"],
-                    "name": agent["name"],
-                    "bio": agent["bio"],
-                    "type": agent["type"],
-                    "created_at": agent["created_at"].isoformat(),
-                }
+    async def import_agents(self, body: AsyncIterator[bytes]) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        pool = _get_import_pool()
+        chunk_size = settings.AGENT_IMPORT_CHUNK_SIZE
+        # Bounds memory and applies backpressure to the upload stream
+        max_pending = (settings.AGENT_IMPORT_WORKERS or os.cpu_count() or 1) * 2
+        pending: list[asyncio.Future] = []
+        seen_usernames: set[str] = set()
+        result = {"inserted": 0, "failed": 0, "errors": [], "errors_truncated": False}
+
+        def add_errors(errors: list[dict[str, Any]]):
+            result["failed"] += len(errors)
+            room = settings.AGENT_IMPORT_MAX_ERRORS - len(result["errors"])
+            result["errors"].extend(errors[: max(room, 0)])
+            if len(errors) > room:
+                result["errors_truncated"] = True
+
+        def submit(batch: list[tuple[int, bytes]]):
+            pending.append(
+                loop.run_in_executor(
+                    pool, validate_import_batch, batch, settings.PROMPT_PROFILE_ENCODING
+                )
             )
 
+        async def drain(future: asyncio.Future):
+            docs, errors = await future
+            add_errors(errors)
+
+            unique_docs = []
+            for line, doc in docs:
+                if doc["username"] in seen_usernames:
+                    add_errors(
+                        [
+                            {
+                                "line": line,
+                                "username": doc["username"],
+                                "error": "Duplicate username in import",
+                            }
+                        ]
+                    )
+                    continue
+                seen_usernames.add(doc["username"])
+                unique_docs.append((line, doc))
+
+            if unique_docs:
+                inserted, insert_errors = await self._insert_import_chunk(unique_docs)
+                result["inserted"] += inserted
+                add_errors(insert_errors)
+
+        batch: list[tuple[int, bytes]] = []
+        async for row in _read_lines(body):
+            batch.append(row)
+            if len(batch) < chunk_size:
+                continue
+            submit(batch)
+            batch = []
+            if len(pending) >= max_pending:
+                await drain(pending.pop(0))
+
+        if batch:
+            submit(batch)
+        for future in pending:
+            await drain(future)
+
+        logger.info(
+            f"Imported {result['inserted']} agents, {result['failed']} rows failed"
+        )
+
         return result
 
-    async def get_agent_by_id(self, agent_id: str) -> dict[str, Any]:
+    async def _insert_import_chunk(
+        self, rows: list[tuple[int, dict[str, Any]]]
+    ) -> tuple[int, list[dict[str, Any]]]:
         try:
-            agent = await self.mongodb_client.agents.find_one(
-                {"_id": ObjectId(agent_id)}
+            result = await self.mongodb_client.agents.insert_many(
+                [doc for _, doc in rows], ordered=False
             )
+            return len(result.inserted_ids), []
+        except BulkWriteError as e:
+            errors = []
+            for write_error in e.details.get("writeErrors", []):
+                line, doc = rows[write_error["index"]]
+                errors.append(
+                    {
+                        "line": line,
+                        "username": doc["username"],
+                        "error": (
+                            f"Agent with username '{doc['username']}' already exists"
+                            if write_error["code"] == DUPLICATE_KEY_ERROR
+                            else write_error["errmsg"]
+                        ),
+                    }
+                )
+            return e.details.get("nInserted", 0), errors
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        return self.agent_cache.get_stats()
+
+    def _serialize_list_item(self, agent: dict) -> dict[str, Any]:
+        return {
+            "agent_id": str(agent["_id"]),
+            "username": agent["username"],
+            "name": agent["name"],
+            "bio": agent["bio"],
+            "type": agent["type"],
+            "created_at": agent["created_at"].isoformat(),
+        }
+
+    async def get_all_agents(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> dict[str, Any]:
+        return await paginate(
+            self.mongodb_client.agents,
+            {},
+            LIST_ITEM_PROJECTION,
+            self._serialize_list_item,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def export_agents(self) -> AsyncIterator[dict[str, Any]]:
+        return iterate(
+            self.mongodb_client.agents,
+            {},
+            LIST_ITEM_PROJECTION,
+            self._serialize_list_item,
+        )
+
+    async def get_agent_by_id(self, agent_id: str) -> dict[str, Any]:
+        try:
+            agent = await self.agent_cache.get(agent_id)
         except Exception:
             raise ValueError(f"Invalid agent ID format: {agent_id}")
 
@@ -133,70 +285,50 @@ class AgentService:
         except Exception:
             raise ValueError(f"Invalid agent ID format: {agent_id}")
 
-        existing_agent = await self.mongodb_client.agents.find_one({"_id": object_id})
-        if not existing_agent:
-            raise ValueError(f"Agent with id {agent_id} not found")
-
-        current_type = existing_agent.get("type")
-        final_type = agent_type if agent_type else current_type
-
-        if username is not None:
-            duplicate_agent = await self.mongodb_client.agents.find_one(
-                {"username": username, "_id": {"$ne": object_id}}
-            )
-            if duplicate_agent:
-                raise ValueError(f"Agent with username '{username}' already exists")
-
-        update_data = {}
+        update_data: dict[str, Any] = {}
         if username is not None:
             update_data["username"] = username
         if agent_type is not None:
             update_data["type"] = agent_type
+            if profile is not None:
+                # A type change replaces the whole profile, so all of it is checked
+                validate_profile(agent_type, profile)
+                update_data.update(self._profile_fields(agent_type, profile))
 
-        if profile is not None:
-            if agent_type is None:
-                current_profile = existing_agent.get("profile", {})
-                merged_profile = {**current_profile, **profile}
-            else:
-                merged_profile = profile
-
-            if final_type == "recruiter":
-                try:
-                    if agent_type is None:
-                        UpdateRecruiterProfile(**profile)
-                        RecruiterProfile(**merged_profile)
-                    else:
-                        RecruiterProfile(**merged_profile)
-                except Exception as e:
-                    raise ValueError(f"Invalid recruiter profile: {str(e)}")
-            elif final_type == "candidate":
-                try:
-                    CandidateProfile(**merged_profile)
-                except Exception as e:
-                    raise ValueError(f"Invalid candidate profile: {str(e)}")
-
-            update_data["profile"] = merged_profile
-            name, bio = self._extract_name_and_bio(merged_profile, final_type)
-            update_data["name"] = name
-            update_data["bio"] = bio
-        elif agent_type is not None:
-            name, bio = self._extract_name_and_bio(
-                existing_agent.get("profile", {}), final_type
-            )
-            update_data["name"] = name
-            update_data["bio"] = bio
-
-        if not update_data:
+        if not update_data and profile is None:
             raise ValueError("At least one field must be provided for update")
 
-        result = await self.mongodb_client.agents.update_one(
-            {"_id": object_id}, {"$set": update_data}
-        )
+        # Merges and type-only changes depend on the stored profile. The write is
+        # guarded on the type and profile it was computed from, and retried on a
+        # concurrent change.
+        needs_current = (agent_type is None) != (profile is None)
+        agent = None
+        for attempt in range(UPDATE_ATTEMPTS):
+            query: dict[str, Any] = {"_id": object_id}
+            changes = dict(update_data)
+            if needs_current:
+                current = await self._get_current_profile(agent_id, object_id, attempt)
+                query["type"] = current["type"]
+                query["profile"] = current["profile"]
+                changes.update(self._apply_profile_change(current, agent_type, profile))
 
-        if result.matched_count == 0:
-            raise ValueError(f"Agent with id {agent_id} not found")
+            try:
+                agent = await self.mongodb_client.agents.find_one_and_update(
+                    query,
+                    {"$set": changes},
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError:
+                raise ValueError(f"Agent with username '{username}' already exists")
+
+            self.agent_cache.invalidate(agent_id)
+            if agent or not needs_current:
+                break
 
-        agent = await self.mongodb_client.agents.find_one({"_id": object_id})
+        if not agent:
+            if needs_current:
+                raise ValueError(f"Agent with id {agent_id} changed during the update")
+            raise ValueError(f"Agent with id {agent_id} not found")
 
         logger.info(f"Updated agent: {agent_id}")
 
@@ -210,23 +342,162 @@ class AgentService:
             "created_at": agent["created_at"].isoformat(),
         }
 
-    async def delete_agent(self, agent_id: str) -> None:
+    def _profile_fields(self, agent_type: str, profile: dict) -> dict[str, Any]:
+        name, bio = extract_name_and_bio(profile, agent_type)
+        return {
+            "profile": profile,
+            "name": name,
+            "bio": bio,
+            "prompt": compile_prompt(
+                agent_type, profile, settings.PROMPT_PROFILE_ENCODING
+            ),
+        }
+
+    async def _get_current_profile(
+        self, agent_id: str, object_id: ObjectId, attempt: int
+    ) -> dict[str, Any]:
+        if attempt == 0:
+            agent = await self.agent_cache.get(agent_id)
+        else:
+            agent = await self.mongodb_client.agents.find_one(
+                {"_id": object_id}, {"type": 1, "profile": 1}
+            )
+        if not agent:
+            raise ValueError(f"Agent with id {agent_id} not found")
+        return {"type": agent["type"], "profile": agent.get("profile", {})}
+
+    def _apply_profile_change(
+        self, current: dict[str, Any], agent_type: str | None, profile: dict | None
+    ) -> dict[str, Any]:
+        final_type = agent_type or current["type"]
+        if profile is None:
+            # The stored profile was written for the old type
+            try:
+                validate_profile(final_type, current["profile"])
+            except ValueError as e:
+                raise ValueError(
+                    f"Changing the type to '{final_type}' needs a matching profile: {e}"
+                )
+            return self._profile_fields(final_type, current["profile"])
+
+        validate_profile_sections(final_type, profile)
+        return self._profile_fields(final_type, {**current["profile"], **profile})
+
+    async def delete_agent(self, agent_id: str) -> dict[str, Any]:
         try:
             object_id = ObjectId(agent_id)
         except Exception:
             raise ValueError(f"Invalid agent ID format: {agent_id}")
 
         result = await self.mongodb_client.agents.delete_one({"_id": object_id})
+        self.agent_cache.invalidate(agent_id)
 
         if result.deleted_count == 0:
             raise ValueError(f"Agent with id {agent_id} not found")
 
-        logger.info(f"Deleted agent: {agent_id}")
+        if self.world_service:
+            self.world_service.remove_agent(agent_id)
 
-    async def delete_all_agents(self) -> int:
+        job = self.jobs.start(
+            "delete_agent",
+            lambda job: self._cascade_delete(job, agent_id),
+            {"agent_id": agent_id},
+        )
+
+        logger.info(f"Deleted agent: {agent_id}, cleanup job {job.job_id}")
+
+        return job.to_dict()
+
+    async def delete_all_agents(self) -> dict[str, Any]:
+        # Conversations started after this point belong to agents created since
+        cutoff = datetime.utcnow()
         result = await self.mongodb_client.agents.delete_many({})
+        self.agent_cache.clear()
         count = result.deleted_count
 
-        logger.info(f"Deleted {count} agents")
+        if self.world_service:
+            self.world_service.remove_all_agents()
+
+        job = self.jobs.start(
+            "delete_all_agents", lambda job: self._cascade_delete(job, None, cutoff)
+        )
 
-        return count
+        logger.info(f"Deleted {count} agents, cleanup job {job.job_id}")
+
+        return {"deleted_count": count, "job": job.to_dict()}
+
+    def get_job(self, job_id: str) -> dict[str, Any]:
+        job = self.jobs.get(job_id)
+        if not job:
+            raise ValueError(f"Job with id {job_id} not found")
+        return job.to_dict()
+
+    async def _cascade_delete(
+        self, job: Job, agent_id: str | None, cutoff: datetime | None = None
+    ):
+        counterparts: list[str] = []
+        if agent_id is None:
+            conversation_query: dict[str, Any] = {"created_at": {"$lte": cutoff}}
+            match_query: dict[str, Any] = {"created_at": {"$lte": cutoff}}
+        else:
+            # Each $or branch is served by its own agent id index
+            conversation_query = {
+                "$or": [
+                    {"recruiter.agent_id": agent_id},
+                    {"candidate.agent_id": agent_id},
+                ]
+            }
+            match_query = {
+                "$or": [{"recruiter_id": agent_id}, {"candidate_id": agent_id}]
+            }
+            counterparts = await self._counterparts(agent_id)
+
+        await self._delete_in_batches(
+            job, "matches", self.mongodb_client.matches, match_query
+        )
+        await self._delete_in_batches(
+            job, "conversations", self.mongodb_client.conversations, conversation_query
+        )
+
+        if agent_id is None:
+            remaining = await self.mongodb_client.agents.distinct("_id")
+            summary_query = {"_id": {"$nin": [str(_id) for _id in remaining]}}
+        else:
+            summary_query = {"_id": agent_id}
+        await self._delete_in_batches(
+            job, "agent_summaries", self.mongodb_client.agent_summaries, summary_query
+        )
+
+        # The other participants' summaries still count the deleted conversations
+        if counterparts and self.conversation_service:
+            await self.conversation_service.rebuild_agent_summaries(counterparts)
+            job.advance("rebuilt_summaries", len(counterparts))
+
+    async def _counterparts(self, agent_id: str) -> list[str]:
+        conversations = self.mongodb_client.conversations
+        recruiters = await conversations.distinct(
+            "recruiter.agent_id", {"candidate.agent_id": agent_id}
+        )
+        candidates = await conversations.distinct(
+            "candidate.agent_id", {"recruiter.agent_id": agent_id}
+        )
+        return [*recruiters, *candidates]
+
+    async def _delete_in_batches(
+        self, job: Job, key: str, collection: Any, query: dict[str, Any]
+    ):
+        batch_size = settings.DELETE_BATCH_SIZE
+        job.advance(key, 0)
+        while True:
+            docs = (
+                await collection.find(query, {"_id": 1})
+                .limit(batch_size)
+                .to_list(length=batch_size)
+            )
+            if not docs:
+                return
+
+            result = await collection.delete_many(
+                {"_id": {"$in": [doc["_id"] for doc in docs]}}
+            )
+            job.advance(key, result.deleted_count)
@@ -0,0 +1,109 @@
+import json
+from datetime import datetime
+from typing import Any
+
+from pydantic import ValidationError
+from src.core.agents.prompts import ProfileEncoding, compile_prompt
+from src.module.agent.agent_schema import CandidateProfile, RecruiterProfile
+
+# Kept free of database imports, it also runs inside the import worker processes
+
+
+def extract_name_and_bio(profile: dict, agent_type: str) -> tuple[str, str]:
+    if agent_type == "recruiter":
+        return profile.get("name", ""), profile.get("bio", "")
+    elif agent_type == "candidate":
+        personal_info = profile.get("personal_info", {})
+        name = personal_info.get("full_name", "")
+        bio = profile.get("professional_summary", "")
+        return name, bio
+    return "", ""
+
+
+def validate_profile(agent_type: str, profile: dict) -> None:
+    if agent_type not in ["candidate", "recruiter"]:
+        raise ValueError("Type must be either 'candidate' or 'recruiter'")
+
+    if agent_type == "recruiter":
+        try:
+            RecruiterProfile(**profile)
+        except Exception as e:
+            raise ValueError(f"Invalid recruiter profile: {str(e)}")
+    elif agent_type == "candidate":
+        try:
+            CandidateProfile(**profile)
+        except Exception as e:
+            raise ValueError(f"Invalid candidate profile: {str(e)}")
+
+
+def build_agent_doc(
+    username: str, agent_type: str, profile: dict, encoding: ProfileEncoding
+) -> dict[str, Any]:
+    validate_profile(agent_type, profile)
+    name, bio = extract_name_and_bio(profile, agent_type)
+
+    return {
+        "username": username,
+        "name": name,
+        "bio": bio,
+        "type": agent_type,
+        "profile": profile,
+        "prompt": compile_prompt(agent_type, profile, encoding),
+        "created_at": datetime.utcnow(),
+    }
+
+
+def validate_profile_sections(agent_type: str, sections: dict) -> None:
+    # Stored profiles are already valid, only the sections being replaced are checked
+    model = RecruiterProfile if agent_type == "recruiter" else CandidateProfile
+    instance = model.model_construct()
+    for key, value in sections.items():
+        if key not in model.model_fields:
+            continue
+        try:
+            model.__pydantic_validator__.validate_assignment(instance, key, value)
+        except ValidationError as e:
+            raise ValueError(f"Invalid {agent_type} profile: {str(e)}")
+
+
+def _load_import_row(raw: bytes) -> dict[str, Any]:
+    try:
+        row = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {str(e)}")
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+    return row
+
+
+def _build_import_doc(row: dict[str, Any], encoding: ProfileEncoding) -> dict[str, Any]:
+    username = row.get("username")
+    if not isinstance(username, str) or not username:
+        raise ValueError("Row is missing 'username'")
+    profile = row.get("profile")
+    if not isinstance(profile, dict):
+        raise ValueError("Row is missing 'profile'")
+
+    return build_agent_doc(username, row.get("type"), profile, encoding)
+
+
+def validate_import_batch(
+    rows: list[tuple[int, bytes]], encoding: ProfileEncoding
+) -> tuple[list[tuple[int, dict[str, Any]]], list[dict[str, Any]]]:
+    docs = []
+    errors = []
+    for line, raw in rows:
+        row: dict[str, Any] = {}
+        try:
+            row = _load_import_row(raw)
+            docs.append((line, _build_import_doc(row, encoding)))
+        except ValueError as e:
+            username = row.get("username")
+            errors.append(
+                {
+                    "line": line,
+                    "username": username if isinstance(username, str) else None,
+                    "error": str(e),
+                }
+            )
+    return docs, errors
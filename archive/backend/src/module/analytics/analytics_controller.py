@@ -0,0 +1,123 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from src.common.utils.response import Response, Status
+from src.module.analytics.analytics_dependency import get_analytics_service
+from src.module.analytics.analytics_schema import (
+    DecisionPeriod,
+    LeaderboardEntry,
+    MatchOverview,
+    RecruiterTopCandidates,
+    ScoreBucket,
+)
+from src.module.analytics.analytics_service import AnalyticsService, TimeWindow
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("/matches", response_model=MatchOverview)
+async def get_match_overview(
+    since: datetime | None = Query(None),
+    leaderboard_size: int = Query(5, ge=1, le=50),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    try:
+        result = await analytics_service.get_overview(
+            since=since, leaderboard_size=leaderboard_size
+        )
+        return Response.success(
+            message="Match overview retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve match overview: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
+@router.get("/matches/histogram", response_model=list[ScoreBucket])
+async def get_score_histogram(
+    recruiter_id: str | None = Query(None),
+    since: datetime | None = Query(None),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    try:
+        result = await analytics_service.get_score_histogram(
+            recruiter_id=recruiter_id, since=since
+        )
+        return Response.success(
+            message="Score histogram retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve score histogram: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
+@router.get("/matches/top-candidates", response_model=list[RecruiterTopCandidates])
+async def get_top_candidates(
+    recruiter_id: str | None = Query(None),
+    limit: int = Query(5, ge=1, le=50),
+    since: datetime | None = Query(None),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    try:
+        result = await analytics_service.get_top_candidates(
+            recruiter_id=recruiter_id, limit=limit, since=since
+        )
+        return Response.success(
+            message="Top candidates retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve top candidates: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
+@router.get("/matches/decisions", response_model=list[DecisionPeriod])
+async def get_decisions_over_time(
+    window: TimeWindow = Query("day"),
+    since: datetime | None = Query(None),
+    recruiter_id: str | None = Query(None),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    try:
+        result = await analytics_service.get_decisions_over_time(
+            window=window, since=since, recruiter_id=recruiter_id
+        )
+        return Response.success(
+            message="Decision counts retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve decision counts: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
+@router.get("/matches/leaderboard", response_model=list[LeaderboardEntry])
+async def get_candidate_leaderboard(
+    limit: int = Query(10, ge=1, le=100),
+    min_matches: int = Query(1, ge=1),
+    since: datetime | None = Query(None),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    try:
+        result = await analytics_service.get_candidate_leaderboard(
+            limit=limit, min_matches=min_matches, since=since
+        )
+        return Response.success(
+            message="Candidate leaderboard retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve candidate leaderboard: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
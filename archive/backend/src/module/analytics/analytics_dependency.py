@@ -0,0 +1,10 @@
+from fastapi import Depends
+from src.database.db_dependency import get_mongodb_client
+from src.database.mongodb.mongodb_client import MongoDBClient
+from src.module.analytics.analytics_service import AnalyticsService
+
+
+def get_analytics_service(
+    mongodb_client: MongoDBClient = Depends(get_mongodb_client),
+) -> AnalyticsService:
+    return AnalyticsService(mongodb_client=mongodb_client)
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ScoreBucket(BaseModel):
+    score: int = Field(..., description="Match score 1-10")
+    count: int = Field(..., description="Matches with this score")
+
+
+class DecisionCount(BaseModel):
+    decision: Optional[str] = Field(None, description="GOOD FIT or NOT A FIT")
+    count: int = Field(..., description="Matches with this decision")
+
+
+class RankedCandidate(BaseModel):
+    candidate_id: str = Field(..., description="Candidate agent ID")
+    candidate_name: str = Field(..., description="Candidate name")
+    conversation_id: str = Field(
+        ..., description="Conversation that produced the match"
+    )
+    score: int = Field(..., description="Match score 1-10")
+    decision: str = Field(..., description="GOOD FIT or NOT A FIT")
+
+
+class RecruiterTopCandidates(BaseModel):
+    recruiter_id: str = Field(..., description="Recruiter agent ID")
+    recruiter_name: str = Field(..., description="Recruiter name")
+    candidates: list[RankedCandidate] = Field(
+        ..., description="Highest scoring candidates, best first"
+    )
+
+
+class DecisionPeriod(BaseModel):
+    period_start: str = Field(..., description="ISO format start of the time window")
+    total: int = Field(..., description="Matches in the window")
+    decisions: list[DecisionCount] = Field(..., description="Counts per decision")
+
+
+class LeaderboardEntry(BaseModel):
+    candidate_id: str = Field(..., description="Candidate agent ID")
+    candidate_name: str = Field(..., description="Candidate name")
+    matches: int = Field(..., description="Matches for the candidate")
+    good_fits: int = Field(..., description="Matches decided as GOOD FIT")
+    average_score: float = Field(..., description="Average match score")
+    best_score: int = Field(..., description="Best match score")
+
+
+class MatchOverview(BaseModel):
+    matches: int = Field(..., description="Total matches")
+    average_score: Optional[float] = Field(None, description="Average match score")
+    recruiters: int = Field(..., description="Recruiters with at least one match")
+    candidates: int = Field(..., description="Candidates with at least one match")
+    score_histogram: list[ScoreBucket] = Field(..., description="Matches per score")
+    decisions: list[DecisionCount] = Field(..., description="Matches per decision")
+    leaderboard: list[LeaderboardEntry] = Field(..., description="Top candidates")
@@ -0,0 +1,275 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from src.database.mongodb.mongodb_client import MongoDBClient
+
+TimeWindow = Literal["hour", "day", "week", "month"]
+
+GOOD_FIT = "GOOD FIT"
+
+
+class AnalyticsService:
+    def __init__(self, mongodb_client: MongoDBClient):
+        self.mongodb_client = mongodb_client
+
+    def _match_stage(
+        self,
+        recruiter_id: str | None = None,
+        candidate_id: str | None = None,
+        since: datetime | None = None,
+    ) -> dict[str, Any]:
+        query: dict[str, Any] = {}
+        if recruiter_id:
+            query["recruiter_id"] = recruiter_id
+        if candidate_id:
+            query["candidate_id"] = candidate_id
+        if since:
+            query["created_at"] = {"$gte": since}
+        return {"$match": query}
+
+    def _histogram_stages(self) -> list[dict[str, Any]]:
+        return [
+            {"$group": {"_id": "$score", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+            {"$project": {"_id": 0, "score": "$_id", "count": 1}},
+        ]
+
+    def _decision_stages(self) -> list[dict[str, Any]]:
+        return [
+            {"$group": {"_id": "$decision", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}},
+            {"$project": {"_id": 0, "decision": "$_id", "count": 1}},
+        ]
+
+    def _leaderboard_stages(self, limit: int, min_matches: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "$group": {
+                    "_id": "$candidate_id",
+                    "candidate_name": {
+                        "$top": {
+                            "sortBy": {"created_at": -1},
+                            "output": "$candidate_name",
+                        }
+                    },
+                    "matches": {"$sum": 1},
+                    "good_fits": {
+                        "$sum": {"$cond": [{"$eq": ["$decision", GOOD_FIT]}, 1, 0]}
+                    },
+                    "average_score": {"$avg": "$score"},
+                    "best_score": {"$max": "$score"},
+                }
+            },
+            {"$match": {"matches": {"$gte": min_matches}}},
+            {"$sort": {"average_score": -1, "good_fits": -1, "matches": -1}},
+            {"$limit": limit},
+            {
+                "$project": {
+                    "_id": 0,
+                    "candidate_id": "$_id",
+                    "candidate_name": 1,
+                    "matches": 1,
+                    "good_fits": 1,
+                    "average_score": {"$round": ["$average_score", 2]},
+                    "best_score": 1,
+                }
+            },
+        ]
+
+    async def _aggregate(self, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        cursor = self.mongodb_client.matches.aggregate(pipeline)
+        return await cursor.to_list(length=None)
+
+    async def get_score_histogram(
+        self, recruiter_id: str | None = None, since: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        buckets = await self._aggregate(
+            [self._match_stage(recruiter_id=recruiter_id, since=since)]
+            + self._histogram_stages()
+        )
+        counts = {bucket["score"]: bucket["count"] for bucket in buckets}
+        return [
+            {"score": score, "count": counts.get(score, 0)} for score in range(1, 11)
+        ]
+
+    async def get_top_candidates(
+        self,
+        recruiter_id: str | None = None,
+        limit: int = 5,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._aggregate(
+            [
+                self._match_stage(recruiter_id=recruiter_id, since=since),
+                # Best match per candidate first, so a candidate is listed once
+                {
+                    "$group": {
+                        "_id": {
+                            "recruiter_id": "$recruiter_id",
+                            "candidate_id": "$candidate_id",
+                        },
+                        "recruiter_name": {
+                            "$top": {
+                                "sortBy": {"created_at": -1},
+                                "output": "$recruiter_name",
+                            }
+                        },
+                        "candidate_name": {
+                            "$top": {
+                                "sortBy": {"created_at": -1},
+                                "output": "$candidate_name",
+                            }
+                        },
+                        "best": {
+                            "$top": {
+                                "sortBy": {"score": -1, "created_at": -1},
+                                "output": {
+                                    "conversation_id": "$conversation_id",
+                                    "score": "$score",
+                                    "decision": "$decision",
+                                    "created_at": "$created_at",
+                                },
+                            }
+                        },
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": "$_id.recruiter_id",
+                        "recruiter_name": {
+                            "$top": {
+                                "sortBy": {"best.created_at": -1},
+                                "output": "$recruiter_name",
+                            }
+                        },
+                        "candidates": {
+                            "$topN": {
+                                "n": limit,
+                                "sortBy": {"best.score": -1, "best.created_at": -1},
+                                "output": {
+                                    "candidate_id": "$_id.candidate_id",
+                                    "candidate_name": "$candidate_name",
+                                    "conversation_id": "$best.conversation_id",
+                                    "score": "$best.score",
+                                    "decision": "$best.decision",
+                                },
+                            }
+                        },
+                    }
+                },
+                {"$sort": {"recruiter_name": 1}},
+                {
+                    "$project": {
+                        "_id": 0,
+                        "recruiter_id": "$_id",
+                        "recruiter_name": 1,
+                        "candidates": 1,
+                    }
+                },
+            ]
+        )
+
+    async def get_decisions_over_time(
+        self,
+        window: TimeWindow = "day",
+        since: datetime | None = None,
+        recruiter_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        periods = await self._aggregate(
+            [
+                self._match_stage(recruiter_id=recruiter_id, since=since),
+                {
+                    "$group": {
+                        "_id": {
+                            "period": {
+                                "$dateTrunc": {"date": "$created_at", "unit": window}
+                            },
+                            "decision": "$decision",
+                        },
+                        "count": {"$sum": 1},
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": "$_id.period",
+                        "total": {"$sum": "$count"},
+                        "decisions": {
+                            "$push": {"decision": "$_id.decision", "count": "$count"}
+                        },
+                    }
+                },
+                {"$sort": {"_id": 1}},
+                {
+                    "$project": {
+                        "_id": 0,
+                        "period_start": "$_id",
+                        "total": 1,
+                        "decisions": 1,
+                    }
+                },
+            ]
+        )
+        for period in periods:
+            period["period_start"] = period["period_start"].isoformat()
+        return periods
+
+    async def get_candidate_leaderboard(
+        self, limit: int = 10, min_matches: int = 1, since: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        return await self._aggregate(
+            [self._match_stage(since=since)]
+            + self._leaderboard_stages(limit, min_matches)
+        )
+
+    async def get_overview(
+        self, since: datetime | None = None, leaderboard_size: int = 5
+    ) -> dict[str, Any]:
+        results = await self._aggregate(
+            [
+                self._match_stage(since=since),
+                {
+                    "$facet": {
+                        "totals": [
+                            {
+                                "$group": {
+                                    "_id": None,
+                                    "matches": {"$sum": 1},
+                                    "average_score": {"$avg": "$score"},
+                                }
+                            },
+                            {
+                                "$project": {
+                                    "_id": 0,
+                                    "matches": 1,
+                                    "average_score": {"$round": ["$average_score", 2]},
+                                }
+                            },
+                        ],
+                        "recruiters": [
+                            {"$group": {"_id": "$recruiter_id"}},
+                            {"$count": "count"},
+                        ],
+                        "candidates": [
+                            {"$group": {"_id": "$candidate_id"}},
+                            {"$count": "count"},
+                        ],
+                        "score_histogram": self._histogram_stages(),
+                        "decisions": self._decision_stages(),
+                        "leaderboard": self._leaderboard_stages(leaderboard_size, 1),
+                    }
+                },
+            ]
+        )
+
+        facets = results[0] if results else {}
+        totals = (facets.get("totals") or [{"matches": 0, "average_score": None}])[0]
+        recruiters = facets.get("recruiters") or [{"count": 0}]
+        candidates = facets.get("candidates") or [{"count": 0}]
+        return {
+            **totals,
+            "recruiters": recruiters[0]["count"],
+            "candidates": candidates[0]["count"],
+            "score_histogram": facets.get("score_histogram", []),
+            "decisions": facets.get("decisions", []),
+            "leaderboard": facets.get("leaderboard", []),
+        }
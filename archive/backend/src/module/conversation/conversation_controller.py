@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from src.common.logger import logger
+from src.common.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.common.utils.response import Response, Status
+from src.core.tracing.tracer import tracer
 from src.module.conversation.conversation_dependency import get_conversation_service
 from src.module.conversation.conversation_schema import (
-    ConversationListItem,
+    AgentSummary,
+    ConversationPage,
     ConversationResult,
-    MatchResult,
+    MatchPage,
     StartConversationRequest,
 )
 from src.module.conversation.conversation_service import ConversationService
@@ -49,23 +52,13 @@ async def conversation_websocket(websocket: WebSocket, conversation_id: str):
     conversation_service = get_conversation_service()
 
     try:
-        async for turn in conversation_service.run_conversation_stream(conversation_id):
-            await websocket.send_json(
-                {
-                    "type": "turn",
-                    "data": {
-                        "role": turn.role,
-                        "speaker_name": turn.speaker_name,
-                        "content": turn.content,
-                        "timestamp": turn.timestamp,
-                        "is_final": turn.is_final,
-                        "final_evaluation": turn.final_evaluation,
-                    },
-                }
-            )
-
-        await websocket.send_json({"type": "complete"})
-        logger.info(f"Conversation {conversation_id} completed via WebSocket")
+        async for event in conversation_service.subscribe(conversation_id):
+            with tracer.span(
+                "websocket.send", trace_id=conversation_id, event_type=event["type"]
+            ):
+                await websocket.send_json(event)
+
+        logger.info(f"Conversation {conversation_id} stream ended via WebSocket")
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for conversation {conversation_id}")
@@ -78,16 +71,25 @@ async def conversation_websocket(websocket: WebSocket, conversation_id: str):
         await websocket.close()
 
 
-@router.get("", response_model=list[ConversationListItem])
+@router.get("", response_model=ConversationPage)
 async def get_all_conversations(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ):
     try:
-        result = await conversation_service.get_all_conversations()
+        result = await conversation_service.get_all_conversations(
+            limit=limit, cursor=cursor
+        )
         return Response.success(
             message="Conversations retrieved successfully",
             data=result,
         )
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.BAD_REQUEST,
+        )
     except Exception as e:
         return Response.error(
             message=f"Failed to retrieve conversations: {str(e)}",
@@ -95,17 +97,37 @@ async def get_all_conversations(
         )
 
 
-@router.get("/matches", response_model=list[MatchResult])
+@router.get("/export")
+async def export_conversations(
+    agent_id: str | None = Query(None),
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    return Response.ndjson(
+        conversation_service.export_conversations(agent_id=agent_id),
+        filename="conversations.ndjson",
+    )
+
+
+@router.get("/matches", response_model=MatchPage)
 async def get_matches(
     min_score: int | None = Query(None, ge=1, le=10),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ):
     try:
-        result = await conversation_service.get_matches(min_score=min_score)
+        result = await conversation_service.get_matches(
+            min_score=min_score, limit=limit, cursor=cursor
+        )
         return Response.success(
             message="Matches retrieved successfully",
             data=result,
         )
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.BAD_REQUEST,
+        )
     except Exception as e:
         return Response.error(
             message=f"Failed to retrieve matches: {str(e)}",
@@ -113,6 +135,54 @@ async def get_matches(
         )
 
 
+@router.get("/matches/export")
+async def export_matches(
+    min_score: int | None = Query(None, ge=1, le=10),
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    return Response.ndjson(
+        conversation_service.export_matches(min_score=min_score),
+        filename="matches.ndjson",
+    )
+
+
+@router.get("/llm/stats")
+async def get_llm_stats(
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    return Response.success(
+        message="LLM stats retrieved successfully",
+        data=conversation_service.get_llm_stats(),
+    )
+
+
+@router.get("/llm/context-cache")
+async def get_context_cache_stats(
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    return Response.success(
+        message="Context cache stats retrieved successfully",
+        data=conversation_service.get_context_cache_stats(),
+    )
+
+
+@router.post("/summaries/rebuild")
+async def rebuild_agent_summaries(
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    try:
+        count = await conversation_service.rebuild_agent_summaries()
+        return Response.success(
+            message=f"Rebuilt summaries for {count} agents",
+            data={"rebuilt_count": count},
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to rebuild agent summaries: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
+
+
 @router.get("/{conversation_id}", response_model=ConversationResult)
 async def get_conversation(
     conversation_id: str,
@@ -136,19 +206,46 @@ async def get_conversation(
         )
 
 
-@router.get("/agent/{agent_id}", response_model=list[ConversationListItem])
+@router.get("/agent/{agent_id}", response_model=ConversationPage)
 async def get_conversations_for_agent(
     agent_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ):
     try:
-        result = await conversation_service.get_conversations_for_agent(agent_id)
+        result = await conversation_service.get_conversations_for_agent(
+            agent_id, limit=limit, cursor=cursor
+        )
         return Response.success(
             message="Conversations retrieved successfully",
             data=result,
         )
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.BAD_REQUEST,
+        )
     except Exception as e:
         return Response.error(
             message=f"Failed to retrieve conversations: {str(e)}",
             status_code=Status.INTERNAL_SERVER_ERROR,
         )
+
+
+@router.get("/agent/{agent_id}/summary", response_model=AgentSummary)
+async def get_agent_summary(
+    agent_id: str,
+    conversation_service: ConversationService = Depends(get_conversation_service),
+):
+    try:
+        result = await conversation_service.get_agent_summary(agent_id)
+        return Response.success(
+            message="Agent summary retrieved successfully",
+            data=result,
+        )
+    except Exception as e:
+        return Response.error(
+            message=f"Failed to retrieve agent summary: {str(e)}",
+            status_code=Status.INTERNAL_SERVER_ERROR,
+        )
@@ -1,3 +1,5 @@
+from src.core.broker.conversation_broker import conversation_broker
+from src.core.cache.agent_cache import agent_cache
 from src.database.mongodb.mongodb_client import mongodb_client
 from src.module.conversation.conversation_service import ConversationService
 
@@ -7,5 +9,7 @@ _conversation_service: ConversationService | None = None
 def get_conversation_service() -> ConversationService:
     global _conversation_service
     if _conversation_service is None:
-        _conversation_service = ConversationService(mongodb_client)
+        _conversation_service = ConversationService(
+            mongodb_client, conversation_broker, agent_cache
+        )
     return _conversation_service
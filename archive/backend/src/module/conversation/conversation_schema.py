@@ -34,6 +34,16 @@ class ConversationTurnResponse(BaseModel):
     )
 
 
+class LLMUsage(BaseModel):
+    calls: int = Field(..., description="LLM calls made for the conversation")
+    cached_calls: int = Field(..., description="Calls served from a cached prefix")
+    input_tokens: int = Field(..., description="Estimated input tokens")
+    cached_tokens: int = Field(..., description="Input tokens read from the cache")
+    cached_token_ratio: float = Field(
+        ..., description="Share of input tokens read from the cache"
+    )
+
+
 class ConversationResult(BaseModel):
     conversation_id: str = Field(..., description="Conversation document ID")
     recruiter: ConversationParticipant = Field(..., description="Recruiter participant")
@@ -44,13 +54,16 @@ class ConversationResult(BaseModel):
     final_evaluation: str = Field(..., description="Final evaluation from recruiter")
     match_score: Optional[int] = Field(None, description="Match score 1-10")
     decision: Optional[str] = Field(None, description="GOOD FIT or NOT A FIT")
-    status: Literal["in_progress", "completed"] = Field(
+    status: Literal["in_progress", "completed", "abandoned"] = Field(
         ..., description="Conversation status"
     )
     created_at: str = Field(..., description="ISO format timestamp")
     completed_at: Optional[str] = Field(
         None, description="ISO format timestamp of completion"
     )
+    llm_usage: Optional[LLMUsage] = Field(
+        None, description="Context cache usage, when caching is enabled"
+    )
 
 
 class ConversationListItem(BaseModel):
@@ -73,3 +86,42 @@ class MatchResult(BaseModel):
     score: int = Field(..., description="Match score 1-10")
     decision: str = Field(..., description="GOOD FIT or NOT A FIT")
     created_at: str = Field(..., description="ISO format timestamp")
+
+
+class ConversationPage(BaseModel):
+    items: list[ConversationListItem] = Field(
+        ..., description="Conversations on this page"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+
+
+class MatchPage(BaseModel):
+    items: list[MatchResult] = Field(..., description="Matches on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+
+
+class BestMatch(BaseModel):
+    conversation_id: str = Field(..., description="Conversation of the best match")
+    counterpart_id: str = Field(..., description="Agent ID on the other side")
+    counterpart_name: str = Field(..., description="Agent name on the other side")
+    score: int = Field(..., description="Match score 1-10")
+    decision: str = Field(..., description="GOOD FIT or NOT A FIT")
+
+
+class AgentSummary(BaseModel):
+    agent_id: str = Field(..., description="Agent document ID")
+    conversations_started: int = Field(..., description="Conversations started")
+    conversations_completed: int = Field(..., description="Conversations completed")
+    matches: int = Field(..., description="Matches recorded")
+    good_fits: int = Field(..., description="Matches decided as GOOD FIT")
+    best_match: Optional[BestMatch] = Field(None, description="Highest scoring match")
+    last_activity_at: Optional[str] = Field(
+        None, description="ISO format timestamp of the latest activity"
+    )
+    recent_conversation_ids: list[str] = Field(
+        ..., description="Most recent conversations, newest first"
+    )
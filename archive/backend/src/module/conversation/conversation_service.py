@@ -1,31 +1,156 @@
-from datetime import datetime
-from typing import Any, AsyncGenerator
+import asyncio
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, AsyncIterator
 
 from bson import ObjectId
 from langchain_google_genai import ChatGoogleGenerativeAI
+from pymongo import ReturnDocument
 from src.common.config import settings
 from src.common.logger import logger
+from src.common.utils.pagination import DEFAULT_PAGE_SIZE, iterate, paginate
 from src.core.agents.candidate_agent import CandidateAgent
 from src.core.agents.orchestrator import ConversationOrchestrator, ConversationTurn
+from src.core.agents.prompts import load_system_prompt
 from src.core.agents.recruiter_agent import RecruiterAgent
+from src.core.broker.conversation_broker import ConversationBroker
+from src.core.cache.agent_cache import AgentCache
+from src.core.llm.context_cache import (
+    ContextCachedLLM,
+    context_cache,
+    current_conversation_id,
+)
+from src.core.llm.hedged_llm import HedgedLLM
+from src.core.metrics.registry import metrics
+from src.core.tracing.tracer import tracer
 from src.database.mongodb.mongodb_client import MongoDBClient
 
+LIST_ITEM_PROJECTION = {
+    "recruiter.name": 1,
+    "candidate.name": 1,
+    "match_score": 1,
+    "decision": 1,
+    "status": 1,
+    "created_at": 1,
+}
+
+RECENT_CONVERSATIONS_PER_AGENT = 20
+
+CONVERSATIONS_ACTIVE = metrics.gauge(
+    "conversations_active", "Conversations with a running orchestrator"
+)
+CONVERSATION_PRODUCERS = metrics.gauge(
+    "conversation_producers", "Background tasks producing conversation turns"
+)
+WEBSOCKET_SUBSCRIBERS = metrics.gauge(
+    "websocket_subscribers", "Open WebSocket subscriptions", ("channel",)
+)
+WEBSOCKET_QUEUE_DEPTH = metrics.gauge(
+    "websocket_queue_depth", "Frames waiting in subscriber queues", ("channel",)
+)
+
+MATCH_PROJECTION = {
+    "conversation_id": 1,
+    "recruiter_id": 1,
+    "candidate_id": 1,
+    "recruiter_name": 1,
+    "candidate_name": 1,
+    "score": 1,
+    "decision": 1,
+    "created_at": 1,
+}
+
 
 class ConversationService:
-    def __init__(self, mongodb_client: MongoDBClient):
+    def __init__(
+        self,
+        mongodb_client: MongoDBClient,
+        broker: ConversationBroker | None = None,
+        agent_cache: AgentCache | None = None,
+    ):
         self.mongodb_client = mongodb_client
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
+        self.broker = broker or ConversationBroker()
+        self.agent_cache = agent_cache or AgentCache(mongodb_client)
+        primary_llm = self._create_llm(settings.LLM_MODEL)
+        fallback_llm = (
+            self._create_llm(settings.LLM_FALLBACK_MODEL)
+            if settings.LLM_FALLBACK_MODEL
+            else None
+        )
+        self.recruiter_llm = self._create_hedged_llm(
+            "recruiter", primary_llm, fallback_llm
+        )
+        self.candidate_llm = self._create_hedged_llm(
+            "candidate", primary_llm, fallback_llm
+        )
+        self.active_conversations: dict[str, ConversationOrchestrator] = {}
+        self._producers: dict[str, asyncio.Task] = {}
+        self._background_tasks: set[asyncio.Task] = set()
+        self._maintenance_tasks: list[asyncio.Task] = []
+        # Identifies this replica as the owner of the conversations it runs
+        self.instance_id = uuid.uuid4().hex
+        self._register_metrics()
+
+    def _register_metrics(self):
+        CONVERSATIONS_ACTIVE.add_collector(
+            "conversation", lambda: {(): len(self.active_conversations)}
+        )
+        CONVERSATION_PRODUCERS.add_collector(
+            "conversation", lambda: {(): len(self._producers)}
+        )
+        WEBSOCKET_SUBSCRIBERS.add_collector(
+            "conversation",
+            lambda: {("conversation",): self.broker.subscriber_count()},
+        )
+        WEBSOCKET_QUEUE_DEPTH.add_collector(
+            "conversation", lambda: {("conversation",): self.broker.queue_depth()}
+        )
+
+    def _create_llm(self, model: str) -> ChatGoogleGenerativeAI | ContextCachedLLM:
+        llm = ChatGoogleGenerativeAI(
+            model=model,
             google_api_key=settings.GEMINI_API_KEY,
             temperature=0.8,
         )
-        self.active_conversations: dict[str, ConversationOrchestrator] = {}
+        if context_cache is None:
+            return llm
+        # Cached contents are bound to one model, so primary and fallback each get one
+        return ContextCachedLLM(llm, context_cache, model)
+
+    def _create_hedged_llm(
+        self,
+        role: str,
+        primary_llm: ChatGoogleGenerativeAI | ContextCachedLLM,
+        fallback_llm: ChatGoogleGenerativeAI | ContextCachedLLM | None,
+    ) -> HedgedLLM:
+        return HedgedLLM(
+            primary_llm,
+            fallback_llm,
+            name=role,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            fallback_timeout=settings.LLM_FALLBACK_TIMEOUT_SECONDS,
+            hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+            hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+            hedge_initial_delay=settings.LLM_HEDGE_INITIAL_DELAY_SECONDS,
+        )
+
+    def get_llm_stats(self) -> list[dict[str, Any]]:
+        return [self.recruiter_llm.get_stats(), self.candidate_llm.get_stats()]
+
+    def get_context_cache_stats(self) -> dict[str, Any] | None:
+        if context_cache is None:
+            return None
+        return context_cache.get_stats()
+
+    def _conversation_llm_usage(self, conversation_id: str) -> dict[str, Any] | None:
+        if context_cache is None:
+            return None
+        return context_cache.conversation_usage(conversation_id)
 
     async def _get_agent(self, agent_id: str) -> dict[str, Any]:
         try:
-            agent = await self.mongodb_client.agents.find_one(
-                {"_id": ObjectId(agent_id)}
-            )
+            agent = await self.agent_cache.get(agent_id)
         except Exception:
             raise ValueError(f"Invalid agent ID format: {agent_id}")
 
@@ -59,6 +184,7 @@ class ConversationService:
             "match_score": None,
             "decision": None,
             "status": "in_progress",
+            "owner": self._owner(),
             "created_at": datetime.utcnow(),
             "completed_at": None,
         }
@@ -66,11 +192,16 @@ class ConversationService:
         result = await self.mongodb_client.conversations.insert_one(conversation_doc)
         conversation_id = str(result.inserted_id)
 
-        recruiter_agent = RecruiterAgent(recruiter_doc["profile"], self.llm)
-        candidate_agent = CandidateAgent(candidate_doc["profile"], self.llm)
-        orchestrator = ConversationOrchestrator(recruiter_agent, candidate_agent)
+        await self._update_agent_summaries(
+            [recruiter_id, candidate_id],
+            conversation_id,
+            conversation_doc["created_at"],
+            {"conversations_started": 1},
+        )
 
-        self.active_conversations[conversation_id] = orchestrator
+        self.active_conversations[conversation_id] = self._build_orchestrator(
+            recruiter_doc, candidate_doc
+        )
 
         logger.info(
             f"Started conversation {conversation_id} between {recruiter_doc['name']} and {candidate_doc['name']}"
@@ -92,6 +223,58 @@ class ConversationService:
             "created_at": conversation_doc["created_at"].isoformat(),
         }
 
+    def _load_system_prompt(self, agent_doc: dict[str, Any]) -> str:
+        system_prompt, recompiled = load_system_prompt(
+            agent_doc, settings.PROMPT_PROFILE_ENCODING
+        )
+        if recompiled:
+            # Agents from before prompt compilation, or after a template change
+            task = asyncio.create_task(self._store_prompt(agent_doc))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        return system_prompt
+
+    async def _store_prompt(self, agent_doc: dict[str, Any]):
+        try:
+            prompt = agent_doc["prompt"]
+            # Never overwrite a prompt that an agent update compiled in the meantime
+            await self.mongodb_client.agents.update_one(
+                {
+                    "_id": agent_doc["_id"],
+                    "type": agent_doc["type"],
+                    "profile": agent_doc["profile"],
+                    "prompt.version": {"$ne": prompt["version"]},
+                },
+                {"$set": {"prompt": prompt}},
+            )
+            self.agent_cache.invalidate(str(agent_doc["_id"]))
+        except Exception as e:
+            logger.error(f"Failed to store compiled prompt for {agent_doc['_id']}: {e}")
+
+    def _build_orchestrator(
+        self,
+        recruiter_doc: dict[str, Any],
+        candidate_doc: dict[str, Any],
+        checkpoint: dict[str, Any] | None = None,
+    ) -> ConversationOrchestrator:
+        recruiter_agent = RecruiterAgent(
+            recruiter_doc["profile"],
+            self.recruiter_llm,
+            self._load_system_prompt(recruiter_doc),
+        )
+        candidate_agent = CandidateAgent(
+            candidate_doc["profile"],
+            self.candidate_llm,
+            self._load_system_prompt(candidate_doc),
+        )
+        checkpoint = checkpoint or {}
+        return ConversationOrchestrator(
+            recruiter_agent,
+            candidate_agent,
+            conversation_history=checkpoint.get("conversation_history"),
+            turn_count=checkpoint.get("turn_count", 0),
+        )
+
     async def run_conversation_stream(
         self, conversation_id: str, max_turns: int = 12
     ) -> AsyncGenerator[ConversationTurn, None]:
@@ -111,32 +294,73 @@ class ConversationService:
                 "timestamp": turn.timestamp,
             }
 
-            await self.mongodb_client.conversations.update_one(
-                {"_id": ObjectId(conversation_id)},
-                {"$push": {"messages": message_doc}},
-            )
-
-            if turn.is_final and turn.final_evaluation:
-                final_evaluation = turn.final_evaluation
-                match_score, decision = self._parse_evaluation(final_evaluation)
-
+            checkpointed_at = datetime.utcnow()
+            with tracer.span(
+                "mongo.append_message", collection="conversations", role=turn.role
+            ):
                 await self.mongodb_client.conversations.update_one(
                     {"_id": ObjectId(conversation_id)},
                     {
+                        "$push": {"messages": message_doc},
                         "$set": {
-                            "final_evaluation": final_evaluation,
-                            "match_score": match_score,
-                            "decision": decision,
-                            "status": "completed",
-                            "completed_at": datetime.utcnow(),
-                        }
+                            "checkpoint.conversation_history": orchestrator.conversation_history,
+                            "checkpoint.turn_count": orchestrator.turn_count,
+                            "checkpoint.updated_at": checkpointed_at,
+                            # Progress was made, so earlier resumes no longer count
+                            "checkpoint.resume_count": 0,
+                            "owner.heartbeat_at": checkpointed_at,
+                        },
                     },
                 )
 
-                if match_score and decision:
-                    await self._create_match(
-                        conversation_id, match_score, decision, orchestrator
+            if turn.is_final and turn.final_evaluation:
+                final_evaluation = turn.final_evaluation
+                match_score, decision = self._parse_evaluation(final_evaluation)
+
+                completed_at = datetime.utcnow()
+                completion = {
+                    "final_evaluation": final_evaluation,
+                    "match_score": match_score,
+                    "decision": decision,
+                    "status": "completed",
+                    "completed_at": completed_at,
+                }
+                llm_usage = self._conversation_llm_usage(conversation_id)
+                if llm_usage:
+                    completion["llm_usage"] = llm_usage
+
+                conversations = self.mongodb_client.conversations
+                with tracer.span(
+                    "mongo.complete_conversation", collection="conversations"
+                ):
+                    conversation = await conversations.find_one_and_update(
+                        {"_id": ObjectId(conversation_id)},
+                        {
+                            "$set": completion,
+                            "$unset": {"checkpoint": "", "owner": ""},
+                        },
+                        projection={"recruiter.agent_id": 1, "candidate.agent_id": 1},
+                        return_document=ReturnDocument.AFTER,
                     )
+                if conversation:
+                    with tracer.span(
+                        "mongo.update_agent_summaries", collection="agent_summaries"
+                    ):
+                        await self._update_agent_summaries(
+                            [
+                                conversation["recruiter"]["agent_id"],
+                                conversation["candidate"]["agent_id"],
+                            ],
+                            conversation_id,
+                            completed_at,
+                            {"conversations_completed": 1},
+                        )
+
+                if match_score and decision:
+                    with tracer.span("mongo.create_match", collection="matches"):
+                        await self._create_match(
+                            conversation_id, match_score, decision, orchestrator
+                        )
 
             yield turn
 
@@ -145,6 +369,203 @@ class ConversationService:
 
         logger.info(f"Conversation {conversation_id} completed")
 
+    async def start(self):
+        if self._maintenance_tasks:
+            return
+        self._maintenance_tasks.append(asyncio.create_task(self._heartbeat_loop()))
+        if settings.CONVERSATION_RESUME_ON_STARTUP:
+            self._maintenance_tasks.append(asyncio.create_task(self._resume_loop()))
+
+    async def stop(self):
+        for task in self._maintenance_tasks:
+            task.cancel()
+        for task in self._maintenance_tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._maintenance_tasks = []
+
+    def _owner(self) -> dict[str, Any]:
+        return {"id": self.instance_id, "heartbeat_at": datetime.utcnow()}
+
+    async def _heartbeat_loop(self):
+        # Conversations are live here even before a viewer starts streaming them
+        while True:
+            await asyncio.sleep(settings.CONVERSATION_HEARTBEAT_SECONDS)
+            try:
+                await self._heartbeat()
+            except Exception as e:
+                logger.error(f"Conversation heartbeat failed: {e}", exc_info=True)
+
+    async def _heartbeat(self):
+        if not self.active_conversations:
+            return
+        await self.mongodb_client.conversations.update_many(
+            {
+                "_id": {"$in": [ObjectId(cid) for cid in self.active_conversations]},
+                "owner.id": self.instance_id,
+            },
+            {"$set": {"owner.heartbeat_at": datetime.utcnow()}},
+        )
+
+    async def _resume_loop(self):
+        # Conversations that were still fresh at startup go stale later on
+        while True:
+            try:
+                await self.resume_stale_conversations()
+            except Exception as e:
+                logger.error(f"Stale conversation sweep failed: {e}", exc_info=True)
+            await asyncio.sleep(settings.CONVERSATION_RESUME_INTERVAL_SECONDS)
+
+    async def resume_stale_conversations(self) -> dict[str, int]:
+        cutoff = datetime.utcnow() - timedelta(
+            seconds=settings.CONVERSATION_STALE_SECONDS
+        )
+        cursor = self.mongodb_client.conversations.find(
+            {
+                "status": "in_progress",
+                "$or": [
+                    {"owner.heartbeat_at": {"$lt": cutoff}},
+                    {"owner": {"$exists": False}, "created_at": {"$lt": cutoff}},
+                ],
+            },
+            {
+                "messages": 1,
+                "recruiter": 1,
+                "candidate": 1,
+                "checkpoint": 1,
+                "owner": 1,
+            },
+        )
+
+        resumed = 0
+        finalized = 0
+        async for conversation in cursor:
+            conversation_id = str(conversation["_id"])
+            if conversation_id in self.active_conversations:
+                continue
+
+            if not await self._claim_stale_conversation(conversation):
+                continue
+
+            checkpoint = conversation.get("checkpoint") or {}
+            if checkpoint.get("resume_count", 0) >= settings.CONVERSATION_MAX_RESUMES:
+                await self._finalize_stale_conversation(
+                    conversation_id, "Resume limit reached"
+                )
+                finalized += 1
+                continue
+
+            try:
+                recruiter_doc = await self._get_agent(
+                    conversation["recruiter"]["agent_id"]
+                )
+                candidate_doc = await self._get_agent(
+                    conversation["candidate"]["agent_id"]
+                )
+            except ValueError as e:
+                await self._finalize_stale_conversation(conversation_id, str(e))
+                finalized += 1
+                continue
+
+            if "conversation_history" not in checkpoint:
+                checkpoint = self._checkpoint_from_messages(conversation["messages"])
+
+            self.active_conversations[conversation_id] = self._build_orchestrator(
+                recruiter_doc, candidate_doc, checkpoint
+            )
+            self.ensure_producer(conversation_id)
+            resumed += 1
+
+        if resumed or finalized:
+            logger.info(
+                f"Stale conversation sweep: resumed {resumed}, finalized {finalized}"
+            )
+
+        return {"resumed": resumed, "finalized": finalized}
+
+    async def _claim_stale_conversation(self, conversation: dict[str, Any]) -> bool:
+        # The owner stopped heartbeating. Only one replica wins the takeover,
+        # conversations from before owners were recorded have none.
+        owner = conversation.get("owner")
+        claim_filter: dict[str, Any] = {
+            "_id": conversation["_id"],
+            "status": "in_progress",
+        }
+        if owner:
+            claim_filter["owner.id"] = owner.get("id")
+            claim_filter["owner.heartbeat_at"] = owner.get("heartbeat_at")
+        else:
+            claim_filter["owner"] = {"$exists": False}
+
+        result = await self.mongodb_client.conversations.update_one(
+            claim_filter,
+            {
+                "$set": {"owner": self._owner()},
+                "$inc": {"checkpoint.resume_count": 1},
+            },
+        )
+        return result.modified_count == 1
+
+    def _checkpoint_from_messages(
+        self, messages: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        conversation_history = [
+            {"role": message["role"], "content": message["content"]}
+            for message in messages
+        ]
+        return {
+            "conversation_history": conversation_history,
+            "turn_count": len(
+                [msg for msg in conversation_history if msg["role"] == "candidate"]
+            ),
+        }
+
+    async def _finalize_stale_conversation(self, conversation_id: str, reason: str):
+        await self.mongodb_client.conversations.update_one(
+            {"_id": ObjectId(conversation_id)},
+            {
+                "$set": {"status": "abandoned", "completed_at": datetime.utcnow()},
+                "$unset": {"checkpoint": "", "owner": ""},
+            },
+        )
+        logger.warning(f"Finalized stale conversation {conversation_id}: {reason}")
+
+    def ensure_producer(self, conversation_id: str):
+        if conversation_id in self._producers or self.broker.has_topic(conversation_id):
+            return
+
+        if conversation_id not in self.active_conversations:
+            raise ValueError(f"No active conversation with id {conversation_id}")
+
+        self.broker.open(conversation_id)
+        task = asyncio.create_task(self._produce_conversation(conversation_id))
+        self._producers[conversation_id] = task
+        task.add_done_callback(lambda _: self._producers.pop(conversation_id, None))
+
+    def subscribe(
+        self, conversation_id: str, replay: bool = True
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        self.ensure_producer(conversation_id)
+        return self.broker.subscribe(conversation_id, replay=replay)
+
+    async def _produce_conversation(self, conversation_id: str):
+        current_conversation_id.set(conversation_id)
+        try:
+            with tracer.span("conversation.produce", trace_id=conversation_id):
+                async for turn in self.run_conversation_stream(conversation_id):
+                    await self.broker.publish(
+                        conversation_id, {"type": "turn", "data": asdict(turn)}
+                    )
+                await self.broker.publish(conversation_id, {"type": "complete"})
+        except Exception as e:
+            logger.error(f"Conversation {conversation_id} failed: {e}")
+            self.active_conversations.pop(conversation_id, None)
+            await self.broker.publish(
+                conversation_id, {"type": "error", "message": str(e)}
+            )
+
     def _parse_evaluation(self, evaluation: str) -> tuple[int | None, str | None]:
         score = None
         decision = None
@@ -189,10 +610,182 @@ class ConversationService:
         }
 
         await self.mongodb_client.matches.insert_one(match_doc)
+
+        await self._record_match_in_summaries(match_doc)
+
         logger.info(
             f"Created match for conversation {conversation_id}: {decision} ({score}/10)"
         )
 
+    async def _update_agent_summaries(
+        self,
+        agent_ids: list[str],
+        conversation_id: str,
+        activity_at: datetime,
+        counters: dict[str, int],
+        best_match: dict[str, Any] | None = None,
+    ):
+        # Pipeline update so counters, recency and best match change in one write
+        recent_ids = {
+            "$filter": {
+                "input": {"$ifNull": ["$recent_conversation_ids", []]},
+                "cond": {"$ne": ["$$this", conversation_id]},
+            }
+        }
+        stages: list[dict[str, Any]] = [
+            {
+                "$set": {
+                    **{
+                        field: {"$add": [{"$ifNull": [f"${field}", 0]}, amount]}
+                        for field, amount in counters.items()
+                    },
+                    "recent_conversation_ids": {
+                        "$slice": [
+                            {"$concatArrays": [[conversation_id], recent_ids]},
+                            RECENT_CONVERSATIONS_PER_AGENT,
+                        ]
+                    },
+                    "last_activity_at": {
+                        "$max": [
+                            {"$ifNull": ["$last_activity_at", activity_at]},
+                            activity_at,
+                        ]
+                    },
+                    "updated_at": datetime.utcnow(),
+                }
+            }
+        ]
+        if best_match:
+            stages.append(
+                {
+                    "$set": {
+                        "best_match": {
+                            "$cond": [
+                                {
+                                    "$gt": [
+                                        best_match["score"],
+                                        {"$ifNull": ["$best_match.score", 0]},
+                                    ]
+                                },
+                                {"$literal": best_match},
+                                "$best_match",
+                            ]
+                        }
+                    }
+                }
+            )
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.mongodb_client.agent_summaries.update_one(
+                        {"_id": agent_id}, stages, upsert=True
+                    )
+                    for agent_id in agent_ids
+                )
+            )
+        except Exception as e:
+            # The summary is derived data, rebuild_agent_summaries can repair it
+            logger.error(f"Failed to update agent summaries for {agent_ids}: {e}")
+
+    async def _record_match_in_summaries(
+        self, match: dict[str, Any], only: set[str] | None = None
+    ):
+        good_fits = 1 if match["decision"] == "GOOD FIT" else 0
+        pairs = (("recruiter", "candidate"), ("candidate", "recruiter"))
+        for role, counterpart in pairs:
+            if only is not None and match[f"{role}_id"] not in only:
+                continue
+            await self._update_agent_summaries(
+                [match[f"{role}_id"]],
+                match["conversation_id"],
+                match["created_at"],
+                {"matches": 1, "good_fits": good_fits},
+                best_match={
+                    "conversation_id": match["conversation_id"],
+                    "counterpart_id": match[f"{counterpart}_id"],
+                    "counterpart_name": match[f"{counterpart}_name"],
+                    "score": match["score"],
+                    "decision": match["decision"],
+                },
+            )
+
+    async def get_agent_summary(self, agent_id: str) -> dict[str, Any]:
+        summary = await self.mongodb_client.agent_summaries.find_one({"_id": agent_id})
+        summary = summary or {}
+        last_activity_at = summary.get("last_activity_at")
+        return {
+            "agent_id": agent_id,
+            "conversations_started": summary.get("conversations_started", 0),
+            "conversations_completed": summary.get("conversations_completed", 0),
+            "matches": summary.get("matches", 0),
+            "good_fits": summary.get("good_fits", 0),
+            "best_match": summary.get("best_match"),
+            "last_activity_at": (
+                last_activity_at.isoformat() if last_activity_at else None
+            ),
+            "recent_conversation_ids": summary.get("recent_conversation_ids", []),
+        }
+
+    async def rebuild_agent_summaries(self, agent_ids: list[str] | None = None) -> int:
+        # Scoped to agent_ids when given, their counterparts' summaries stay as is
+        only = set(agent_ids) if agent_ids is not None else None
+        if only is None:
+            summary_query: dict[str, Any] = {}
+            conversation_query: dict[str, Any] = {}
+            match_query: dict[str, Any] = {}
+        else:
+            ids = {"$in": list(only)}
+            summary_query = {"_id": ids}
+            conversation_query = {
+                "$or": [{"recruiter.agent_id": ids}, {"candidate.agent_id": ids}]
+            }
+            match_query = {"$or": [{"recruiter_id": ids}, {"candidate_id": ids}]}
+        await self.mongodb_client.agent_summaries.delete_many(summary_query)
+
+        rebuilt = set()
+        cursor = self.mongodb_client.conversations.find(
+            conversation_query,
+            {
+                "recruiter.agent_id": 1,
+                "candidate.agent_id": 1,
+                "status": 1,
+                "created_at": 1,
+                "completed_at": 1,
+            },
+        ).sort("created_at", 1)
+        async for conversation in cursor:
+            conversation_id = str(conversation["_id"])
+            participants = [
+                agent_id
+                for agent_id in (
+                    conversation["recruiter"]["agent_id"],
+                    conversation["candidate"]["agent_id"],
+                )
+                if only is None or agent_id in only
+            ]
+            rebuilt.update(participants)
+            await self._update_agent_summaries(
+                participants,
+                conversation_id,
+                conversation["created_at"],
+                {"conversations_started": 1},
+            )
+            if conversation["status"] == "completed":
+                await self._update_agent_summaries(
+                    participants,
+                    conversation_id,
+                    conversation["completed_at"] or conversation["created_at"],
+                    {"conversations_completed": 1},
+                )
+
+        cursor = self.mongodb_client.matches.find(match_query).sort("created_at", 1)
+        async for match in cursor:
+            await self._record_match_in_summaries(match, only)
+
+        logger.info(f"Rebuilt summaries for {len(rebuilt)} agents")
+        return len(rebuilt)
+
     async def get_conversation(self, conversation_id: str) -> dict[str, Any]:
         try:
             conversation = await self.mongodb_client.conversations.find_one(
@@ -227,69 +820,104 @@ class ConversationService:
                 if conversation["completed_at"]
                 else None
             ),
+            "llm_usage": conversation.get("llm_usage")
+            or self._conversation_llm_usage(conversation_id),
         }
 
-    async def get_all_conversations(self) -> list[dict[str, Any]]:
-        cursor = self.mongodb_client.conversations.find().sort("created_at", -1)
-        conversations = await cursor.to_list(length=None)
+    def _serialize_list_item(self, conversation: dict) -> dict[str, Any]:
+        return {
+            "conversation_id": str(conversation["_id"]),
+            "recruiter_name": conversation["recruiter"]["name"],
+            "candidate_name": conversation["candidate"]["name"],
+            "match_score": conversation["match_score"],
+            "decision": conversation["decision"],
+            "status": conversation["status"],
+            "created_at": conversation["created_at"].isoformat(),
+        }
 
-        return [
-            {
-                "conversation_id": str(conv["_id"]),
-                "recruiter_name": conv["recruiter"]["name"],
-                "candidate_name": conv["candidate"]["name"],
-                "match_score": conv["match_score"],
-                "decision": conv["decision"],
-                "status": conv["status"],
-                "created_at": conv["created_at"].isoformat(),
-            }
-            for conv in conversations
-        ]
+    def _serialize_match(self, match: dict) -> dict[str, Any]:
+        return {
+            "match_id": str(match["_id"]),
+            "conversation_id": match["conversation_id"],
+            "recruiter_id": match["recruiter_id"],
+            "candidate_id": match["candidate_id"],
+            "recruiter_name": match["recruiter_name"],
+            "candidate_name": match["candidate_name"],
+            "score": match["score"],
+            "decision": match["decision"],
+            "created_at": match["created_at"].isoformat(),
+        }
 
-    async def get_conversations_for_agent(self, agent_id: str) -> list[dict[str, Any]]:
-        cursor = self.mongodb_client.conversations.find(
-            {
-                "$or": [
-                    {"recruiter.agent_id": agent_id},
-                    {"candidate.agent_id": agent_id},
-                ]
-            }
-        ).sort("created_at", -1)
+    def _agent_query(self, agent_id: str | None) -> dict[str, Any]:
+        if agent_id is None:
+            return {}
+        return {
+            "$or": [
+                {"recruiter.agent_id": agent_id},
+                {"candidate.agent_id": agent_id},
+            ]
+        }
 
-        conversations = await cursor.to_list(length=None)
+    def _matches_query(self, min_score: int | None) -> dict[str, Any]:
+        if min_score:
+            return {"score": {"$gte": min_score}}
+        return {}
 
-        return [
-            {
-                "conversation_id": str(conv["_id"]),
-                "recruiter_name": conv["recruiter"]["name"],
-                "candidate_name": conv["candidate"]["name"],
-                "match_score": conv["match_score"],
-                "decision": conv["decision"],
-                "status": conv["status"],
-                "created_at": conv["created_at"].isoformat(),
-            }
-            for conv in conversations
-        ]
+    async def get_all_conversations(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> dict[str, Any]:
+        return await paginate(
+            self.mongodb_client.conversations,
+            {},
+            LIST_ITEM_PROJECTION,
+            self._serialize_list_item,
+            limit=limit,
+            cursor=cursor,
+        )
 
-    async def get_matches(self, min_score: int | None = None) -> list[dict[str, Any]]:
-        query = {}
-        if min_score:
-            query["score"] = {"$gte": min_score}
+    async def get_conversations_for_agent(
+        self, agent_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> dict[str, Any]:
+        return await paginate(
+            self.mongodb_client.conversations,
+            self._agent_query(agent_id),
+            LIST_ITEM_PROJECTION,
+            self._serialize_list_item,
+            limit=limit,
+            cursor=cursor,
+        )
 
-        cursor = self.mongodb_client.matches.find(query).sort("created_at", -1)
-        matches = await cursor.to_list(length=None)
+    def export_conversations(
+        self, agent_id: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        return iterate(
+            self.mongodb_client.conversations,
+            self._agent_query(agent_id),
+            LIST_ITEM_PROJECTION,
+            self._serialize_list_item,
+        )
 
-        return [
-            {
-                "match_id": str(match["_id"]),
-                "conversation_id": match["conversation_id"],
-                "recruiter_id": match["recruiter_id"],
-                "candidate_id": match["candidate_id"],
-                "recruiter_name": match["recruiter_name"],
-                "candidate_name": match["candidate_name"],
-                "score": match["score"],
-                "decision": match["decision"],
-                "created_at": match["created_at"].isoformat(),
-            }
-            for match in matches
-        ]
+    async def get_matches(
+        self,
+        min_score: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return await paginate(
+            self.mongodb_client.matches,
+            self._matches_query(min_score),
+            MATCH_PROJECTION,
+            self._serialize_match,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def export_matches(
+        self, min_score: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        return iterate(
+            self.mongodb_client.matches,
+            self._matches_query(min_score),
+            MATCH_PROJECTION,
+            self._serialize_match,
+        )
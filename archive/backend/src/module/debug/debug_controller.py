@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, Query
+from src.common.utils.response import Response, Status
+from src.core.metrics.profiler import ProfileFormat
+from src.module.debug.debug_dependency import get_debug_service
+from src.module.debug.debug_schema import ConversationTrace, EventLoopStats
+from src.module.debug.debug_service import DebugService
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/traces")
+async def list_traces(
+    debug_service: DebugService = Depends(get_debug_service),
+):
+    try:
+        traces = debug_service.list_traces()
+    except PermissionError as e:
+        return Response.error(message=str(e), status_code=Status.FORBIDDEN)
+
+    return Response.success(message="Traces retrieved successfully", data=traces)
+
+
+@router.get("/event-loop", response_model=EventLoopStats)
+async def get_event_loop_stats(
+    debug_service: DebugService = Depends(get_debug_service),
+):
+    try:
+        stats = debug_service.get_event_loop_stats()
+    except PermissionError as e:
+        return Response.error(message=str(e), status_code=Status.FORBIDDEN)
+
+    return Response.success(
+        message="Event loop stats retrieved successfully", data=stats
+    )
+
+
+@router.get("/profile")
+async def profile(
+    seconds: float = Query(10.0, gt=0),
+    format: ProfileFormat = Query("collapsed"),
+    all_threads: bool = Query(False),
+    debug_service: DebugService = Depends(get_debug_service),
+):
+    try:
+        content = await debug_service.profile(seconds, format, all_threads)
+    except PermissionError as e:
+        return Response.error(message=str(e), status_code=Status.FORBIDDEN)
+    except RuntimeError as e:
+        return Response.error(message=str(e), status_code=Status.CONFLICT)
+    except ValueError as e:
+        return Response.error(message=str(e), status_code=Status.BAD_REQUEST)
+
+    if format == "pstats":
+        return Response.file(content, "application/octet-stream", "profile.pstats")
+    return Response.file(content, "text/plain", "profile.collapsed")
+
+
+@router.get("/traces/{conversation_id}", response_model=ConversationTrace)
+async def get_trace(
+    conversation_id: str,
+    debug_service: DebugService = Depends(get_debug_service),
+):
+    try:
+        return Response.success(
+            message="Trace retrieved successfully",
+            data=debug_service.get_trace(conversation_id),
+        )
+    except PermissionError as e:
+        return Response.error(message=str(e), status_code=Status.FORBIDDEN)
+    except ValueError as e:
+        return Response.error(
+            message=str(e),
+            status_code=Status.NOT_FOUND,
+        )
@@ -0,0 +1,8 @@
+from src.core.metrics.loop_monitor import loop_monitor
+from src.core.metrics.profiler import profiler
+from src.core.tracing.tracer import tracer
+from src.module.debug.debug_service import DebugService
+
+
+def get_debug_service() -> DebugService:
+    return DebugService(tracer=tracer, loop_monitor=loop_monitor, profiler=profiler)
@@ -0,0 +1,57 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TraceSpan(BaseModel):
+    trace_id: str = Field(..., description="Conversation ID the span belongs to")
+    span_id: str = Field(..., description="Span ID")
+    parent_id: Optional[str] = Field(None, description="Parent span ID")
+    name: str = Field(..., description="Operation name")
+    start: float = Field(..., description="Start time, seconds since the epoch")
+    end: Optional[float] = Field(None, description="End time, seconds since the epoch")
+    duration_ms: Optional[float] = Field(None, description="Duration in milliseconds")
+    attributes: dict[str, Any] = Field(..., description="Span attributes")
+    error: Optional[str] = Field(None, description="Error raised inside the span")
+
+
+class SpanBreakdown(BaseModel):
+    name: str = Field(..., description="Operation name")
+    count: int = Field(..., description="Spans with this name")
+    total_ms: float = Field(..., description="Total time in milliseconds")
+    max_ms: float = Field(..., description="Slowest span in milliseconds")
+
+
+class LoopStall(BaseModel):
+    source: str = Field(
+        ...,
+        description="world_tick, world_websocket, conversation, "
+        "conversation_websocket or other",
+    )
+    started_at: float = Field(..., description="Stall start, seconds since the epoch")
+    blocked_seconds: float = Field(..., description="How long the loop was blocked")
+    function: str = Field(..., description="Innermost function when sampled")
+    stack: list[str] = Field(..., description="Stack of the loop thread when sampled")
+
+
+class EventLoopStats(BaseModel):
+    running: bool = Field(..., description="Whether the monitor is running")
+    interval: float = Field(..., description="Probe interval in seconds")
+    slow_threshold: float = Field(..., description="Stall threshold in seconds")
+    lag_p50: Optional[float] = Field(None, description="Median loop lag in seconds")
+    lag_p99: Optional[float] = Field(None, description="p99 loop lag in seconds")
+    lag_max: float = Field(..., description="Worst loop lag since startup")
+    stalls_by_source: dict[str, int] = Field(
+        ..., description="Recent stalls per source"
+    )
+    stalls: list[LoopStall] = Field(..., description="Recent stalls, newest first")
+
+
+class ConversationTrace(BaseModel):
+    conversation_id: str = Field(..., description="Conversation ID")
+    span_count: int = Field(..., description="Recorded spans")
+    duration_ms: float = Field(..., description="First span start to last span end")
+    breakdown: list[SpanBreakdown] = Field(
+        ..., description="Time per operation, slowest first"
+    )
+    spans: list[TraceSpan] = Field(..., description="Spans ordered by start time")
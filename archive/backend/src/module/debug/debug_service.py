@@ -0,0 +1,65 @@
+from typing import Any
+
+from src.common.config import settings
+from src.core.metrics.loop_monitor import LoopMonitor
+from src.core.metrics.profiler import ProfileFormat, Profiler
+from src.core.tracing.tracer import Tracer
+
+
+class DebugService:
+    def __init__(self, tracer: Tracer, loop_monitor: LoopMonitor, profiler: Profiler):
+        self.tracer = tracer
+        self.loop_monitor = loop_monitor
+        self.profiler = profiler
+
+    def get_trace(self, conversation_id: str) -> dict[str, Any]:
+        self._require_tracing()
+        spans = self.tracer.get_trace(conversation_id)
+        if not spans:
+            raise ValueError(f"No trace recorded for conversation {conversation_id}")
+
+        spans = sorted(spans, key=lambda span: span.start)
+        breakdown: dict[str, dict[str, Any]] = {}
+        for span in spans:
+            duration = span.duration_ms or 0.0
+            entry = breakdown.setdefault(
+                span.name,
+                {"name": span.name, "count": 0, "total_ms": 0.0, "max_ms": 0.0},
+            )
+            entry["count"] += 1
+            entry["total_ms"] += duration
+            entry["max_ms"] = max(entry["max_ms"], duration)
+
+        return {
+            "conversation_id": conversation_id,
+            "span_count": len(spans),
+            "duration_ms": (
+                (max(span.end or span.start for span in spans) - spans[0].start) * 1000
+            ),
+            "breakdown": sorted(
+                breakdown.values(), key=lambda entry: entry["total_ms"], reverse=True
+            ),
+            "spans": [span.to_dict() for span in spans],
+        }
+
+    def list_traces(self) -> list[str]:
+        self._require_tracing()
+        return self.tracer.trace_ids()
+
+    def get_event_loop_stats(self) -> dict[str, Any]:
+        if not settings.LOOP_MONITOR_ENABLED:
+            raise PermissionError(
+                "Event loop monitoring is disabled, set LOOP_MONITOR_ENABLED"
+            )
+        return self.loop_monitor.get_stats()
+
+    async def profile(
+        self, seconds: float, format: ProfileFormat, all_threads: bool
+    ) -> bytes:
+        if not settings.PROFILER_ENABLED:
+            raise PermissionError("Profiling is disabled, set PROFILER_ENABLED")
+        return await self.profiler.profile(seconds, format, all_threads)
+
+    def _require_tracing(self):
+        if not settings.TRACING_ENABLED:
+            raise PermissionError("Tracing is disabled, set TRACING_ENABLED")
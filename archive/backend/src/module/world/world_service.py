@@ -4,11 +4,37 @@ import random
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Callable, Optional
 
-from bson import ObjectId
+from src.common.config import settings
 from src.common.logger import logger
+from src.core.cache.agent_cache import AgentCache
+from src.core.metrics.registry import metrics
 from src.database.mongodb.mongodb_client import MongoDBClient
 from src.module.conversation.conversation_service import ConversationService
 
+WORLD_TICK_DURATION = metrics.histogram(
+    "world_tick_duration_seconds",
+    "Time spent simulating and broadcasting one world tick",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+WORLD_TICK_OVERRUNS = metrics.counter(
+    "world_tick_overruns_total", "World ticks that took longer than the tick interval"
+)
+WORLD_AGENTS = metrics.gauge("world_agents", "Spawned agents by state", ("state",))
+WORLD_ACTIVE_CONVERSATIONS = metrics.gauge(
+    "world_active_conversations", "Conversations running in the world"
+)
+WEBSOCKET_SUBSCRIBERS = metrics.gauge(
+    "websocket_subscribers", "Open WebSocket subscriptions", ("channel",)
+)
+WEBSOCKET_QUEUE_DEPTH = metrics.gauge(
+    "websocket_queue_depth", "Frames waiting in subscriber queues", ("channel",)
+)
+WEBSOCKET_DROPPED_FRAMES = metrics.counter(
+    "websocket_dropped_frames_total",
+    "Frames dropped because a subscriber fell behind",
+    ("channel",),
+)
+
 
 @dataclass
 class AgentState:
@@ -40,9 +66,11 @@ class WorldService:
         self,
         mongodb_client: MongoDBClient,
         conversation_service: ConversationService,
+        agent_cache: AgentCache | None = None,
     ):
         self.mongodb_client = mongodb_client
         self.conversation_service = conversation_service
+        self.agent_cache = agent_cache or AgentCache(mongodb_client)
         self.config = WorldConfig()
         self.agents: dict[str, AgentState] = {}
         self.active_conversations: dict[str, dict[str, Any]] = {}
@@ -50,6 +78,27 @@ class WorldService:
         self._update_task: Optional[asyncio.Task] = None
         self._state_callbacks: list[Callable] = []
         self._conversation_started_pairs: set[tuple[str, str]] = set()
+        self._subscribers: dict[asyncio.Queue, Callable] = {}
+        self._register_metrics()
+
+    def _register_metrics(self):
+        def agents_by_state() -> dict[tuple[str, ...], float]:
+            counts = {("idle",): 0.0, ("walking",): 0.0, ("talking",): 0.0}
+            for agent in self.agents.values():
+                counts[(agent.state,)] = counts.get((agent.state,), 0.0) + 1
+            return counts
+
+        WORLD_AGENTS.add_collector("world", agents_by_state)
+        WORLD_ACTIVE_CONVERSATIONS.add_collector(
+            "world", lambda: {(): len(self.active_conversations)}
+        )
+        WEBSOCKET_SUBSCRIBERS.add_collector(
+            "world", lambda: {("world",): len(self._subscribers)}
+        )
+        WEBSOCKET_QUEUE_DEPTH.add_collector(
+            "world",
+            lambda: {("world",): sum(queue.qsize() for queue in self._subscribers)},
+        )
 
     async def spawn_agent(
         self, agent_id: str, x: Optional[float] = None, y: Optional[float] = None
@@ -58,9 +107,7 @@ class WorldService:
             return self.agents[agent_id]
 
         try:
-            agent = await self.mongodb_client.agents.find_one(
-                {"_id": ObjectId(agent_id)}
-            )
+            agent = await self.agent_cache.get(agent_id)
         except Exception:
             raise ValueError(f"Invalid agent ID format: {agent_id}")
 
@@ -105,6 +152,13 @@ class WorldService:
         logger.info(f"Removed agent {agent_id}")
         return True
 
+    def remove_all_agents(self) -> int:
+        count = len(self.agents)
+        self.agents.clear()
+        self._conversation_started_pairs.clear()
+        logger.info(f"Removed {count} agents")
+        return count
+
     def get_world_state(self) -> dict[str, Any]:
         return {
             "agents": [
@@ -241,22 +295,18 @@ class WorldService:
         candidate: AgentState,
     ):
         try:
-            async for turn in self.conversation_service.run_conversation_stream(
-                conversation_id
-            ):
+            async for event in self.conversation_service.subscribe(conversation_id):
+                if event["type"] == "error":
+                    raise RuntimeError(event["message"])
+                if event["type"] != "turn":
+                    continue
+
                 for callback in self._state_callbacks:
                     await callback(
                         {
                             "type": "conversation_turn",
                             "conversation_id": conversation_id,
-                            "turn": {
-                                "role": turn.role,
-                                "speaker_name": turn.speaker_name,
-                                "content": turn.content,
-                                "timestamp": turn.timestamp,
-                                "is_final": turn.is_final,
-                                "final_evaluation": turn.final_evaluation,
-                            },
+                            "turn": event["data"],
                         }
                     )
 
@@ -290,8 +340,15 @@ class WorldService:
 
             await self._check_proximity_and_start_conversations()
 
-            for callback in self._state_callbacks:
-                await callback({"type": "world_state", "data": self.get_world_state()})
+            if self._state_callbacks:
+                state = {"type": "world_state", "data": self.get_world_state()}
+                for callback in list(self._state_callbacks):
+                    await callback(state)
+
+            tick_duration = asyncio.get_event_loop().time() - current_time
+            WORLD_TICK_DURATION.observe(tick_duration)
+            if tick_duration > self.config.update_interval:
+                WORLD_TICK_OVERRUNS.inc()
 
             await asyncio.sleep(self.config.update_interval)
 
@@ -317,17 +374,33 @@ class WorldService:
         if callback in self._state_callbacks:
             self._state_callbacks.remove(callback)
 
-    async def stream_world_state(self) -> AsyncGenerator[dict[str, Any], None]:
-        queue: asyncio.Queue = asyncio.Queue()
+    def add_subscriber(self, maxsize: int | None = None) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=settings.WORLD_SUBSCRIBER_QUEUE_SIZE if maxsize is None else maxsize
+        )
 
-        async def callback(state: dict):
-            await queue.put(state)
+        async def state_callback(state: dict):
+            # A slow client loses its oldest frames instead of stalling the tick
+            if queue.full():
+                queue.get_nowait()
+                WEBSOCKET_DROPPED_FRAMES.inc(channel="world")
+            queue.put_nowait(state)
 
-        self.add_state_callback(callback)
+        self._subscribers[queue] = state_callback
+        self.add_state_callback(state_callback)
+        return queue
+
+    def remove_subscriber(self, queue: asyncio.Queue):
+        callback = self._subscribers.pop(queue, None)
+        if callback:
+            self.remove_state_callback(callback)
+
+    async def stream_world_state(self) -> AsyncGenerator[dict[str, Any], None]:
+        queue = self.add_subscriber()
 
         try:
             while self.running:
                 state = await queue.get()
                 yield state
         finally:
-            self.remove_state_callback(callback)
+            self.remove_subscriber(queue)
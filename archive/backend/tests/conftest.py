@@ -0,0 +1,14 @@
+import os
+
+# Settings are read at import time, the tests never reach these services
+for name in [
+    "GEMINI_API_KEY",
+    "TAVILY_API_KEY",
+    "ELEVENLABS_API_KEY",
+    "FAL_KEY",
+    "ASSEMBLYAI_API_KEY",
+    "GCP_BUCKET_NAME",
+    "GCP_SERVICE_ACCOUNT_KEY",
+]:
+    os.environ.setdefault(name, "test")
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
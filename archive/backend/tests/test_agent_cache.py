@@ -0,0 +1,24 @@
+import asyncio
+
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+from src.core.cache.agent_cache import AgentCache
+from src.core.metrics.registry import metrics
+from src.database.mongodb.mongodb_client import MongoDBClient
+
+
+def test_lookups_are_exported_as_counters():
+    async def run():
+        mongodb_client = MongoDBClient()
+        mongodb_client.db = AsyncMongoMockClient().doppel
+        agent_id = ObjectId()
+        await mongodb_client.agents.insert_one({"_id": agent_id, "name": "Ada"})
+        cache = AgentCache(mongodb_client)
+        for _ in range(3):
+            await cache.get(str(agent_id))
+
+    asyncio.run(run())
+    rendered = metrics.render()
+    assert "# TYPE agent_cache_lookups_total counter" in rendered
+    assert 'agent_cache_lookups_total{result="hit"} 2' in rendered
+    assert 'agent_cache_lookups_total{result="miss"} 1' in rendered
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+from src.core.cache.agent_cache import AgentCache
+from src.core.jobs.job_registry import JobRegistry
+from src.database.mongodb.mongodb_client import MongoDBClient
+from src.module.agent.agent_service import AgentService
+from src.module.conversation.conversation_service import ConversationService
+
+
+def conversation_doc(
+    recruiter_id: str, candidate_id: str, created_at: datetime | None = None
+) -> dict:
+    created_at = created_at or datetime.utcnow() - timedelta(hours=1)
+    return {
+        "recruiter": {"agent_id": recruiter_id, "name": "Recruiter"},
+        "candidate": {"agent_id": candidate_id, "name": "Candidate"},
+        "messages": [],
+        "status": "completed",
+        "created_at": created_at,
+        "completed_at": created_at,
+    }
+
+
+def run(scenario):
+    async def main():
+        mongodb_client = MongoDBClient()
+        mongodb_client.db = AsyncMongoMockClient().doppel
+        jobs = JobRegistry()
+        conversation_service = ConversationService(mongodb_client)
+        service = AgentService(
+            mongodb_client,
+            AgentCache(mongodb_client),
+            jobs=jobs,
+            conversation_service=conversation_service,
+        )
+        agent_ids = []
+        for agent_type in ["recruiter", "recruiter", "candidate"]:
+            result = await mongodb_client.agents.insert_one(
+                {"type": agent_type, "created_at": datetime.utcnow()}
+            )
+            agent_ids.append(str(result.inserted_id))
+
+        async def wait_for_jobs():
+            await asyncio.gather(*jobs._tasks.values())
+
+        return await scenario(service, mongodb_client, agent_ids, wait_for_jobs)
+
+    return asyncio.run(main())
+
+
+def test_delete_agent_rebuilds_the_counterparts_summaries():
+    async def scenario(service, mongodb_client, agent_ids, wait_for_jobs):
+        deleted, kept, candidate = agent_ids
+        await mongodb_client.conversations.insert_many(
+            [conversation_doc(deleted, candidate), conversation_doc(kept, candidate)]
+        )
+        await service.conversation_service.rebuild_agent_summaries()
+
+        await service.delete_agent(deleted)
+        await wait_for_jobs()
+        return {
+            agent_id: await service.conversation_service.get_agent_summary(agent_id)
+            for agent_id in agent_ids
+        }
+
+    deleted, kept, candidate = run(scenario).values()
+    assert deleted["conversations_started"] == 0
+    assert kept["conversations_started"] == 1
+    assert candidate["conversations_started"] == 1
+    assert candidate["conversations_completed"] == 1
+    assert len(candidate["recent_conversation_ids"]) == 1
+
+
+def test_delete_all_agents_keeps_conversations_started_afterwards():
+    async def scenario(service, mongodb_client, agent_ids, wait_for_jobs):
+        await mongodb_client.conversations.insert_one(
+            conversation_doc(agent_ids[0], agent_ids[2])
+        )
+        await mongodb_client.agent_summaries.insert_one({"_id": agent_ids[0]})
+
+        await service.delete_all_agents()
+        # An agent created and matched before the cleanup job gets to run
+        result = await mongodb_client.agents.insert_one({"type": "recruiter"})
+        new_agent_id = str(result.inserted_id)
+        # Stored datetimes keep milliseconds, so stay clear of the cutoff
+        started_at = datetime.utcnow() + timedelta(seconds=1)
+        await mongodb_client.conversations.insert_one(
+            conversation_doc(new_agent_id, str(ObjectId()), started_at)
+        )
+        await mongodb_client.agent_summaries.insert_one({"_id": new_agent_id})
+        await wait_for_jobs()
+
+        conversations = await mongodb_client.conversations.find().to_list(None)
+        summaries = await mongodb_client.agent_summaries.find().to_list(None)
+        return new_agent_id, conversations, summaries
+
+    new_agent_id, conversations, summaries = run(scenario)
+    assert [c["recruiter"]["agent_id"] for c in conversations] == [new_agent_id]
+    assert [s["_id"] for s in summaries] == [new_agent_id]
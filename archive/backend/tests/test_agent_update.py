@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from src.core.cache.agent_cache import AgentCache
+from src.database.mongodb.mongodb_client import MongoDBClient
+from src.module.agent.agent_service import AgentService
+
+RECRUITER_PROFILE = {
+    "name": "Brodie Moss",
+    "bio": "Senior technical recruiter",
+    "role_description": "Platform engineer",
+    "candidate_selection_criteria": ["Python", "Distributed systems"],
+}
+
+CANDIDATE_PROFILE = {
+    "personal_info": {"full_name": "Ada Park", "email": "ada@example.com"},
+    "professional_summary": "Backend engineer",
+    "work_experience": [
+        {
+            "job_title": "Engineer",
+            "company_name": "Acme",
+            "employment_type": "Full-time",
+            "location": "Toronto",
+            "start_date": "2021-01",
+            "responsibilities": ["Built APIs"],
+        }
+    ],
+    "technical_skills": ["Python"],
+}
+
+
+def run(coro_factory):
+    async def main():
+        mongodb_client = MongoDBClient()
+        mongodb_client.db = AsyncMongoMockClient().doppel
+        service = AgentService(mongodb_client, AgentCache(mongodb_client))
+        return await coro_factory(service, mongodb_client)
+
+    return asyncio.run(main())
+
+
+def test_type_only_update_without_matching_profile_is_rejected():
+    async def scenario(service, mongodb_client):
+        created = await service.create_agent("ada", "candidate", CANDIDATE_PROFILE)
+        with pytest.raises(ValueError, match="needs a matching profile"):
+            await service.update_agent(created["agent_id"], None, "recruiter", None)
+        return await mongodb_client.agents.find_one({"username": "ada"})
+
+    stored = run(scenario)
+    assert stored["type"] == "candidate"
+    assert stored["profile"] == CANDIDATE_PROFILE
+
+
+def test_type_only_update_recompiles_prompt_for_new_type():
+    profile = {**CANDIDATE_PROFILE, **RECRUITER_PROFILE}
+
+    async def scenario(service, mongodb_client):
+        created = await service.create_agent("ada", "candidate", profile)
+        updated = await service.update_agent(
+            created["agent_id"], None, "recruiter", None
+        )
+        stored = await mongodb_client.agents.find_one({"username": "ada"})
+        return updated, stored
+
+    updated, stored = run(scenario)
+    assert updated["type"] == "recruiter"
+    assert updated["name"] == RECRUITER_PROFILE["name"]
+    assert RECRUITER_PROFILE["role_description"] in stored["prompt"]["system_prompt"]
+
+
+def test_type_and_profile_update_uses_new_type():
+    async def scenario(service, mongodb_client):
+        created = await service.create_agent("ada", "candidate", CANDIDATE_PROFILE)
+        return await service.update_agent(
+            created["agent_id"], None, "recruiter", RECRUITER_PROFILE
+        )
+
+    updated = run(scenario)
+    assert updated["type"] == "recruiter"
+    assert updated["profile"] == RECRUITER_PROFILE
+
+
+def test_profile_merge_keeps_current_type():
+    async def scenario(service, mongodb_client):
+        created = await service.create_agent("brodie", "recruiter", RECRUITER_PROFILE)
+        return await service.update_agent(
+            created["agent_id"], None, None, {"bio": "Principal recruiter"}
+        )
+
+    updated = run(scenario)
+    assert updated["type"] == "recruiter"
+    assert updated["bio"] == "Principal recruiter"
+    assert updated["profile"]["role_description"] == "Platform engineer"
@@ -0,0 +1,47 @@
+import asyncio
+
+from src.core.cache.async_lru_cache import AsyncLRUCache
+
+
+def test_coalesces_concurrent_loads():
+    async def run():
+        cache: AsyncLRUCache[int] = AsyncLRUCache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 1
+
+        values = await asyncio.gather(*(cache.get_or_load("a", load) for _ in range(5)))
+        return values, calls
+
+    assert asyncio.run(run()) == ([1] * 5, 1)
+
+
+def test_invalidate_detaches_inflight_load():
+    async def run():
+        cache: AsyncLRUCache[int] = AsyncLRUCache()
+        db = {"a": 1, "b": 1}
+
+        async def load(key):
+            value = db[key]
+            await asyncio.sleep(0.02)
+            return value
+
+        stale = asyncio.create_task(cache.get_or_load("a", lambda: load("a")))
+        other = asyncio.create_task(cache.get_or_load("b", lambda: load("b")))
+        await asyncio.sleep(0.005)
+
+        db["a"] = 2
+        cache.invalidate("a")
+        fresh = await cache.get_or_load("a", lambda: load("a"))
+
+        return await stale, fresh, await other, cache._entries
+
+    stale, fresh, other, entries = asyncio.run(run())
+    assert (stale, fresh, other) == (1, 2, 1)
+    # Only the load started after the update is cached, other keys are untouched
+    assert entries["a"][1] == 2
+    assert entries["b"][1] == 1
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+from src.core.agents.orchestrator import ConversationTurn
+from src.database.mongodb.mongodb_client import MongoDBClient
+from src.module.conversation.conversation_service import ConversationService
+
+
+def conversation_doc(heartbeat_at: datetime, resume_count: int = 0) -> dict:
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    return {
+        "recruiter": {"agent_id": str(ObjectId()), "name": "Recruiter"},
+        "candidate": {"agent_id": str(ObjectId()), "name": "Candidate"},
+        "messages": [],
+        "status": "in_progress",
+        "owner": {"id": "other-replica", "heartbeat_at": heartbeat_at},
+        "checkpoint": {"updated_at": long_ago, "resume_count": resume_count},
+        "created_at": long_ago,
+    }
+
+
+def run(scenario):
+    async def main():
+        mongodb_client = MongoDBClient()
+        mongodb_client.db = AsyncMongoMockClient().doppel
+        service = ConversationService(mongodb_client)
+        return await scenario(service, mongodb_client.conversations)
+
+    return asyncio.run(main())
+
+
+def test_sweep_skips_conversations_with_a_live_owner():
+    async def scenario(service, conversations):
+        # Started long ago and never streamed, but its owner still heartbeats
+        await conversations.insert_one(conversation_doc(datetime.utcnow()))
+        return await service.resume_stale_conversations()
+
+    assert run(scenario) == {"resumed": 0, "finalized": 0}
+
+
+def test_sweep_claims_conversations_with_an_expired_heartbeat():
+    async def scenario(service, conversations):
+        expired = datetime.utcnow() - timedelta(hours=1)
+        result = await conversations.insert_one(conversation_doc(expired))
+        stats = await service.resume_stale_conversations()
+        return stats, await conversations.find_one({"_id": result.inserted_id})
+
+    stats, conversation = run(scenario)
+    # The agents are gone, so the claimed conversation is finalized
+    assert stats == {"resumed": 0, "finalized": 1}
+    assert conversation["status"] == "abandoned"
+    assert "owner" not in conversation
+
+
+class FakeOrchestrator:
+    conversation_history = [{"role": "recruiter", "content": "Hi"}]
+    turn_count = 1
+
+    async def run_conversation_stream(self, max_turns: int):
+        yield ConversationTurn("recruiter", "Recruiter", "Hi", "now")
+
+
+def test_checkpointed_turn_resets_resume_count():
+    async def scenario(service, conversations):
+        result = await conversations.insert_one(
+            conversation_doc(datetime.utcnow(), resume_count=2)
+        )
+        conversation_id = str(result.inserted_id)
+        service.active_conversations[conversation_id] = FakeOrchestrator()
+        async for _ in service.run_conversation_stream(conversation_id):
+            pass
+        return await conversations.find_one({"_id": result.inserted_id})
+
+    conversation = run(scenario)
+    assert conversation["checkpoint"]["resume_count"] == 0
+    assert conversation["checkpoint"]["turn_count"] == 1
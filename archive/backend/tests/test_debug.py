@@ -0,0 +1,46 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.common.config import settings
+from src.core.metrics.loop_monitor import LoopMonitor
+from src.core.tracing.exporters import InMemorySpanExporter
+from src.core.tracing.tracer import Tracer
+from src.module.debug.debug_controller import router
+from src.module.debug.debug_dependency import get_debug_service
+from src.module.debug.debug_service import DebugService
+
+
+@pytest.fixture
+def client():
+    tracer = Tracer([InMemorySpanExporter()])
+    with tracer.span("turn", trace_id="conversation-1"):
+        pass
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_debug_service] = lambda: DebugService(
+        tracer=tracer, loop_monitor=LoopMonitor(), profiler=None
+    )
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/debug/traces", "/debug/traces/conversation-1"])
+def test_traces_are_forbidden_unless_tracing_is_enabled(client, monkeypatch, path):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", False)
+    response = client.get(path)
+    assert response.status_code == 403
+    assert response.json()["message"] == "Tracing is disabled, set TRACING_ENABLED"
+
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    assert client.get(path).status_code == 200
+
+
+def test_event_loop_stats_are_forbidden_unless_the_monitor_is_enabled(
+    client, monkeypatch
+):
+    monkeypatch.setattr(settings, "LOOP_MONITOR_ENABLED", False)
+    response = client.get("/debug/event-loop")
+    assert response.status_code == 403
+
+    monkeypatch.setattr(settings, "LOOP_MONITOR_ENABLED", True)
+    assert client.get("/debug/event-loop").status_code == 200
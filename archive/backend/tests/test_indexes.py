@@ -0,0 +1,17 @@
+import asyncio
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from src.database.mongodb.indexes import INDEXES, ensure_indexes
+
+USERNAME_INDEX = next(spec for spec in INDEXES if spec.unique)
+
+
+def test_unique_index_failure_stops_startup():
+    async def run():
+        db = AsyncMongoMockClient().doppel
+        await db.agents.insert_many([{"username": "ada"}, {"username": "ada"}])
+        await ensure_indexes(db, [USERNAME_INDEX])
+
+    with pytest.raises(RuntimeError, match="unique index username_1"):
+        asyncio.run(run())
@@ -0,0 +1,36 @@
+import json
+
+from src.core.agents.prompts import compile_prompt, load_system_prompt
+
+PROFILE = {
+    "name": "Brodie Moss",
+    "bio": "Senior technical recruiter",
+    "role_description": "Platform engineer",
+    "candidate_selection_criteria": ["Python"],
+}
+
+
+def test_version_changes_with_the_profile():
+    other = {**PROFILE, "role_description": "Data engineer"}
+    first = compile_prompt("recruiter", PROFILE)
+    second = compile_prompt("recruiter", other)
+    assert first["version"] != second["version"]
+    assert first["compiled_at"].tzinfo is not None
+
+
+def test_stored_prompt_is_reused_until_the_profile_changes():
+    agent_doc = {"type": "recruiter", "profile": PROFILE}
+    agent_doc["prompt"] = compile_prompt("recruiter", PROFILE)
+    assert load_system_prompt(agent_doc)[1] is False
+
+    agent_doc["profile"] = {**PROFILE, "bio": "Principal recruiter"}
+    system_prompt, recompiled = load_system_prompt(agent_doc)
+    assert recompiled is True
+    assert "Principal recruiter" in system_prompt
+
+
+def test_candidate_profiles_default_to_json():
+    profile = {"personal_info": {"full_name": "Ada Park"}, "skills": ["Python"]}
+    prompt = compile_prompt("candidate", profile)
+    assert prompt["encoding"] == "json"
+    assert json.dumps(profile, indent=2) in prompt["system_prompt"]
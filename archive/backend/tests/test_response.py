@@ -0,0 +1,21 @@
+from decimal import Decimal
+
+import orjson
+import pytest
+from bson import ObjectId
+from src.common.utils.response import dumps
+
+
+def test_dumps_converts_known_types():
+    object_id = ObjectId()
+    payload = {"id": object_id, "tags": {"a"}, "score": Decimal("7.5")}
+    assert orjson.loads(dumps(payload)) == {
+        "id": str(object_id),
+        "tags": ["a"],
+        "score": 7.5,
+    }
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
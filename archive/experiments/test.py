@@ -1,13 +1,19 @@
 import asyncio
 import json
+import sys
 from dataclasses import dataclass
 from enum import IntEnum
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from src.common.config import settings
 
+# The extractor lives with the simulator, these scripts reuse it from there
+sys.path.append(str(Path(__file__).resolve().parents[2] / "multi-agent"))
+from structured_output import extract_json_text  # noqa: E402
+
 
 class ThinkingLevel(IntEnum):
     EXECUTION = 1
@@ -321,14 +327,7 @@ This is expensive thinking - provide deep, actionable insights."""
         return str(content)
 
     def _clean_json(self, text: str) -> str:
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+        return extract_json_text(text)
 
 
 recruiter_profile = {
@@ -1116,14 +1115,7 @@ Respond naturally while following this strategy."""
         return str(content)
 
     def _clean_json(self, text: str) -> str:
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+        return extract_json_text(text)
 
 
 class ConversationOrchestrator:
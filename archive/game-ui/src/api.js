@@ -1,9 +1,26 @@
 import { API_BASE_URL } from './config.js';
 
+const PAGE_SIZE = 500;
+
+// List endpoints return one page at a time, follow next_cursor to the end
+async function fetchAllPages(path, params = {}) {
+  const items = [];
+  let cursor = null;
+  do {
+    const query = new URLSearchParams({ ...params, limit: PAGE_SIZE });
+    if (cursor) {
+      query.set('cursor', cursor);
+    }
+    const response = await fetch(`${API_BASE_URL}${path}?${query}`);
+    const data = await response.json();
+    items.push(...(data.data?.items || []));
+    cursor = data.data?.next_cursor;
+  } while (cursor);
+  return items;
+}
+
 export async function fetchAgents() {
-  const response = await fetch(`${API_BASE_URL}/agent`);
-  const data = await response.json();
-  return data.data || [];
+  return fetchAllPages('/agent');
 }
 
 export async function createAgent(agentData) {
@@ -54,9 +71,7 @@ export async function getWorldState() {
 }
 
 export async function getConversations() {
-  const response = await fetch(`${API_BASE_URL}/conversation`);
-  const data = await response.json();
-  return data.data || [];
+  return fetchAllPages('/conversation');
 }
 
 export async function getConversation(conversationId) {
@@ -66,10 +81,5 @@ export async function getConversation(conversationId) {
 }
 
 export async function getMatches(minScore = null) {
-  const url = minScore
-    ? `${API_BASE_URL}/conversation/matches?min_score=${minScore}`
-    : `${API_BASE_URL}/conversation/matches`;
-  const response = await fetch(url);
-  const data = await response.json();
-  return data.data || [];
+  return fetchAllPages('/conversation/matches', minScore ? { min_score: minScore } : {});
 }
@@ -0,0 +1,178 @@
+import json
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+from rich import box
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+EventSubscriber = Callable[[dict[str, Any]], None]
+
+_STOP = object()
+
+
+class EventBus:
+    def __init__(self):
+        self._subscribers: list[EventSubscriber] = []
+
+    def subscribe(self, subscriber: EventSubscriber):
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: EventSubscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def emit(self, event_type: str, **payload: Any):
+        if not self._subscribers:
+            return
+        event = {"type": event_type, "ts": time.time(), **payload}
+        for subscriber in self._subscribers:
+            subscriber(event)
+
+
+class JsonlEventWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __call__(self, event: dict[str, Any]):
+        self._queue.put(event)
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        with open(self.path, "w") as f:
+            while (event := self._queue.get()) is not _STOP:
+                f.write(json.dumps(event, default=str) + "\n")
+
+
+class RichRenderer:
+    def __init__(self, console: Console):
+        self.console = console
+
+    def __call__(self, event: dict[str, Any]):
+        handler = getattr(self, f"_render_{event['type']}", None)
+        if handler:
+            handler(event)
+
+    def _render_event_started(self, event: dict[str, Any]):
+        self.console.print(
+            Panel.fit(event["intro"], title=event["title"], border_style="yellow")
+        )
+        if event.get("thread_id"):
+            self.console.print(f"[dim]Checkpoint thread: {event['thread_id']}[/dim]")
+        self.console.print(f"\n[bold]--- {event['heading']} ---[/bold]\n")
+
+    def _render_event_resumed(self, event: dict[str, Any]):
+        self.console.print(
+            f"\n[bold]--- Resuming thread {event['thread_id']} ---[/bold]\n"
+        )
+
+    def _render_checkpoint(self, event: dict[str, Any]):
+        next_nodes = ", ".join(event["next"]) or "done"
+        self.console.print(
+            f"{event['checkpoint_id']}  step {event['step']}  "
+            f"next: {next_nodes}  [dim]{event['created_at']}[/dim]"
+        )
+
+    def _render_agents_thinking(self, event: dict[str, Any]):
+        self.console.print("\n[dim]Agents are thinking...[/dim]")
+
+    def _render_agent_status(self, event: dict[str, Any]):
+        title = "Agent Status"
+        if event["group_id"] != "main":
+            title = f"Agent Status ({event['group_id']})"
+        table = Table(title=title, box=box.ROUNDED)
+        table.add_column("Agent", style="bold")
+        table.add_column("Status")
+        table.add_column("Interest", justify="center")
+        table.add_column("Thinking")
+
+        for agent in event["agents"]:
+            color = agent["color"]
+            status = (
+                "[green]Active[/green]" if agent["active"] else "[dim]Observing[/dim]"
+            )
+            interest = agent["interest"]
+            interest_bar = "█" * int(interest) + "░" * (10 - int(interest))
+            table.add_row(
+                f"[{color}]{agent['name']}[/{color}]",
+                status,
+                f"[{color}]{interest_bar}[/{color}] {interest:.1f}",
+                f"[dim]{agent['reasoning'][:50]}[/dim]",
+            )
+
+        self.console.print(table)
+
+    def _render_message(self, event: dict[str, Any]):
+        color = event["color"]
+        speaker = event["speaker"]
+        message = event["content"]
+
+        if event["kind"] == "join":
+            self.console.print(
+                Panel(
+                    f"[italic]{message}[/italic]",
+                    title=f"[{color}]✨ {speaker} joins the conversation[/{color}]",
+                    border_style=color,
+                    box=box.DOUBLE,
+                )
+            )
+        elif event["kind"] == "leave":
+            self.console.print(
+                Panel(
+                    f"[italic]{message}[/italic]",
+                    title=f"[{color}]👋 {speaker} leaves the conversation[/{color}]",
+                    border_style=color,
+                    box=box.DOUBLE,
+                )
+            )
+        else:
+            self.console.print(
+                Panel(
+                    message,
+                    title=f"[{color}]{speaker}[/{color}]",
+                    border_style=color,
+                )
+            )
+
+    def _render_evaluation_error(self, event: dict[str, Any]):
+        self.console.print(
+            f"[dim]Error for {event['agent_key']}: {event['error']}[/dim]"
+        )
+        if "raw_content" in event:
+            self.console.print(f"[dim]Raw content: {event['raw_content']}...[/dim]")
+
+    def _render_group_ended(self, event: dict[str, Any]):
+        if event["reason"] == "one_left":
+            text = "The conversation has naturally concluded - only one person remains."
+        elif event["group_id"] == "main":
+            text = "The networking event is wrapping up..."
+        else:
+            text = f"The conversation in {event['group_id']} is wrapping up..."
+        self.console.print(f"\n[bold yellow]{text}[/bold yellow]")
+
+    def _render_event_summary(self, event: dict[str, Any]):
+        self.console.print("\n[bold]--- Event Summary ---[/bold]")
+        if event["mode"] == "classic":
+            self.console.print(f"Total turns: {event['turns']}")
+            self.console.print(
+                f"Final participants: {', '.join(event['participants'])}"
+            )
+        else:
+            self.console.print(f"Rounds: {event['rounds']}")
+            self.console.print(f"Conversation groups formed: {event['groups_formed']}")
+            self.console.print(f"Groups still talking: {event['groups_active']}")
+
+        parsing = event["parsing"]
+        self.console.print(
+            f"JSON parsing: {parsing['parsed']} parsed, {parsing['repaired']} repaired, "
+            f"{parsing['failed']} failed ({parsing['failure_rate']:.0%} failure rate)"
+        )
@@ -1,25 +1,44 @@
+import argparse
+import asyncio
 import json
 import os
 import random
+import time
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import cache
 from operator import add
-from typing import Annotated, TypedDict
+from pathlib import Path
+from typing import Annotated, AsyncIterator, TypedDict
 
 from dotenv import load_dotenv
+from events import EventBus, JsonlEventWriter, RichRenderer
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
-from rich import box
+from personas import load_personas
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from structured_output import ParseStats, extract_json
 
 console = Console()
 load_dotenv()
 
-AGENT_COLORS = {
-    "recruiter": "blue",
-    "developer": "green",
-    "founder": "magenta",
+MAX_CONCURRENT_EVALUATIONS = int(os.environ.get("MAX_CONCURRENT_EVALUATIONS", "8"))
+DEFAULT_GROUP_SIZE = 4
+DEFAULT_EVENT_ROUNDS = 20
+DEFAULT_MAX_TURNS = 15
+DRIFT_INTEREST_THRESHOLD = 2.0
+JOIN_GROUP_PROBABILITY = 0.6
+
+# Node that hands control to each node, used to replay a forked checkpoint
+FORK_PREDECESSORS = {
+    "evaluate": "route",
+    "route": "evaluate",
+    "converse": "mingle",
+    "mingle": "converse",
 }
 
 AGENT_PERSONAS = {
@@ -71,6 +90,16 @@ You start by observing nearby conversations. If you hear topics like startups, A
 }
 
 
+PERSONAS: dict[str, dict] = dict(AGENT_PERSONAS)
+
+PARSE_STATS = ParseStats()
+
+EVENTS = EventBus()
+
+_evaluation_limiters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_models: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
 class AgentResponse(TypedDict):
     interest_score: float
     response: str
@@ -79,14 +108,31 @@ class AgentResponse(TypedDict):
 
 
 class NetworkingState(TypedDict):
+    group_id: str
     messages: Annotated[list[BaseMessage], add]
+    transcript: Annotated[list[str], add]
+    roster: list[str]
     active_agents: set[str]
+    departed: list[str]
     interest_scores: dict[str, float]
     pending_responses: dict[str, AgentResponse]
     turn_count: int
+    max_turns: int
+    transcript_window: int | None
     conversation_ended: bool
 
 
+class EventState(TypedDict):
+    groups: dict[str, NetworkingState]
+    wandering: list[str]
+    group_size: int
+    next_group_id: int
+    round: int
+    max_rounds: int
+    max_turns: int
+    transcript_window: int | None
+
+
 def create_model():
     return ChatGoogleGenerativeAI(
         model="gemini-3-flash-preview",
@@ -95,23 +141,53 @@ def create_model():
     )
 
 
-def format_conversation_for_agent(messages: list[BaseMessage], agent_name: str) -> str:
-    formatted = []
-    for msg in messages:
-        if isinstance(msg, HumanMessage):
-            formatted.append(f"[Event Start]: {msg.content}")
-        elif isinstance(msg, AIMessage):
-            speaker = msg.additional_kwargs.get("speaker", "Unknown")
-            formatted.append(f"{speaker}: {msg.content}")
-    return "\n".join(formatted) if formatted else "[No conversation yet]"
+def get_model() -> ChatGoogleGenerativeAI:
+    # The async transport binds to the loop that first uses it, and each event
+    # runs under its own asyncio.run
+    loop = asyncio.get_running_loop()
+    if loop not in _models:
+        _models[loop] = create_model()
+    return _models[loop]
+
+
+def get_evaluation_limiter() -> asyncio.Semaphore:
+    # One limiter per event loop, shared by every group evaluating this round
+    loop = asyncio.get_running_loop()
+    if loop not in _evaluation_limiters:
+        _evaluation_limiters[loop] = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+    return _evaluation_limiters[loop]
+
+
+def transcript_line(msg: BaseMessage) -> str:
+    if isinstance(msg, HumanMessage):
+        return f"[Event Start]: {msg.content}"
+    speaker = msg.additional_kwargs.get("speaker", "Unknown")
+    return f"{speaker}: {msg.content}"
+
 
+def format_conversation_for_agent(
+    transcript: list[str], window: int | None = None
+) -> str:
+    if not transcript:
+        return "[No conversation yet]"
+    if window is None or len(transcript) <= window + 1:
+        return "\n".join(transcript)
 
-def evaluate_agent_interest(
-    state: NetworkingState, agent_key: str, model: ChatGoogleGenerativeAI
+    # Keep the opening line so the scene stays set, then the most recent turns
+    skipped = len(transcript) - window - 1
+    return "\n".join(
+        [transcript[0], f"[... {skipped} earlier lines ...]", *transcript[-window:]]
+    )
+
+
+async def evaluate_agent_interest(
+    state: NetworkingState,
+    agent_key: str,
+    model: ChatGoogleGenerativeAI,
+    conversation_text: str,
 ) -> AgentResponse:
-    persona = AGENT_PERSONAS[agent_key]
+    persona = PERSONAS[agent_key]
     is_active = agent_key in state["active_agents"]
-    conversation_text = format_conversation_for_agent(state["messages"], agent_key)
 
     system_prompt = persona["system_prompt"]
 
@@ -140,7 +216,7 @@ Respond ONLY with the JSON object, no other text."""
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt),
         ]
-        result = model.invoke(messages)
+        result = await model.ainvoke(messages)
         raw_content = result.content
         if isinstance(raw_content, list):
             content = "".join(
@@ -149,37 +225,35 @@ Respond ONLY with the JSON object, no other text."""
             ).strip()
         else:
             content = raw_content.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.startswith("```") and not in_json:
-                    in_json = True
-                    continue
-                elif line.startswith("```") and in_json:
-                    break
-                elif in_json:
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-        response_data = json.loads(content)
+        response_data, outcome = extract_json(content, expect_object=True)
+        PARSE_STATS.record(outcome)
+        if outcome == "failed":
+            EVENTS.emit(
+                "evaluation_error",
+                group_id=state["group_id"],
+                agent_key=agent_key,
+                error="Could not parse JSON",
+                raw_content=content[:200],
+            )
+            return AgentResponse(
+                interest_score=5.0 if is_active else 3.0,
+                response="That's interesting...",
+                wants_to_leave=False,
+                reasoning="Continuing conversation",
+            )
         return AgentResponse(
             interest_score=float(response_data.get("interest_score", 5)),
-            response=response_data.get("response", ""),
-            wants_to_leave=response_data.get("wants_to_leave", False),
-            reasoning=response_data.get("reasoning", ""),
-        )
-    except json.JSONDecodeError as e:
-        console.print(f"[dim]Error parsing {agent_key} JSON: {e}[/dim]")
-        console.print(f"[dim]Raw content: {content[:200]}...[/dim]")
-        return AgentResponse(
-            interest_score=5.0 if is_active else 3.0,
-            response="That's interesting...",
-            wants_to_leave=False,
-            reasoning="Continuing conversation",
+            response=response_data.get("response") or "",
+            wants_to_leave=bool(response_data.get("wants_to_leave", False)),
+            reasoning=response_data.get("reasoning") or "",
         )
     except Exception as e:
-        console.print(f"[dim]Error for {agent_key}: {e}[/dim]")
+        EVENTS.emit(
+            "evaluation_error",
+            group_id=state["group_id"],
+            agent_key=agent_key,
+            error=str(e),
+        )
         return AgentResponse(
             interest_score=5.0 if is_active else 3.0,
             response="That's interesting...",
@@ -188,82 +262,61 @@ Respond ONLY with the JSON object, no other text."""
         )
 
 
-def display_agent_status(state: NetworkingState):
-    table = Table(title="Agent Status", box=box.ROUNDED)
-    table.add_column("Agent", style="bold")
-    table.add_column("Status")
-    table.add_column("Interest", justify="center")
-    table.add_column("Thinking")
-
-    for agent_key, persona in AGENT_PERSONAS.items():
-        is_active = agent_key in state["active_agents"]
-        status = "[green]Active[/green]" if is_active else "[dim]Observing[/dim]"
-        interest = state["interest_scores"].get(agent_key, 0)
-        interest_bar = "█" * int(interest) + "░" * (10 - int(interest))
-        color = AGENT_COLORS[agent_key]
-
-        reasoning = ""
-        if agent_key in state.get("pending_responses", {}):
-            reasoning = state["pending_responses"][agent_key].get("reasoning", "")[:50]
-
-        table.add_row(
-            f"[{color}]{persona['name']}[/{color}]",
-            status,
-            f"[{color}]{interest_bar}[/{color}] {interest:.1f}",
-            f"[dim]{reasoning}[/dim]",
-        )
+def emit_agent_status(state: NetworkingState):
+    pending = state.get("pending_responses", {})
+    EVENTS.emit(
+        "agent_status",
+        group_id=state["group_id"],
+        agents=[
+            {
+                "key": agent_key,
+                "name": PERSONAS[agent_key]["name"],
+                "color": PERSONAS[agent_key]["color"],
+                "active": agent_key in state["active_agents"],
+                "interest": state["interest_scores"].get(agent_key, 0),
+                "reasoning": pending.get(agent_key, {}).get("reasoning", ""),
+            }
+            for agent_key in state["roster"]
+        ],
+    )
 
-    console.print(table)
 
+def emit_message(group_id: str, agent_key: str, message: str, kind: str = "speak"):
+    persona = PERSONAS.get(agent_key, {})
+    EVENTS.emit(
+        "message",
+        group_id=group_id,
+        agent_key=agent_key,
+        speaker=persona.get("name", agent_key),
+        color=persona.get("color", "white"),
+        kind=kind,
+        content=message,
+    )
 
-def display_message(speaker: str, message: str, event_type: str = "speak"):
-    agent_key = None
-    for key, persona in AGENT_PERSONAS.items():
-        if persona["name"] == speaker:
-            agent_key = key
-            break
 
-    color = AGENT_COLORS.get(agent_key, "white")
-
-    if event_type == "join":
-        console.print(
-            Panel(
-                f"[italic]{message}[/italic]",
-                title=f"[{color}]✨ {speaker} joins the conversation[/{color}]",
-                border_style=color,
-                box=box.DOUBLE,
-            )
-        )
-    elif event_type == "leave":
-        console.print(
-            Panel(
-                f"[italic]{message}[/italic]",
-                title=f"[{color}]👋 {speaker} leaves the conversation[/{color}]",
-                border_style=color,
-                box=box.DOUBLE,
-            )
-        )
-    else:
-        console.print(
-            Panel(
-                message,
-                title=f"[{color}]{speaker}[/{color}]",
-                border_style=color,
-            )
-        )
+async def evaluate_all_agents(state: NetworkingState) -> NetworkingState:
+    model = get_model()
+    semaphore = get_evaluation_limiter()
 
+    EVENTS.emit("agents_thinking", group_id=state["group_id"])
 
-def evaluate_all_agents(state: NetworkingState) -> NetworkingState:
-    model = create_model()
-    pending_responses = {}
-    interest_scores = {}
+    # Everyone in the group hears the same thing, so render the transcript once
+    conversation_text = format_conversation_for_agent(
+        state["transcript"], state["transcript_window"]
+    )
 
-    console.print("\n[dim]Agents are thinking...[/dim]")
+    async def evaluate(agent_key: str) -> AgentResponse:
+        async with semaphore:
+            return await evaluate_agent_interest(
+                state, agent_key, model, conversation_text
+            )
 
-    for agent_key in AGENT_PERSONAS.keys():
-        response = evaluate_agent_interest(state, agent_key, model)
-        pending_responses[agent_key] = response
-        interest_scores[agent_key] = response["interest_score"]
+    agent_keys = list(state["roster"])
+    responses = await asyncio.gather(*(evaluate(key) for key in agent_keys))
+    pending_responses = dict(zip(agent_keys, responses))
+    interest_scores = {
+        key: response["interest_score"] for key, response in pending_responses.items()
+    }
 
     return {
         "pending_responses": pending_responses,
@@ -271,24 +324,27 @@ def evaluate_all_agents(state: NetworkingState) -> NetworkingState:
     }
 
 
-def route_conversation(state: NetworkingState) -> NetworkingState:
+async def route_conversation(state: NetworkingState) -> NetworkingState:
     pending = state["pending_responses"]
     active = set(state["active_agents"])
     new_messages = []
+    departed = []
     turn_count = state["turn_count"] + 1
 
-    display_agent_status(state)
+    group_id = state["group_id"]
+    emit_agent_status(state)
 
     for agent_key, response in pending.items():
         if response["wants_to_leave"] and agent_key in active:
             active.discard(agent_key)
-            persona = AGENT_PERSONAS[agent_key]
+            departed.append(agent_key)
+            persona = PERSONAS[agent_key]
             farewell = (
                 response["response"]
                 if response["response"]
                 else "Nice meeting you all!"
             )
-            display_message(persona["name"], farewell, event_type="leave")
+            emit_message(group_id, agent_key, farewell, kind="leave")
             new_messages.append(
                 AIMessage(
                     content=farewell,
@@ -299,9 +355,9 @@ def route_conversation(state: NetworkingState) -> NetworkingState:
     for agent_key, response in pending.items():
         if agent_key not in active and response["interest_score"] >= 6:
             active.add(agent_key)
-            persona = AGENT_PERSONAS[agent_key]
+            persona = PERSONAS[agent_key]
             join_message = response["response"]
-            display_message(persona["name"], join_message, event_type="join")
+            emit_message(group_id, agent_key, join_message, kind="join")
             new_messages.append(
                 AIMessage(
                     content=join_message,
@@ -330,9 +386,9 @@ def route_conversation(state: NetworkingState) -> NetworkingState:
         ]
         speaker_key = random.choice(top_candidates)
         response = active_responses[speaker_key]
-        persona = AGENT_PERSONAS[speaker_key]
+        persona = PERSONAS[speaker_key]
 
-        display_message(persona["name"], response["response"])
+        emit_message(group_id, speaker_key, response["response"])
         new_messages.append(
             AIMessage(
                 content=response["response"],
@@ -340,21 +396,20 @@ def route_conversation(state: NetworkingState) -> NetworkingState:
             )
         )
 
-    conversation_ended = len(active) <= 1 or turn_count >= 15
+    conversation_ended = len(active) <= 1 or turn_count >= state["max_turns"]
 
     if conversation_ended:
-        if len(active) <= 1:
-            console.print(
-                "\n[bold yellow]The conversation has naturally concluded - only one person remains.[/bold yellow]"
-            )
-        else:
-            console.print(
-                "\n[bold yellow]The networking event is wrapping up...[/bold yellow]"
-            )
+        EVENTS.emit(
+            "group_ended",
+            group_id=group_id,
+            reason="one_left" if len(active) <= 1 else "turn_limit",
+        )
 
     return {
         "messages": new_messages,
+        "transcript": [transcript_line(msg) for msg in new_messages],
         "active_agents": active,
+        "departed": departed,
         "turn_count": turn_count,
         "conversation_ended": conversation_ended,
         "pending_responses": {},
@@ -367,7 +422,7 @@ def should_continue(state: NetworkingState) -> str:
     return "evaluate"
 
 
-def build_graph() -> StateGraph:
+def build_graph(checkpointer: BaseCheckpointSaver | None = None) -> StateGraph:
     graph = StateGraph(NetworkingState)
 
     graph.add_node("evaluate", evaluate_all_agents)
@@ -377,60 +432,562 @@ def build_graph() -> StateGraph:
     graph.add_edge("evaluate", "route")
     graph.add_conditional_edges("route", should_continue)
 
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
-def run_networking_event():
-    console.print(
-        Panel.fit(
-            "[bold]Welcome to the Tech Networking Event![/bold]\n\n"
-            "Three professionals are mingling:\n"
-            "• [blue]Sarah[/blue] - Tech Recruiter looking for developers\n"
-            "• [green]Alex[/green] - Software Developer exploring opportunities\n"
-            "• [magenta]Marcus[/magenta] - Founder seeking a technical co-founder\n\n"
-            "[dim]Sarah and Alex start chatting. Marcus is nearby, listening...[/dim]",
-            title="🎉 Networking Event",
-            border_style="yellow",
+@cache
+def build_round_graph() -> StateGraph:
+    graph = StateGraph(NetworkingState)
+
+    graph.add_node("evaluate", evaluate_all_agents)
+    graph.add_node("route", route_conversation)
+
+    graph.add_edge(START, "evaluate")
+    graph.add_edge("evaluate", "route")
+    graph.add_edge("route", END)
+
+    # Runs many times inside one event step, the parent graph checkpoints the result
+    return graph.compile(checkpointer=False)
+
+
+def new_group(
+    group_id: str,
+    members: list[str],
+    observers: list[str] | None = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    transcript_window: int | None = None,
+) -> NetworkingState:
+    observers = observers or []
+    names = " and ".join(PERSONAS[key]["name"] for key in members)
+    opening = HumanMessage(content=f"{names} strike up a conversation.")
+    return NetworkingState(
+        group_id=group_id,
+        messages=[opening],
+        transcript=[transcript_line(opening)],
+        roster=[*members, *observers],
+        active_agents=set(members),
+        departed=[],
+        interest_scores={
+            **{key: 6.0 for key in members},
+            **{key: 3.0 for key in observers},
+        },
+        pending_responses={},
+        turn_count=0,
+        max_turns=max_turns,
+        transcript_window=transcript_window,
+        conversation_ended=False,
+    )
+
+
+def partition_personas(
+    persona_keys: list[str],
+    group_size: int,
+    max_rounds: int,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    transcript_window: int | None = None,
+) -> EventState:
+    keys = list(persona_keys)
+    random.shuffle(keys)
+
+    groups = {}
+    wandering = []
+    for start in range(0, len(keys), group_size):
+        chunk = keys[start : start + group_size]
+        if len(chunk) < 2:
+            wandering.extend(chunk)
+            continue
+        group_id = f"group-{len(groups) + 1}"
+        groups[group_id] = new_group(
+            group_id, chunk[:2], chunk[2:], max_turns, transcript_window
         )
+
+    return EventState(
+        groups=groups,
+        wandering=wandering,
+        group_size=group_size,
+        next_group_id=len(groups) + 1,
+        round=0,
+        max_rounds=max_rounds,
+        max_turns=max_turns,
+        transcript_window=transcript_window,
     )
 
-    initial_state = NetworkingState(
-        messages=[
-            HumanMessage(
-                content="Sarah the recruiter notices Alex standing alone and approaches with a friendly smile."
+
+async def converse_in_groups(state: EventState) -> EventState:
+    round_graph = build_round_graph()
+    group_ids = list(state["groups"])
+    results = await asyncio.gather(
+        *(round_graph.ainvoke(state["groups"][group_id]) for group_id in group_ids)
+    )
+    return {"groups": dict(zip(group_ids, results)), "round": state["round"] + 1}
+
+
+def mingle(state: EventState) -> EventState:
+    group_size = state["group_size"]
+    groups: dict[str, NetworkingState] = {}
+    wandering = list(state["wandering"])
+
+    for group_id, group in state["groups"].items():
+        if group["conversation_ended"]:
+            wandering.extend(group["roster"])
+            continue
+
+        drifting = [
+            key
+            for key in group["roster"]
+            if key not in group["active_agents"]
+            and (
+                key in group["departed"]
+                or group["interest_scores"].get(key, 0) < DRIFT_INTEREST_THRESHOLD
             )
-        ],
+        ]
+        wandering.extend(drifting)
+        groups[group_id] = {
+            **group,
+            "roster": [key for key in group["roster"] if key not in drifting],
+        }
+
+    random.shuffle(wandering)
+    open_groups = [
+        group_id
+        for group_id, group in groups.items()
+        if len(group["roster"]) < group_size
+    ]
+    unplaced = []
+    for key in wandering:
+        if not open_groups or random.random() >= JOIN_GROUP_PROBABILITY:
+            unplaced.append(key)
+            continue
+
+        group_id = random.choice(open_groups)
+        group = groups[group_id]
+        groups[group_id] = {
+            **group,
+            "roster": [*group["roster"], key],
+            "interest_scores": {**group["interest_scores"], key: 3.0},
+        }
+        if len(groups[group_id]["roster"]) >= group_size:
+            open_groups.remove(group_id)
+
+    next_group_id = state["next_group_id"]
+    while len(unplaced) >= 2:
+        group_id = f"group-{next_group_id}"
+        groups[group_id] = new_group(
+            group_id,
+            [unplaced.pop(), unplaced.pop()],
+            max_turns=state["max_turns"],
+            transcript_window=state["transcript_window"],
+        )
+        next_group_id += 1
+
+    return {
+        "groups": groups,
+        "wandering": unplaced,
+        "next_group_id": next_group_id,
+    }
+
+
+def should_continue_event(state: EventState) -> str:
+    if state["round"] >= state["max_rounds"] or not state["groups"]:
+        return END
+    return "converse"
+
+
+def build_event_graph(checkpointer: BaseCheckpointSaver | None = None) -> StateGraph:
+    graph = StateGraph(EventState)
+
+    graph.add_node("converse", converse_in_groups)
+    graph.add_node("mingle", mingle)
+
+    graph.add_edge(START, "converse")
+    graph.add_edge("converse", "mingle")
+    graph.add_conditional_edges("mingle", should_continue_event)
+
+    return graph.compile(checkpointer=checkpointer)
+
+
+def parse_stats_summary() -> dict:
+    return {
+        "parsed": PARSE_STATS.parsed,
+        "repaired": PARSE_STATS.repaired,
+        "failed": PARSE_STATS.failed,
+        "failure_rate": PARSE_STATS.failure_rate,
+    }
+
+
+def classic_initial_state(
+    max_turns: int = DEFAULT_MAX_TURNS, transcript_window: int | None = None
+) -> NetworkingState:
+    opening = HumanMessage(
+        content="Sarah the recruiter notices Alex standing alone and approaches with a friendly smile."
+    )
+    return NetworkingState(
+        group_id="main",
+        messages=[opening],
+        transcript=[transcript_line(opening)],
+        roster=list(AGENT_PERSONAS),
         active_agents={"recruiter", "developer"},
+        departed=[],
         interest_scores={"recruiter": 7.0, "developer": 6.0, "founder": 4.0},
         pending_responses={},
         turn_count=0,
+        max_turns=max_turns,
+        transcript_window=transcript_window,
         conversation_ended=False,
     )
 
-    graph = build_graph()
 
-    console.print("\n[bold]--- Conversation Begins ---[/bold]\n")
+def emit_classic_intro(thread_id: str | None):
+    EVENTS.emit(
+        "event_started",
+        mode="classic",
+        thread_id=thread_id,
+        title="🎉 Networking Event",
+        heading="Conversation Begins",
+        intro=(
+            "[bold]Welcome to the Tech Networking Event![/bold]\n\n"
+            "Three professionals are mingling:\n"
+            "• [blue]Sarah[/blue] - Tech Recruiter looking for developers\n"
+            "• [green]Alex[/green] - Software Developer exploring opportunities\n"
+            "• [magenta]Marcus[/magenta] - Founder seeking a technical co-founder\n\n"
+            "[dim]Sarah and Alex start chatting. Marcus is nearby, listening...[/dim]"
+        ),
+    )
 
-    try:
-        final_state = graph.invoke(initial_state)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Event interrupted![/yellow]")
+
+def emit_large_event_intro(thread_id: str | None, persona_count: int, group_size: int):
+    EVENTS.emit(
+        "event_started",
+        mode="groups",
+        thread_id=thread_id,
+        title="🎉 Networking Event",
+        heading="Event Begins",
+        intro=(
+            f"[bold]Welcome to the Tech Networking Event![/bold]\n\n"
+            f"{persona_count} professionals are mingling in groups of up to {group_size}."
+        ),
+    )
+
+
+def summarize_classic(final_state: NetworkingState) -> dict:
+    return {
+        "mode": "classic",
+        "turns": final_state["turn_count"],
+        "messages": len(final_state["messages"]),
+        "participants": [PERSONAS[a]["name"] for a in final_state["active_agents"]],
+        "parsing": parse_stats_summary(),
+    }
+
+
+def summarize_large_event(final_state: EventState) -> dict:
+    return {
+        "mode": "groups",
+        "rounds": final_state["round"],
+        "groups_formed": final_state["next_group_id"] - 1,
+        "groups_active": len(final_state["groups"]),
+        "parsing": parse_stats_summary(),
+    }
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    path: str | None,
+) -> AsyncIterator[BaseCheckpointSaver | None]:
+    if not path:
+        yield None
         return
 
-    console.print("\n[bold]--- Event Summary ---[/bold]")
-    console.print(f"Total turns: {final_state['turn_count']}")
-    console.print(
-        f"Final participants: {', '.join(AGENT_PERSONAS[a]['name'] for a in final_state['active_agents'])}"
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError:
+        raise SystemExit(
+            "Checkpointing needs the sqlite saver: pip install langgraph-checkpoint-sqlite"
+        )
+
+    async with AsyncSqliteSaver.from_conn_string(path) as checkpointer:
+        yield checkpointer
+
+
+async def fork_thread(
+    graph: StateGraph, config: dict, checkpoint_id: str, fork_thread_id: str
+) -> dict:
+    source_config = {
+        "configurable": {**config["configurable"], "checkpoint_id": checkpoint_id}
+    }
+    snapshot = await graph.aget_state(source_config)
+    if not snapshot.values:
+        raise SystemExit(f"Checkpoint {checkpoint_id} not found")
+    if not snapshot.next:
+        raise SystemExit(f"Checkpoint {checkpoint_id} is the end of the event")
+    if snapshot.next[0] not in FORK_PREDECESSORS:
+        raise SystemExit(f"Checkpoint {checkpoint_id} is before the event started")
+
+    fork_config = {
+        **config,
+        "configurable": {"thread_id": fork_thread_id},
+    }
+    await graph.aupdate_state(
+        fork_config, snapshot.values, as_node=FORK_PREDECESSORS[snapshot.next[0]]
+    )
+    return fork_config
+
+
+async def list_checkpoints(graph: StateGraph, config: dict):
+    async for snapshot in graph.aget_state_history(config):
+        EVENTS.emit(
+            "checkpoint",
+            thread_id=config["configurable"]["thread_id"],
+            checkpoint_id=snapshot.config["configurable"]["checkpoint_id"],
+            step=snapshot.metadata.get("step"),
+            next=list(snapshot.next),
+            created_at=snapshot.created_at,
+        )
+
+
+async def run_event(args: argparse.Namespace) -> dict:
+    if args.personas:
+        personas = load_personas(args.personas)
+        PERSONAS.update(personas)
+
+    thread_id = args.thread_id
+
+    async with open_checkpointer(args.checkpoint_db) as checkpointer:
+        if args.personas:
+            graph = build_event_graph(checkpointer)
+            recursion_limit = args.rounds * 2 + 10
+        else:
+            graph = build_graph(checkpointer)
+            recursion_limit = args.max_turns * 2 + 10
+
+        config = {"recursion_limit": recursion_limit}
+        if checkpointer:
+            config["configurable"] = {"thread_id": thread_id}
+
+        if args.list_checkpoints:
+            await list_checkpoints(graph, config)
+            return {"thread_id": thread_id}
+
+        if args.fork_from:
+            config = await fork_thread(
+                graph, config, args.fork_from, args.fork_thread_id
+            )
+            thread_id = args.fork_thread_id
+        elif args.resume and not (await graph.aget_state(config)).values:
+            raise SystemExit(f"No checkpoints for thread {thread_id}")
+
+        if args.fork_from or args.resume:
+            EVENTS.emit("event_resumed", thread_id=thread_id)
+            graph_input = None
+        elif args.personas:
+            emit_large_event_intro(thread_id, len(personas), args.group_size)
+            graph_input = partition_personas(
+                list(personas),
+                args.group_size,
+                args.rounds,
+                args.max_turns,
+                args.transcript_window,
+            )
+        else:
+            emit_classic_intro(thread_id)
+            graph_input = classic_initial_state(args.max_turns, args.transcript_window)
+
+        final_state = await graph.ainvoke(graph_input, config)
+
+    if args.personas:
+        summary = summarize_large_event(final_state)
+    else:
+        summary = summarize_classic(final_state)
+    summary["thread_id"] = thread_id
+
+    EVENTS.emit("event_summary", **summary)
+    return summary
+
+
+def run_simulation(index: int, args: argparse.Namespace) -> dict:
+    global PARSE_STATS
+    PARSE_STATS = ParseStats()
+
+    events_path = Path(args.output_dir) / f"event-{index:04d}.jsonl"
+    writer = JsonlEventWriter(str(events_path))
+    EVENTS.subscribe(writer)
+    started = time.perf_counter()
+    try:
+        summary = asyncio.run(run_event(args))
+    except Exception as e:
+        summary = {"error": str(e)}
+    finally:
+        EVENTS.unsubscribe(writer)
+        writer.close()
+
+    return {
+        "index": index,
+        "events_path": str(events_path),
+        "duration_s": time.perf_counter() - started,
+        **summary,
+    }
+
+
+def run_batch(args: argparse.Namespace) -> dict:
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(
+            executor.map(run_simulation, range(args.batch), [args] * args.batch)
+        )
+
+    completed = [result for result in results if "error" not in result]
+    parsed = sum(result["parsing"]["parsed"] for result in completed)
+    repaired = sum(result["parsing"]["repaired"] for result in completed)
+    failed = sum(result["parsing"]["failed"] for result in completed)
+    total_parses = parsed + repaired + failed
+
+    report = {
+        "events": len(results),
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "wall_time_s": time.perf_counter() - started,
+        "mean_event_duration_s": (
+            sum(result["duration_s"] for result in completed) / len(completed)
+            if completed
+            else 0.0
+        ),
+        "parsing": {
+            "parsed": parsed,
+            "repaired": repaired,
+            "failed": failed,
+            "failure_rate": failed / total_parses if total_parses else 0.0,
+        },
+        "results": results,
+    }
+
+    report_path = Path(args.output_dir) / "report.json"
+    with report_path.open("w") as f:
+        json.dump(report, f, indent=2)
+
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Multi-agent networking event")
+    parser.add_argument(
+        "--personas",
+        nargs="+",
+        help="Persona files or directories (.json/.jsonl) for a large event",
+    )
+    parser.add_argument("--group-size", type=int, default=DEFAULT_GROUP_SIZE)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_EVENT_ROUNDS)
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=DEFAULT_MAX_TURNS,
+        help="Turns a single conversation can run before it wraps up",
+    )
+    parser.add_argument(
+        "--transcript-window",
+        type=int,
+        help="Only show agents the opening line and this many recent lines",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Skip terminal rendering and write JSONL events instead",
+    )
+    parser.add_argument(
+        "--events-out",
+        default="events.jsonl",
+        help="JSONL event file for headless runs",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=0,
+        help="Run this many headless events in parallel processes",
     )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output-dir", default="batch-output")
+    parser.add_argument(
+        "--checkpoint-db",
+        help="SQLite file to checkpoint the event into after every step",
+    )
+    parser.add_argument(
+        "--thread-id",
+        help="Checkpoint thread to start, resume or fork (new one if omitted)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue --thread-id from its latest checkpoint; pass the same --personas",
+    )
+    parser.add_argument(
+        "--fork-from",
+        metavar="CHECKPOINT_ID",
+        help="Copy a checkpoint of --thread-id into a new thread and continue from there",
+    )
+    parser.add_argument(
+        "--fork-thread-id",
+        help="Thread to fork into (new one if omitted)",
+    )
+    parser.add_argument(
+        "--list-checkpoints",
+        action="store_true",
+        help="List the checkpoints of --thread-id",
+    )
+    args = parser.parse_args()
+
+    if (args.resume or args.fork_from or args.list_checkpoints) and not (
+        args.checkpoint_db and args.thread_id
+    ):
+        parser.error(
+            "--resume, --fork-from and --list-checkpoints need --checkpoint-db and --thread-id"
+        )
+    if args.batch and args.checkpoint_db:
+        parser.error("--batch runs cannot be checkpointed")
+
+    if args.checkpoint_db:
+        args.thread_id = args.thread_id or str(uuid.uuid4())
+        if args.fork_from:
+            args.fork_thread_id = args.fork_thread_id or str(uuid.uuid4())
+
+    return args
 
 
 def main():
+    args = parse_args()
+
     if not os.environ.get("GOOGLE_API_KEY"):
         console.print("[red]Error: GOOGLE_API_KEY environment variable not set[/red]")
         console.print("Please set it with: export GOOGLE_API_KEY='your-api-key'")
         return
 
-    run_networking_event()
+    if args.batch:
+        report = run_batch(args)
+        console.print(
+            f"Ran {report['completed']}/{report['events']} events in "
+            f"{report['wall_time_s']:.1f}s, report written to "
+            f"{Path(args.output_dir) / 'report.json'}"
+        )
+        return
+
+    if args.headless:
+        subscriber = JsonlEventWriter(args.events_out)
+    else:
+        subscriber = RichRenderer(console)
+    EVENTS.subscribe(subscriber)
+
+    try:
+        asyncio.run(run_event(args))
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Event interrupted![/yellow]")
+        if args.checkpoint_db:
+            thread_id = args.fork_thread_id if args.fork_from else args.thread_id
+            console.print(
+                f"[dim]Resume with --checkpoint-db {args.checkpoint_db} "
+                f"--thread-id {thread_id} --resume[/dim]"
+            )
+    finally:
+        if isinstance(subscriber, JsonlEventWriter):
+            subscriber.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+import json
+import re
+from pathlib import Path
+
+PERSONA_COLORS = ["blue", "green", "magenta", "cyan", "yellow", "red"]
+
+
+def _persona_key(persona: dict, fallback: str) -> str:
+    if persona.get("key"):
+        return str(persona["key"])
+    name = persona.get("name") or fallback
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def _read_persona_file(path: Path) -> list[dict]:
+    if path.suffix == ".jsonl":
+        with path.open() as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    with path.open() as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        return data
+    if "system_prompt" in data:
+        return [{"key": path.stem, **data}]
+    return [{"key": key, **persona} for key, persona in data.items()]
+
+
+def load_personas(paths: list[str]) -> dict[str, dict]:
+    files: list[Path] = []
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.json")))
+            files.extend(sorted(path.glob("*.jsonl")))
+        else:
+            files.append(path)
+
+    personas: dict[str, dict] = {}
+    for path in files:
+        for persona in _read_persona_file(path):
+            if "name" not in persona or "system_prompt" not in persona:
+                raise ValueError(f"Persona in {path} needs 'name' and 'system_prompt'")
+
+            key = _persona_key(persona, path.stem)
+            if key in personas:
+                raise ValueError(f"Duplicate persona key '{key}' in {path}")
+
+            personas[key] = {
+                "name": persona["name"],
+                "color": persona.get(
+                    "color", PERSONA_COLORS[len(personas) % len(PERSONA_COLORS)]
+                ),
+                "system_prompt": persona["system_prompt"],
+            }
+
+    return personas
@@ -0,0 +1,170 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+ParseOutcome = Literal["parsed", "repaired", "failed"]
+
+_DECODER = json.JSONDecoder()
+_CLOSERS = {"{": "}", "[": "]"}
+_LITERALS = ("true", "false", "null")
+_NUMBER_PREFIX = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_NUMBER_REST = re.compile(r"\.|[eE][-+]?")
+_TRAILING_TOKEN = re.compile(r'[^\s:,\[\]{}"]+$')
+_DANGLING_KEY = re.compile(r'([{,])\s*"(?:[^"\\]|\\.)*"\s*:?$')
+# Each failed decode of the repaired text costs its offset, and past a few
+# failures the tail is not JSON anyway
+_MAX_FALLBACKS = 8
+
+
+@dataclass
+class ParseStats:
+    parsed: int = 0
+    repaired: int = 0
+    failed: int = 0
+
+    def record(self, outcome: ParseOutcome):
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+    @property
+    def total(self) -> int:
+        return self.parsed + self.repaired + self.failed
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.total if self.total else 0.0
+
+
+def _decode(
+    text: str, start: int, expected: type | tuple[type, ...]
+) -> tuple[Any | None, int]:
+    # The value, or None and the position where decoding stopped
+    try:
+        value, end = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError as e:
+        return None, e.pos
+    except RecursionError:
+        return None, len(text)
+    return (value if isinstance(value, expected) else None), end
+
+
+def _complete_token(body: str) -> str:
+    # A literal cut off mid-word has only one completion, a number keeps the
+    # digits that arrived and a lone sign is dropped
+    match = _TRAILING_TOKEN.search(body)
+    if not match:
+        return body
+    token = match.group()
+    for literal in _LITERALS:
+        if literal.startswith(token):
+            return body[: match.start()] + literal
+    if token == "-":
+        return body[: match.start()]
+    number = _NUMBER_PREFIX.match(token)
+    if number and _NUMBER_REST.fullmatch(token[number.end() :]):
+        return body[: match.start()] + number.group()
+    return body
+
+
+def _repair_tail(text: str, in_string: bool, escape_at: int, innermost: str) -> str:
+    body = text
+    if in_string:
+        if escape_at >= 0 and (
+            escape_at == len(text) - 1
+            or (text[escape_at + 1] == "u" and len(text) - escape_at < 6)
+        ):
+            body = text[:escape_at]
+        body += '"'
+    else:
+        body = _complete_token(body.rstrip())
+
+    body = body.rstrip()
+    if innermost == "{":
+        # Drop a key whose value never arrived
+        body = _DANGLING_KEY.sub(
+            lambda match: "{" if match.group(1) == "{" else "", body
+        )
+    if body.endswith(","):
+        body = body[:-1]
+    return body
+
+
+def extract_json(
+    text: str, expect_object: bool = False
+) -> tuple[Any | None, ParseOutcome]:
+    # One scan from the first opener. Prose may hold brackets of its own, so a
+    # balanced value that does not decode is skipped. An unclosed value at the
+    # end was truncated and is repaired, and values nested in it are only tried
+    # when the repair fails before reaching them.
+    openers = "{" if expect_object else "{["
+    expected = dict if expect_object else (dict, list)
+
+    stack: list[int] = []
+    children: list[list[int]] = []
+    in_string = False
+    escape_at = -1
+
+    for index, char in enumerate(text):
+        if not stack:
+            if char in openers:
+                stack.append(index)
+                children.append([])
+        elif in_string:
+            if escape_at == index - 1:
+                continue
+            if char == "\\":
+                escape_at = index
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            escape_at = -1
+        elif char in _CLOSERS:
+            stack.append(index)
+            children.append([])
+        elif char in "}]":
+            start = stack.pop()
+            children.pop()
+            if _CLOSERS[text[start]] != char:
+                # Mismatched brackets, whatever this was it is not JSON
+                stack.clear()
+                children.clear()
+            elif stack:
+                children[-1].append(start)
+            else:
+                # Decoded on its own, errors in a long text cost their offset
+                value, _ = _decode(text[start : index + 1], 0, expected)
+                if value is not None:
+                    return value, "parsed"
+
+    if not stack:
+        return None, "failed"
+
+    repaired = _repair_tail(text, in_string, escape_at, text[stack[-1]])
+    repaired += "".join(_CLOSERS[text[opener]] for opener in reversed(stack))
+    candidates = [
+        candidate
+        for depth, start in enumerate(stack)
+        for candidate in [start, *children[depth]]
+        if text[candidate] in openers
+    ]
+    failed_at = 0
+    attempts = 0
+    for candidate in candidates:
+        if candidate < failed_at:
+            continue
+        if attempts == _MAX_FALLBACKS:
+            break
+        attempts += 1
+        value, failed_at = _decode(repaired, candidate, expected)
+        if value is not None:
+            return value, "repaired" if candidate in stack else "parsed"
+
+    return None, "failed"
+
+
+def extract_json_text(text: str, expect_object: bool = True) -> str:
+    value, outcome = extract_json(text, expect_object)
+    if outcome == "failed":
+        return text.strip()
+    return json.dumps(value)
@@ -0,0 +1,75 @@
+import json
+
+from structured_output import ParseStats, extract_json, extract_json_text
+
+
+def test_parses_fenced_json():
+    assert extract_json('```json\n{"a": [1, 2]}\n```') == ({"a": [1, 2]}, "parsed")
+
+
+def test_skips_braces_in_leading_prose():
+    text = 'text with {curly} then {"a":1}'
+    assert extract_json(text) == ({"a": 1}, "parsed")
+    assert extract_json(text, expect_object=True) == ({"a": 1}, "parsed")
+
+
+def test_skips_leading_array_when_object_expected():
+    text = 'The list [1] then {"a": 2}'
+    assert extract_json(text) == ([1], "parsed")
+    assert extract_json(text, expect_object=True) == ({"a": 2}, "parsed")
+
+
+def test_repairs_truncated_object():
+    text = 'Sure: {"a": {"b": 1}, "c": [1, "tw'
+    assert extract_json(text) == ({"a": {"b": 1}, "c": [1, "tw"]}, "repaired")
+
+
+def test_repairs_outer_object_cut_off_in_a_literal():
+    # The nested object is complete, but it is not the answer
+    text = '{"a": {"b": 1}, "c": tru'
+    assert extract_json(text) == ({"a": {"b": 1}, "c": True}, "repaired")
+    assert extract_json('{"a": nul') == ({"a": None}, "repaired")
+
+
+def test_repairs_partial_numbers():
+    assert extract_json('{"a": 1.') == ({"a": 1}, "repaired")
+    assert extract_json('{"a": [1, 2.5e') == ({"a": [1, 2.5]}, "repaired")
+    assert extract_json('{"k": "v", "n": -') == ({"k": "v"}, "repaired")
+
+
+def test_repairs_partial_escapes():
+    assert extract_json('{"a": "x\\u00') == ({"a": "x"}, "repaired")
+    assert extract_json('{"a": "x\\') == ({"a": "x"}, "repaired")
+
+
+def test_skips_values_nested_in_broken_json():
+    assert extract_json('{"a": {"b": 1} oops}') == (None, "failed")
+    assert extract_json('{"a": {"b": 1} oops') == (None, "failed")
+
+
+def test_falls_back_past_an_unclosed_brace_in_prose():
+    text = 'Sure :-{ here it is {"a": 1, "b": fals'
+    assert extract_json(text) == ({"a": 1, "b": False}, "repaired")
+    assert extract_json('Sure :-{ here it is {"a": 1}') == ({"a": 1}, "parsed")
+
+
+def test_drops_dangling_key():
+    assert extract_json('{"a": 1, "b') == ({"a": 1}, "repaired")
+    assert extract_json('{"a": 1, "b":') == ({"a": 1}, "repaired")
+
+
+def test_fails_without_json():
+    assert extract_json("no json here") == (None, "failed")
+    assert extract_json("[1, 2]", expect_object=True) == (None, "failed")
+
+
+def test_extract_json_text_falls_back_to_input():
+    assert json.loads(extract_json_text('noise {"a": 1} noise')) == {"a": 1}
+    assert extract_json_text("  not json ") == "not json"
+
+
+def test_parse_stats_failure_rate():
+    stats = ParseStats()
+    for outcome in ("parsed", "repaired", "failed", "failed"):
+        stats.record(outcome)
+    assert (stats.total, stats.failure_rate) == (4, 0.5)